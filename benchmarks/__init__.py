@@ -0,0 +1,4 @@
+"""Benchmarks for the option pricing models.
+
+Run with `python -m benchmarks --help` from the root of the repository.
+"""
@@ -0,0 +1,142 @@
+"""Run the benchmarks.
+
+Examples:
+
+    # Time everything and store the results as a baseline.
+    python -m benchmarks --output baseline.json
+
+    # Time everything again, and compare with the baseline.
+    python -m benchmarks --output results.json --baseline baseline.json
+
+    # Time the trees quickly.
+    python -m benchmarks --quick --filter trees.
+
+The exit code is 1 if any case is slower than the baseline by more than the
+threshold.
+"""
+
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import List, Optional
+
+from .cases import make_cases
+from .runner import (
+    Result,
+    compare,
+    format_seconds,
+    read_results,
+    run_case,
+    write_results,
+)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(
+        prog='python -m benchmarks',
+        description='Time the option pricing models.'
+    )
+    parser.add_argument(
+        '--output', '-o',
+        type=Path,
+        help='the file for the results: JSON, or CSV if it ends with .csv'
+    )
+    parser.add_argument(
+        '--baseline', '-b',
+        type=Path,
+        help='results of an earlier run to compare with'
+    )
+    parser.add_argument(
+        '--threshold', '-t',
+        type=float,
+        default=0.1,
+        help='the relative slowdown reported as a regression (default 0.1)'
+    )
+    parser.add_argument(
+        '--filter', '-k',
+        action='append',
+        default=[],
+        help='only run the cases with names containing this text'
+    )
+    parser.add_argument(
+        '--tree-sizes', '-n',
+        type=int,
+        nargs='+',
+        default=[50, 200],
+        help='the numbers of steps of the trees (default 50 200)'
+    )
+    parser.add_argument(
+        '--repeat', '-r',
+        type=int,
+        default=5,
+        help='the number of timings of each case (default 5)'
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=0.2,
+        help='the minimum duration of each timing in seconds (default 0.2)'
+    )
+    parser.add_argument(
+        '--quick', '-q',
+        action='store_true',
+        help='a single short timing of small trees, for a smoke test'
+    )
+    parser.add_argument(
+        '--list', '-l',
+        action='store_true',
+        help='list the cases without running them'
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        args.tree_sizes = [min(args.tree_sizes)]
+        args.repeat = 1
+        args.min_time = 0.01
+
+    cases = [
+        case
+        for case in make_cases(args.tree_sizes)
+        if not args.filter or any(text in case.name for text in args.filter)
+    ]
+
+    if args.list:
+        for case in cases:
+            print(case.name)
+        return 0
+
+    baseline = read_results(args.baseline) if args.baseline else {}
+
+    width = max((len(case.name) for case in cases), default=0)
+    results: List[Result] = []
+    for case in cases:
+        result = run_case(case, args.repeat, args.min_time)
+        results.append(result)
+        line = f'{case.name:<{width}}  {format_seconds(result.seconds):>8}'
+        if case.name in baseline:
+            ratio = result.seconds / baseline[case.name].seconds
+            line += f'  {ratio:6.2f}x'
+        print(line, flush=True)
+
+    if args.output:
+        write_results(args.output, results)
+
+    regressions = [
+        comparison
+        for comparison in compare(results, baseline)
+        if comparison.ratio > 1 + args.threshold
+    ]
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) beyond {args.threshold:.0%}:')
+        for comparison in regressions:
+            print(
+                f'  {comparison.name}: {format_seconds(comparison.baseline)}'
+                f' -> {format_seconds(comparison.seconds)}'
+                f' ({comparison.ratio:.2f}x)'
+            )
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
@@ -0,0 +1,353 @@
+"""The benchmark cases.
+
+Each case times one entry point of one model over a grid of contracts. The
+models are described by how the common contract parameters map onto their
+arguments, so every model is timed over the same contracts.
+"""
+
+import os
+from itertools import product
+from math import exp
+from types import ModuleType
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from jetblack_options.american import (
+    barone_adesi_whaley,
+    bjerksund_stensland_1993,
+    bjerksund_stensland_2002,
+)
+from jetblack_options.batch import BatchEngine, Task
+from jetblack_options.european import (
+    black_76,
+    black_scholes_73,
+    black_scholes_merton,
+    garman_kohlhagen,
+    generalised_black_scholes,
+)
+from jetblack_options.trees import (
+    binomial_black_scholes,
+    cox_ross_rubinstein,
+    european_binomial,
+    jarrow_rudd,
+    leisen_reimer,
+    trinomial,
+)
+from jetblack_options.variance import black_scholes as variance_black_scholes
+
+# is_call, S, K, T, r, b, v
+Contract = Tuple[bool, float, float, float, float, float, float]
+
+# The first order greeks calculated by the numeric greeks benchmarks.
+NUMERIC_GREEKS = ('delta', 'gamma', 'theta', 'vega', 'rho')
+
+
+class Case(NamedTuple):
+    """A benchmark case."""
+
+    name: str
+    """The name of the case: the package, module and entry point."""
+    setup: Callable[[], Tuple[Callable[[], None], int]]
+    """Prepare the case, returning a function making one call of the entry
+    point for each contract, and the number of calls it makes."""
+    teardown: Optional[Callable[[], None]] = None
+    """Release the resources of the case after it is timed, if any."""
+
+
+class Model(NamedTuple):
+    """How the contract parameters are passed to a model."""
+
+    module: ModuleType
+    """The model module."""
+    args: Callable[[Contract], tuple]
+    """The arguments which precede the volatility (or the price for ivol)."""
+    flags: int
+    """The number of leading boolean arguments, which are also the arguments
+    of `make_numeric_greeks`."""
+    trailing: tuple = ()
+    """The arguments which follow the volatility."""
+    greeks: Optional[str] = None
+    """The name of the function returning the price and greeks, if any."""
+    vol: Callable[[float], float] = lambda v: v
+    """The transform from the volatility to the model argument."""
+
+
+def contracts(
+        is_call: Sequence[bool],
+        S: Sequence[float],
+        T: Sequence[float],
+        v: Sequence[float],
+        K: float = 100,
+        r: float = 0.05,
+        b: float = 0.02
+) -> List[Contract]:
+    """The grid of contracts.
+
+    Args:
+        is_call (Sequence[bool]): The option types.
+        S (Sequence[float]): The asset prices.
+        T (Sequence[float]): The times to expiry.
+        v (Sequence[float]): The volatilities.
+        K (float, optional): The strike. Defaults to 100.
+        r (float, optional): The risk free rate. Defaults to 0.05.
+        b (float, optional): The cost of carry. Defaults to 0.02.
+
+    Returns:
+        List[Contract]: The contracts.
+    """
+    return [
+        (is_call_, S_, K, T_, r, b, v_)
+        for is_call_, S_, T_, v_ in product(is_call, S, T, v)
+    ]
+
+
+ANALYTIC_CONTRACTS = contracts(
+    (True, False), (90, 100, 110), (0.25, 1.0), (0.15, 0.3)
+)
+TREE_CONTRACTS = contracts((True, False), (90, 100, 110), (1.0,), (0.3,))
+
+
+def _analytic_models() -> List[Model]:
+    return [
+        Model(
+            black_76,
+            lambda c: (c[0], c[1] * exp(c[5] * c[3]), c[2], c[3], c[4]),
+            1,
+            greeks='all_greeks'
+        ),
+        Model(
+            black_scholes_73,
+            lambda c: c[:5],
+            1,
+            greeks='all_greeks'
+        ),
+        Model(
+            black_scholes_merton,
+            lambda c: (*c[:5], c[4] - c[5]),
+            1,
+            greeks='all_greeks'
+        ),
+        Model(
+            garman_kohlhagen,
+            lambda c: (*c[:5], c[4] - c[5]),
+            1,
+            greeks='all_greeks'
+        ),
+        Model(
+            generalised_black_scholes,
+            lambda c: c[:6],
+            1,
+            greeks='all_greeks'
+        ),
+        Model(barone_adesi_whaley, lambda c: c[:6], 1),
+        Model(bjerksund_stensland_1993, lambda c: c[:6], 1),
+        Model(bjerksund_stensland_2002, lambda c: c[:6], 1),
+        Model(
+            variance_black_scholes,
+            lambda c: c[:6],
+            1,
+            vol=lambda v: v ** 2
+        ),
+    ]
+
+
+def _tree_models(n: int) -> List[Model]:
+    return [
+        Model(
+            cox_ross_rubinstein,
+            lambda c: (False, *c[:6]),
+            2,
+            (n,),
+            'greeks'
+        ),
+        Model(
+            jarrow_rudd,
+            lambda c: (False, *c[:6]),
+            2,
+            (n,),
+            'greeks'
+        ),
+        Model(
+            leisen_reimer,
+            lambda c: (False, *c[:6]),
+            2,
+            (n,),
+            'greeks'
+        ),
+        Model(
+            trinomial,
+            lambda c: (False, *c[:6]),
+            2,
+            (n,),
+            'greeks'
+        ),
+        Model(
+            binomial_black_scholes,
+            lambda c: (False, *c[:6]),
+            2,
+            (n,),
+            'greeks'
+        ),
+        Model(european_binomial, lambda c: c[:6], 1, (n,)),
+    ]
+
+
+def _model_cases(
+        model: Model,
+        grid: Sequence[Contract],
+        suffix: str
+) -> List[Case]:
+    module = model.module
+    name = module.__name__[len('jetblack_options.'):]
+    calls = [
+        (model.args(contract), model.vol(contract[6]))
+        for contract in grid
+    ]
+
+    cases: List[Case] = []
+
+    price = module.price
+    cases.append(Case(
+        f'{name}.price{suffix}',
+        lambda: _call_all(price, calls, model.trailing)
+    ))
+
+    if model.greeks is not None:
+        greeks = getattr(module, model.greeks)
+        cases.append(Case(
+            f'{name}.{model.greeks}{suffix}',
+            lambda: _call_all(greeks, calls, model.trailing)
+        ))
+
+    ivol = getattr(module, 'ivol', None)
+    if ivol is not None:
+        cases.append(Case(
+            f'{name}.ivol{suffix}',
+            lambda: _call_all(
+                ivol,
+                _ivol_calls(model, grid, calls, ivol),
+                model.trailing
+            )
+        ))
+
+    make_numeric_greeks = getattr(module, 'make_numeric_greeks', None)
+    if make_numeric_greeks is not None:
+        cases.append(Case(
+            f'{name}.make_numeric_greeks{suffix}',
+            lambda: (
+                lambda: _numeric_greeks(make_numeric_greeks, model, calls),
+                len(calls)
+            )
+        ))
+
+    return cases
+
+
+def _ivol_calls(
+        model: Model,
+        grid: Sequence[Contract],
+        calls: Sequence[Tuple[tuple, float]],
+        ivol: Callable[..., float]
+) -> List[Tuple[tuple, float]]:
+    # Invert the prices of the model itself. Prices without time value cannot
+    # be inverted, and some approximations fail for some contracts, so these
+    # are left out.
+    ivol_calls: List[Tuple[tuple, float]] = []
+    for contract, (args, vol) in zip(grid, calls):
+        value = model.module.price(*args, vol, *model.trailing)
+        if value <= _intrinsic(contract) + 1e-2:
+            continue
+        try:
+            ivol(*args, value, *model.trailing)
+        except (ArithmeticError, ValueError):
+            continue
+        ivol_calls.append((args, value))
+    return ivol_calls
+
+
+def _intrinsic(contract: Contract) -> float:
+    is_call, S, K, *_ = contract
+    return max(S - K if is_call else K - S, 0)
+
+
+def _call_all(
+        func: Callable[..., object],
+        calls: Sequence[Tuple[tuple, float]],
+        trailing: tuple
+) -> Tuple[Callable[[], None], int]:
+    def run() -> None:
+        for args, value in calls:
+            func(*args, value, *trailing)
+    return run, len(calls)
+
+
+def _numeric_greeks(
+        make_numeric_greeks: Callable[..., object],
+        model: Model,
+        calls: Sequence[Tuple[tuple, float]]
+) -> None:
+    # Make the numeric greeks for each contract, as a caller would, and
+    # calculate the first order greeks.
+    for args, vol in calls:
+        ng = make_numeric_greeks(*args[:model.flags], *model.trailing)
+        for greek in NUMERIC_GREEKS:
+            getattr(ng, greek)(*args[model.flags:], vol)
+
+
+def _batch_book(tree_sizes: Sequence[int]) -> List[Task]:
+    # A book mixing trees of each size with approximations, as the engine
+    # balances contracts of different costs.
+    book: List[Task] = []
+    for contract in TREE_CONTRACTS:
+        for n in tree_sizes:
+            book.append((cox_ross_rubinstein.price, (False, *contract, n)))
+            book.append((leisen_reimer.price, (False, *contract, n)))
+    for contract in ANALYTIC_CONTRACTS:
+        book.append((barone_adesi_whaley.price, contract))
+        book.append((bjerksund_stensland_2002.price, contract))
+    return book
+
+
+def _batch_case(book: Sequence[Task], workers: int) -> Case:
+    # The pool is started by the first evaluation and kept, so the best
+    # timing is that of warm workers. It is shut down after the timing, so
+    # the workers do not compete with the cases which follow.
+    engine = BatchEngine(workers)
+
+    def run() -> None:
+        engine.evaluate(book)
+    return Case(
+        f'batch.BatchEngine.evaluate[workers={workers}]',
+        lambda: (run, len(book)),
+        engine.shutdown
+    )
+
+
+def _batch_cases(tree_sizes: Sequence[int]) -> List[Case]:
+    # Time the engine with the number of workers doubling up to the number of
+    # processors, to show how it scales.
+    cpus = os.cpu_count() or 1
+    workers = sorted({
+        *(2 ** i for i in range(cpus.bit_length()) if 2 ** i <= cpus),
+        cpus
+    })
+    book = _batch_book(tree_sizes)
+    return [_batch_case(book, count) for count in workers]
+
+
+def make_cases(tree_sizes: Sequence[int]) -> List[Case]:
+    """Make the benchmark cases.
+
+    Args:
+        tree_sizes (Sequence[int]): The numbers of steps of the trees.
+
+    Returns:
+        List[Case]: The cases.
+    """
+    cases: List[Case] = []
+    for model in _analytic_models():
+        cases.extend(_model_cases(model, ANALYTIC_CONTRACTS, ''))
+    for n in tree_sizes:
+        for model in _tree_models(n):
+            cases.extend(_model_cases(model, TREE_CONTRACTS, f'[n={n}]'))
+    cases.extend(_batch_cases(tree_sizes))
+    return cases
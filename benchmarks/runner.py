@@ -0,0 +1,192 @@
+"""Timing, storing and comparing benchmark results."""
+
+import csv
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import mean
+from timeit import Timer
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from .cases import Case
+
+
+class Result(NamedTuple):
+    """The timing of a benchmark case."""
+
+    name: str
+    """The name of the case."""
+    seconds: float
+    """The best time per call in seconds."""
+    mean: float
+    """The mean time per call in seconds."""
+    calls: int
+    """The number of calls timed in each repeat."""
+
+
+class Comparison(NamedTuple):
+    """The comparison of a result with the baseline."""
+
+    name: str
+    """The name of the case."""
+    baseline: float
+    """The baseline time per call in seconds."""
+    seconds: float
+    """The time per call in seconds."""
+
+    @property
+    def ratio(self) -> float:
+        """The time relative to the baseline."""
+        return self.seconds / self.baseline
+
+
+def run_case(case: Case, repeat: int, min_time: float) -> Result:
+    """Time a benchmark case.
+
+    The number of passes over the contracts in each repeat is chosen so a
+    repeat takes at least `min_time` seconds. The best repeat is the least
+    disturbed by other activity on the machine, so it is used for comparisons.
+    The teardown of the case, if any, is run after the timing.
+
+    Args:
+        case (Case): The case.
+        repeat (int): The number of times to repeat the timing.
+        min_time (float): The minimum time for each repeat in seconds.
+
+    Returns:
+        Result: The times per call.
+    """
+    run, count = case.setup()
+    try:
+        timer = Timer(run)
+        number = 1
+        while True:
+            elapsed = timer.timeit(number)
+            if elapsed >= min_time:
+                break
+            number = max(
+                number * 2,
+                int(number * min_time / max(elapsed, 1e-9))
+            )
+        times = [elapsed] + timer.repeat(repeat - 1, number)
+    finally:
+        if case.teardown is not None:
+            case.teardown()
+    calls = number * count
+    return Result(
+        case.name,
+        min(times) / calls,
+        mean(times) / calls,
+        calls
+    )
+
+
+def metadata() -> Dict[str, str]:
+    """Describe the environment of the benchmark.
+
+    Returns:
+        Dict[str, str]: The python version, platform and time.
+    """
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+    }
+
+
+def write_results(path: Path, results: Sequence[Result]) -> None:
+    """Write the results as JSON, or CSV if the path ends with `.csv`.
+
+    Args:
+        path (Path): The path of the file.
+        results (Sequence[Result]): The results.
+    """
+    if path.suffix == '.csv':
+        with path.open('w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(Result._fields)
+            writer.writerows(results)
+    else:
+        document = {
+            'metadata': metadata(),
+            'results': {
+                result.name: result._asdict()
+                for result in results
+            }
+        }
+        with path.open('w') as file:
+            json.dump(document, file, indent=2)
+            file.write('\n')
+
+
+def read_results(path: Path) -> Dict[str, Result]:
+    """Read results written by `write_results`.
+
+    Args:
+        path (Path): The path of the file.
+
+    Returns:
+        Dict[str, Result]: The results keyed by the case name.
+    """
+    if path.suffix == '.csv':
+        with path.open(newline='') as file:
+            rows = [
+                Result(
+                    row['name'],
+                    float(row['seconds']),
+                    float(row['mean']),
+                    int(row['calls'])
+                )
+                for row in csv.DictReader(file)
+            ]
+        return {row.name: row for row in rows}
+
+    with path.open() as file:
+        document = json.load(file)
+    return {
+        name: Result(**result)
+        for name, result in document['results'].items()
+    }
+
+
+def compare(
+        results: Sequence[Result],
+        baseline: Dict[str, Result]
+) -> List[Comparison]:
+    """Compare results with a baseline.
+
+    Cases which are not in the baseline are ignored.
+
+    Args:
+        results (Sequence[Result]): The results.
+        baseline (Dict[str, Result]): The baseline results.
+
+    Returns:
+        List[Comparison]: The comparisons.
+    """
+    return [
+        Comparison(result.name, baseline[result.name].seconds, result.seconds)
+        for result in results
+        if result.name in baseline
+    ]
+
+
+def format_seconds(seconds: Optional[float]) -> str:
+    """Format a time with a suitable unit.
+
+    Args:
+        seconds (Optional[float]): The time in seconds.
+
+    Returns:
+        str: The formatted time.
+    """
+    if seconds is None:
+        return ''
+    for unit, scale in (('s', 1), ('ms', 1e3), ('us', 1e6)):
+        if seconds * scale >= 1:
+            return f'{seconds * scale:.3g}{unit}'
+    return f'{seconds * 1e9:.3g}ns'
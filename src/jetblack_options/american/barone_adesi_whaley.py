@@ -1,99 +1,120 @@
 """Option pricing functions implementing the Barone, Adesi and Whaley (1987)
 American approximation.
+
+The critical prices depend on the strike, expiry, rates and volatility, but
+not on the asset price. They are kept in a bounded cache, so re-pricing with
+a new asset price, or bumping the asset price for numeric greeks, does not
+repeat the Newton Raphson solve.
 """
 
-from math import exp, log, sqrt
-from statistics import NormalDist
+from functools import lru_cache
+from math import inf
+from typing import Any, NamedTuple, Optional
 
-from ..european.generalised_black_scholes import price as bs_price
+from ..distributions import FLOAT_MATH, MathNamespace, inv_cdf
+from ..european.generalised_black_scholes import (
+    price as bs_price,
+    price_kernel as bs_price_kernel
+)
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+
+CRITICAL_PRICE_CACHE_SIZE = 4096
+"""The number of critical prices kept by the cache."""
+
 
-norm = NormalDist()
-cdf = norm.cdf
-pdf = norm.pdf
-inv_cdf = norm.inv_cdf
+class CacheInfo(NamedTuple):
+    """The statistics of the critical price cache."""
+
+    hits: int
+    """The number of critical prices found in the cache."""
+    misses: int
+    """The number of critical prices which were calculated."""
+    maxsize: Optional[int]
+    """The maximum number of critical prices kept, or None if unbounded."""
+    currsize: int
+    """The number of critical prices currently kept."""
 
 
 def _kc(
-        K: float,
-        T: float,
-        r: float,
-        b: float,
-        v: float,
-) -> float:
+        m: MathNamespace,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
     """Newton Raphson algorithm to solve for the critical commodity price for a call.
 
     Args:
-        K (float): The strike.
-        T (float): The time to expiry in years.
-        r (float): The risk free rate.
-        b (float): The asset growth.
-        v (float): The volatility.
+        m (MathNamespace): The mathematical functions.
+        K (Any): The strike.
+        T (Any): The time to expiry in years.
+        r (Any): The risk free rate.
+        b (Any): The asset growth.
+        v (Any): The volatility.
 
     Returns:
-        float: The price.
+        Any: The price.
     """
 
     # Calculate the seed value Si
     n = 2 * b / v ** 2
-    m = 2 * r / v ** 2
-    q2u = (-(n - 1) + sqrt((n - 1) ** 2 + 4 * m)) / 2
+    k_ = 2 * r / v ** 2
+    q2u = (-(n - 1) + m.sqrt((n - 1) ** 2 + 4 * k_)) / 2
     su = K / (1 - 1 / q2u)
-    h2 = -(b * T + 2 * v * sqrt(T)) * K / (su - K)
-    Si = K + (su - K) * (1 - exp(h2))
+    h2 = -(b * T + 2 * v * m.sqrt(T)) * K / (su - K)
+    Si = K + (su - K) * (1 - m.exp(h2))
 
-    k = 2 * r / (v ** 2 * (1 - exp(-r * T)))
-    d1 = (log(Si / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
-    q2 = (-(n - 1) + sqrt((n - 1) ** 2 + 4 * k)) / 2
+    k = 2 * r / (v ** 2 * (1 - m.exp(-r * T)))
+    d1 = (m.log(Si / K) + (b + v ** 2 / 2) * T) / (v * m.sqrt(T))
+    q2 = (-(n - 1) + m.sqrt((n - 1) ** 2 + 4 * k)) / 2
     lhs = Si - K
     rhs = (
-        bs_price(True, Si, K, T, r, b, v) +
-        (1 - exp((b - r) * T) * cdf(d1)) * Si / q2
+        bs_price_kernel(m, True, Si, K, T, r, b, v) +
+        (1 - m.exp((b - r) * T) * m.cdf(d1)) * Si / q2
     )
     bi = (
-        exp((b - r) * T) * cdf(d1) * (1 - 1 / q2) +
-        (1 - exp((b - r) * T) * cdf(d1) / (v * sqrt(T))) / q2
+        m.exp((b - r) * T) * m.cdf(d1) * (1 - 1 / q2) +
+        (1 - m.exp((b - r) * T) * m.cdf(d1) / (v * m.sqrt(T))) / q2
     )
     epsilon = 0.000001
     # Using the Newton Raphson algorithm solve for Si
     while abs(lhs - rhs) / K > epsilon:
         Si = (K + rhs - bi * Si) / (1 - bi)
-        d1 = (log(Si / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
+        d1 = (m.log(Si / K) + (b + v ** 2 / 2) * T) / (v * m.sqrt(T))
         lhs = Si - K
         rhs = (
-            bs_price(True, Si, K, T, r, b, v) +
-            (1 - exp((b - r) * T) * cdf(d1)) * Si / q2
+            bs_price_kernel(m, True, Si, K, T, r, b, v) +
+            (1 - m.exp((b - r) * T) * m.cdf(d1)) * Si / q2
         )
         bi = (
-            exp((b - r) * T) * cdf(d1) * (1 - 1 / q2) +
-            (1 - exp((b - r) * T) * pdf(d1) / (v * sqrt(T))) / q2
+            m.exp((b - r) * T) * m.cdf(d1) * (1 - 1 / q2) +
+            (1 - m.exp((b - r) * T) * m.pdf(d1) / (v * m.sqrt(T))) / q2
         )
 
     return Si
 
 
 def _call_price(
-        S: float,
-        K: float,
-        T: float,
-        r: float,
-        b: float,
-        v: float,
-) -> float:
-
-    if b >= r:
-        return bs_price(True, S, K, T, r, b, v)
-
-    Sk = _kc(K, T, r, b, v)
+        m: MathNamespace,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+        Sk: Any
+) -> Any:
     n = 2 * b / v ** 2
-    k = 2 * r / (v ** 2 * (1 - exp(-r * T)))
-    d1 = (log(Sk / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
-    q2 = (-(n - 1) + sqrt((n - 1) ** 2 + 4 * k)) / 2
-    a2 = (Sk / q2) * (1 - exp((b - r) * T) * cdf(d1))
+    k = 2 * r / (v ** 2 * (1 - m.exp(-r * T)))
+    d1 = (m.log(Sk / K) + (b + v ** 2 / 2) * T) / (v * m.sqrt(T))
+    q2 = (-(n - 1) + m.sqrt((n - 1) ** 2 + 4 * k)) / 2
+    a2 = (Sk / q2) * (1 - m.exp((b - r) * T) * m.cdf(d1))
     if S < Sk:
         return (
-            bs_price(True, S, K, T, r, b, v)
+            bs_price_kernel(m, True, S, K, T, r, b, v)
             + a2 * (S / Sk) ** q2
         )
     else:
@@ -101,83 +122,186 @@ def _call_price(
 
 
 def _kp(
-        K: float,
-        T: float,
-        r: float,
-        b: float,
-        v: float,
-) -> float:
+        m: MathNamespace,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
     """Newton Raphson algorithm to solve for the critical commodity price for a put.
 
     Args:
-        K (float): The strike.
-        T (float): The time to expiry in years.
-        r (float): The risk free rate.
-        b (float): The asset growth.
-        v (float): The volatility.
+        m (MathNamespace): The mathematical functions.
+        K (Any): The strike.
+        T (Any): The time to expiry in years.
+        r (Any): The risk free rate.
+        b (Any): The asset growth.
+        v (Any): The volatility.
 
     Returns:
-        float: The price.
+        Any: The price.
     """
 
     # Calculation of seed value, Si
     n = 2 * b / v ** 2
-    m = 2 * r / v ** 2
-    q1u = (-(n - 1) - sqrt((n - 1) ** 2 + 4 * m)) / 2
+    k_ = 2 * r / v ** 2
+    q1u = (-(n - 1) - m.sqrt((n - 1) ** 2 + 4 * k_)) / 2
     su = K / (1 - 1 / q1u)
-    h1 = (b * T - 2 * v * sqrt(T)) * K / (K - su)
-    Si = su + (K - su) * exp(h1)
+    h1 = (b * T - 2 * v * m.sqrt(T)) * K / (K - su)
+    Si = su + (K - su) * m.exp(h1)
 
-    k = 2 * r / (v * 2 * (1 - exp(-r * T)))
-    d1 = (log(Si / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
-    q1 = (-(n - 1) - sqrt((n - 1) ** 2 + 4 * k)) / 2
+    k = 2 * r / (v * 2 * (1 - m.exp(-r * T)))
+    d1 = (m.log(Si / K) + (b + v ** 2 / 2) * T) / (v * m.sqrt(T))
+    q1 = (-(n - 1) - m.sqrt((n - 1) ** 2 + 4 * k)) / 2
     lhs = K - Si
     rhs = (
-        bs_price(False, Si, K, T, r, b, v)
-        - (1 - exp((b - r) * T) * cdf(-d1)) * Si / q1
+        bs_price_kernel(m, False, Si, K, T, r, b, v)
+        - (1 - m.exp((b - r) * T) * m.cdf(-d1)) * Si / q1
     )
     bi = (
-        -exp((b - r) * T) * cdf(-d1) * (1 - 1 / q1)
-        - (1 + exp((b - r) * T) * pdf(-d1) / (v * sqrt(T))) / q1
+        -m.exp((b - r) * T) * m.cdf(-d1) * (1 - 1 / q1)
+        - (1 + m.exp((b - r) * T) * m.pdf(-d1) / (v * m.sqrt(T))) / q1
     )
     epsilon = 0.000001
     # Using the Newton Raphson algorithm, solve for Si.
     while abs(lhs - rhs) / K > epsilon:
         Si = (K - rhs + bi * Si) / (1 + bi)
-        d1 = (log(Si / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
+        d1 = (m.log(Si / K) + (b + v ** 2 / 2) * T) / (v * m.sqrt(T))
         lhs = K - Si
         rhs = (
-            bs_price(False, Si, K, T, r, b, v)
-            - (1 - exp((b - r) * T) * cdf(-d1)) * Si / q1
+            bs_price_kernel(m, False, Si, K, T, r, b, v)
+            - (1 - m.exp((b - r) * T) * m.cdf(-d1)) * Si / q1
         )
         bi = (
-            -exp((b - r) * T) * cdf(-d1) * (1 - 1 / q1)
-            - (1 + exp((b - r) * T) * cdf(-d1) / (v * sqrt(T))) / q1
+            -m.exp((b - r) * T) * m.cdf(-d1) * (1 - 1 / q1)
+            - (1 + m.exp((b - r) * T) * m.cdf(-d1) / (v * m.sqrt(T))) / q1
         )
 
     return Si
 
 
 def _put_price(
-        S: float,
+        m: MathNamespace,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+        Sk: Any
+) -> Any:
+    n = 2 * b / v ** 2
+    k = 2 * r / (v ** 2 * (1 - m.exp(-r * T)))
+    d1 = (m.log(Sk / K) + (b + v ** 2 / 2) * T) / (v * m.sqrt(T))
+    q1 = (-(n - 1) - m.sqrt((n - 1) ** 2 + 4 * k)) / 2
+    a1 = -(Sk / q1) * (1 - m.exp((b - r) * T) * m.cdf(-d1))
+
+    if S > Sk:
+        return (
+            bs_price_kernel(m, False, S, K, T, r, b, v)
+            + a1 * (S / Sk) ** q1
+        )
+    else:
+        return K - S
+
+
+@lru_cache(maxsize=CRITICAL_PRICE_CACHE_SIZE)
+def _cached_critical_price(
+        is_call: bool,
         K: float,
         T: float,
         r: float,
         b: float,
         v: float,
 ) -> float:
+    if not is_call:
+        return _kp(FLOAT_MATH, K, T, r, b, v)
+    elif b < r:
+        return _kc(FLOAT_MATH, K, T, r, b, v)
+    else:
+        return inf
 
-    Sk = _kp(K, T, r, b, v)
-    n = 2 * b / v ** 2
-    k = 2 * r / (v ** 2 * (1 - exp(-r * T)))
-    d1 = (log(Sk / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
-    q1 = (-(n - 1) - sqrt((n - 1) ** 2 + 4 * k)) / 2
-    a1 = -(Sk / q1) * (1 - exp((b - r) * T) * cdf(-d1))
 
-    if S > Sk:
-        return bs_price(False, S, K, T, r, b, v) + a1 * (S / Sk) ** q1
+def critical_price(
+        is_call: bool,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+) -> float:
+    """The critical asset price, beyond which the option is exercised.
+
+    The results are cached, as they do not depend on the asset price.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        K (float): The strike price.
+        T (float): The time to expiry in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry.
+        v (float): The asset volatility.
+
+    Returns:
+        float: The critical price, or infinity for a call which is never
+            exercised early.
+    """
+    return _cached_critical_price(bool(is_call), K, T, r, b, v)
+
+
+def critical_price_cache_info() -> CacheInfo:
+    """The statistics of the critical price cache.
+
+    Returns:
+        CacheInfo: The hits, misses, maximum size and current size.
+    """
+    info = _cached_critical_price.cache_info()
+    return CacheInfo(info.hits, info.misses, info.maxsize, info.currsize)
+
+
+def clear_critical_price_cache() -> None:
+    """Clear the critical price cache, and reset its statistics."""
+    _cached_critical_price.cache_clear()
+
+
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    The critical price is solved with the arguments, and is not cached, so
+    the derivatives include those of the Newton Raphson iterations.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        S (Any): The asset price.
+        K (Any): The strike price.
+        T (Any): The time to expiry in years.
+        r (Any): The risk free rate.
+        b (Any): The cost of carry.
+        v (Any): The asset volatility.
+
+    Returns:
+        Any: The price of the option.
+    """
+
+    if is_call and b >= r:
+        return bs_price_kernel(m, True, S, K, T, r, b, v)
+
+    if is_call:
+        return _call_price(m, S, K, T, r, b, v, _kc(m, K, T, r, b, v))
     else:
-        return K - S
+        return _put_price(m, S, K, T, r, b, v, _kp(m, K, T, r, b, v))
 
 
 def price(
@@ -204,10 +328,14 @@ def price(
         float: The price of the option.
     """
 
+    if is_call and b >= r:
+        return bs_price(True, S, K, T, r, b, v)
+
+    Sk = critical_price(is_call, K, T, r, b, v)
     if is_call:
-        return _call_price(S, K, T, r, b, v)
+        return _call_price(FLOAT_MATH, S, K, T, r, b, v, Sk)
     else:
-        return _put_price(S, K, T, r, b, v)
+        return _put_price(FLOAT_MATH, S, K, T, r, b, v, Sk)
 
 
 def ivol(
@@ -241,7 +369,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_call, S, K, T, r, b, v),
+        Pricer(price, is_call, S, K, T, r, b),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -257,16 +385,4 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_call, S, K, T, r, b, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_call))
@@ -2,73 +2,112 @@
 American approximation.
 """
 
-from math import exp, log, sqrt
-from statistics import NormalDist
+from typing import Any
 
-from ..european.generalised_black_scholes import price as bs_price
+from ..complex_step import COMPLEX_MATH
+from ..distributions import FLOAT_MATH, MathNamespace
+from ..european.generalised_black_scholes import (
+    price_kernel as bs_price_kernel
+)
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
-
-norm = NormalDist()
-cdf = norm.cdf
+from ..pricers import Pricer
 
 
 def _phi(
-        S: float,
-        T: float,
-        gamma_: float,
-        h: float,
-        i: float,
-        r: float,
-        b: float,
-        v: float,
-) -> float:
+        m: MathNamespace,
+        S: Any,
+        T: Any,
+        gamma_: Any,
+        h: Any,
+        i: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
     lambda_ = (-r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2) * T
-    d = -(log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T) / (v * sqrt(T))
+    d = -(m.log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T) / (v * m.sqrt(T))
     kappa = 2 * b / v ** 2 + 2 * gamma_ - 1
     return (
-        exp(lambda_) * S ** gamma_ * (
-            cdf(d) - (i / S) ** kappa * cdf(d - 2 * log(i / S) / (v * sqrt(T)))
+        m.exp(lambda_) * S ** gamma_ * (
+            m.cdf(d)
+            - (i / S) ** kappa * m.cdf(d - 2 * m.log(i / S) / (v * m.sqrt(T)))
         )
     )
 
 
 def _call_price(
-        S: float,
-        K: float,
-        T: float,
-        r: float,
-        b: float,
-        v: float,
-) -> float:
-
-    if b >= r:
+        m: MathNamespace,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+
+    # The branches are taken on the real values, which for complex arguments
+    # are those of the unperturbed arguments.
+    if m.real(b) >= m.real(r):
         # We can use Black-Scholes as it is never optimal to exercise before
         # maturity.
-        return bs_price(True, S, K, T, r, b, v)
+        return bs_price_kernel(m, True, S, K, T, r, b, v)
 
     beta = (
         (1 / 2 - b / v ** 2)
-        + sqrt((b / v ** 2 - 1 / 2) ** 2 + 2 * r / v ** 2)
+        + m.sqrt((b / v ** 2 - 1 / 2) ** 2 + 2 * r / v ** 2)
     )
     b_infinity = beta / (beta - 1) * K
-    b0 = max(K, r / (r - b) * K)
-    ht = -(b * T + 2 * v * sqrt(T)) * b0 / (b_infinity - b0)
-    i = b0 + (b_infinity - b0) * (1 - exp(ht))
+    b0 = max(K, r / (r - b) * K, key=m.real)
+    ht = -(b * T + 2 * v * m.sqrt(T)) * b0 / (b_infinity - b0)
+    i = b0 + (b_infinity - b0) * (1 - m.exp(ht))
     alpha = (i - K) * i ** (-beta)
-    if S >= i:
+    if m.real(S) >= m.real(i):
         return S - K
     else:
         return (
             alpha * S ** beta
-            - alpha * _phi(S, T, beta, i, i, r, b, v)
-            + _phi(S, T, 1, i, i, r, b, v)
-            - _phi(S, T, 1, K, i, r, b, v)
-            - K * _phi(S, T, 0, i, i, r, b, v)
-            + K * _phi(S, T, 0, K, i, r, b, v)
+            - alpha * _phi(m, S, T, beta, i, i, r, b, v)
+            + _phi(m, S, T, 1, i, i, r, b, v)
+            - _phi(m, S, T, 1, K, i, r, b, v)
+            - K * _phi(m, S, T, 0, i, i, r, b, v)
+            + K * _phi(m, S, T, 0, K, i, r, b, v)
         )
 
 
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        S (Any): The current asset price.
+        K (Any): The option strike price
+        T (Any): The time to maturity of the option in years.
+        r (Any): The risk free rate.
+        b (Any): The cost of carry of the asset.
+        v (Any): The volatility of the asset.
+
+    Returns:
+        Any: The price of the option.
+    """
+    if is_call:
+        return _call_price(m, S, K, T, r, b, v)
+    else:
+        # Use the Bjerksund and Stensland put-call transformation
+        return _call_price(m, K, S, T, r - b, -b, v)
+
+
 def price(
         is_call: bool,
         S: float,
@@ -92,11 +131,34 @@ def price(
     Returns:
         float: The price of the option.
     """
-    if is_call:
-        return _call_price(S, K, T, r, b, v)
-    else:
-        # Use the Bjerksund and Stensland put-call transformation
-        return _call_price(K, S, T, r - b, -b, v)
+    return price_kernel(FLOAT_MATH, is_call, S, K, T, r, b, v)
+
+
+def complex_price(
+        is_call: bool,
+        S: complex,
+        K: complex,
+        T: complex,
+        r: complex,
+        b: complex,
+        v: complex,
+) -> complex:
+    """The Bjerksund and Stensland (1993) American approximation for complex
+    arguments, for complex step differentiation.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (complex): The current asset price.
+        K (complex): The option strike price
+        T (complex): The time to maturity of the option in years.
+        r (complex): The risk free rate.
+        b (complex): The cost of carry of the asset.
+        v (complex): The volatility of the asset.
+
+    Returns:
+        complex: The price of the option.
+    """
+    return price_kernel(COMPLEX_MATH, is_call, S, K, T, r, b, v)
 
 
 def ivol(
@@ -130,7 +192,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_call, S, K, T, r, b, v),
+        Pricer(price, is_call, S, K, T, r, b),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -146,16 +208,7 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_call, S, K, T, r, b, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(
+        Pricer(price, is_call),
+        Pricer(complex_price, is_call)
+    )
@@ -1,20 +1,186 @@
 """Option valuation functions implementing the Bjerksund and Stensland (2002)
-American approximation"""
+American approximation.
 
-from math import exp, log, sqrt
-from statistics import NormalDist
-from typing import Callable
+The gradient of the price with respect to all of its arguments is found by
+hand written reverse mode differentiation: the price is calculated once,
+and the derivatives are then passed back through each step. The derivatives
+of the bivariate normal distribution are known in closed form, so they cost
+a few univariate evaluations rather than further bivariate ones, and the
+gradient costs little more than the price.
+"""
 
-from ..distributions import CBND as cbnd
-from ..european.generalised_black_scholes import price as bs_price
+from math import exp, log, pi, sqrt
+from typing import Any, Callable, Tuple
+
+from ..distributions import (
+    CBND,
+    FLOAT_MATH,
+    MathNamespace,
+    cbnd,
+    cdf,
+    pdf
+)
+from ..european.generalised_black_scholes import (
+    price as bs_price,
+    price_kernel as bs_price_kernel
+)
+from ..greeks import PriceGradient
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
-
-norm = NormalDist()
-cdf = norm.cdf
+from ..pricers import Pricer
 
 
 def _phi(
+        m: MathNamespace,
+        S: Any,
+        T: Any,
+        gamma_: Any,
+        h: Any,
+        i: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+    lambda_ = (-r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2) * T
+    d = -(m.log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T) / (v * m.sqrt(T))
+    kappa = 2 * b / v ** 2 + 2 * gamma_ - 1
+    return (
+        m.exp(lambda_) * S ** gamma_ * (
+            m.cdf(d)
+            - (i / S) ** kappa * m.cdf(d - 2 * m.log(i / S) / (v * m.sqrt(T))))
+    )
+
+
+def _ksi(
+        m: MathNamespace,
+        S: Any,
+        T2: Any,
+        gamma_: Any,
+        h: Any,
+        I2: Any,
+        I1: Any,
+        t1: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+    e1 = (m.log(S / I1) + (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * m.sqrt(t1))
+    e2 = (m.log(I2 ** 2 / (S * I1)) +
+          (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * m.sqrt(t1))
+    e3 = (m.log(S / I1) - (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * m.sqrt(t1))
+    e4 = (m.log(I2 ** 2 / (S * I1)) -
+          (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * m.sqrt(t1))
+
+    f1 = (m.log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * m.sqrt(T2))
+    f2 = (m.log(I2 ** 2 / (S * h)) +
+          (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * m.sqrt(T2))
+    f3 = (m.log(I1 ** 2 / (S * h)) +
+          (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * m.sqrt(T2))
+    f4 = (m.log(S * I1 ** 2 / (h * I2 ** 2)) +
+          (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * m.sqrt(T2))
+
+    rho = m.sqrt(t1 / T2)
+    lambda_ = -r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2
+    kappa = 2 * b / (v ** 2) + (2 * gamma_ - 1)
+
+    return (
+        m.exp(lambda_ * T2) *
+        S ** gamma_ *
+        (
+            cbnd(m, -e1, -f1, rho) -
+            (I2 / S) ** kappa * cbnd(m, -e2, -f2, rho) -
+            (I1 / S) ** kappa * cbnd(m, -e3, -f3, -rho) +
+            (I1 / I2) ** kappa * cbnd(m, -e4, -f4, -rho)
+        )
+    )
+
+
+def _call_price(
+        m: MathNamespace,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+
+    t1 = 1 / 2 * (m.sqrt(5) - 1) * T
+
+    if b >= r:
+        # Use Black-Scholes as it is never optimal to exercise before maturity.
+        return bs_price_kernel(m, True, S, K, T, r, b, v)
+
+    beta = (
+        (1 / 2 - b / v ** 2)
+        + m.sqrt((b / v ** 2 - 1 / 2) ** 2 + 2 * r / v ** 2)
+    )
+    b_infinity = beta / (beta - 1) * K
+    b0 = max(K, r / (r - b) * K)
+
+    ht1 = -(b * t1 + 2 * v * m.sqrt(t1)) * K ** 2 / ((b_infinity - b0) * b0)
+    ht2 = -(b * T + 2 * v * m.sqrt(T)) * K ** 2 / ((b_infinity - b0) * b0)
+    I1 = b0 + (b_infinity - b0) * (1 - m.exp(ht1))
+    I2 = b0 + (b_infinity - b0) * (1 - m.exp(ht2))
+    alfa1 = (I1 - K) * I1 ** (-beta)
+    alfa2 = (I2 - K) * I2 ** (-beta)
+
+    if S >= I2:
+        return S - K
+    else:
+        return (
+            alfa2 * S ** beta
+            - alfa2 * _phi(m, S, t1, beta, I2, I2, r, b, v)
+            + _phi(m, S, t1, 1, I2, I2, r, b, v)
+            - _phi(m, S, t1, 1, I1, I2, r, b, v)
+            - K * _phi(m, S, t1, 0, I2, I2, r, b, v)
+            + K * _phi(m, S, t1, 0, I1, I2, r, b, v)
+            + alfa1 * _phi(m, S, t1, beta, I1, I2, r, b, v)
+            - alfa1 * _ksi(m, S, T, beta, I1, I2, I1, t1, r, b, v)
+            + _ksi(m, S, T, 1, I1, I2, I1, t1, r, b, v)
+            - _ksi(m, S, T, 1, K, I2, I1, t1, r, b, v)
+            - K * _ksi(m, S, T, 0, I1, I2, I1, t1, r, b, v)
+            + K * _ksi(m, S, T, 0, K, I2, I1, t1, r, b, v)
+        )
+
+
+# The terms of the call price after the first, as the sign, the name of
+# the coefficient, the gamma (None for beta), and the name of the trigger
+# price h.
+_PHI_TERMS = (
+    (-1, 'alfa2', None, 'I2'),
+    (1, None, 1, 'I2'),
+    (-1, None, 1, 'I1'),
+    (-1, 'K', 0, 'I2'),
+    (1, 'K', 0, 'I1'),
+    (1, 'alfa1', None, 'I1'),
+)
+_KSI_TERMS = (
+    (-1, 'alfa1', None, 'I1'),
+    (1, None, 1, 'I1'),
+    (-1, None, 1, 'K'),
+    (-1, 'K', 0, 'I1'),
+    (1, 'K', 0, 'K'),
+)
+
+
+def _cbnd_gradient(
+        x: float,
+        y: float,
+        rho: float
+) -> Tuple[float, float, float, float]:
+    # The bivariate normal distribution, and its derivatives with respect to
+    # x, y and rho.
+    s = sqrt((1 - rho) * (1 + rho))
+    return (
+        CBND(x, y, rho),
+        pdf(x) * cdf((y - rho * x) / s),
+        pdf(y) * cdf((x - rho * y) / s),
+        exp(-(x * x - 2 * rho * x * y + y * y) / (2 * s * s)) / (2 * pi * s)
+    )
+
+
+def _phi_gradient(
         S: float,
         T: float,
         gamma_: float,
@@ -23,18 +189,55 @@ def _phi(
         r: float,
         b: float,
         v: float,
-) -> float:
-    lambda_ = (-r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2) * T
-    d = -(log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T) / (v * sqrt(T))
+) -> Tuple[float, float, float, float, float, float, float, float, float]:
+    # The value of _phi, and its derivatives with respect to S, T, gamma_, h,
+    # i, r, b and v.
+    sqrt_T = sqrt(T)
+    vsT = v * sqrt_T
+    q = b + (gamma_ - 0.5) * v ** 2
+    rate = -r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2
+    log_Sh = log(S / h)
+    log_iS = log(i / S)
+    d = -(log_Sh + q * T) / vsT
+    d2 = d - 2 * log_iS / vsT
     kappa = 2 * b / v ** 2 + 2 * gamma_ - 1
-    return (
-        exp(lambda_) * S ** gamma_ * (
-            cdf(d)
-            - (i / S) ** kappa * cdf(d - 2 * log(i / S) / (v * sqrt(T))))
+    A = exp(rate * T) * S ** gamma_
+    X = (i / S) ** kappa
+    N_d2 = cdf(d2)
+    value = A * (cdf(d) - X * N_d2)
+
+    # Pass the derivatives back through each step, where A = exp(log_A) and
+    # X = exp(kappa * log_iS).
+    bar_log_A = value
+    bar_d2 = -A * X * pdf(d2)
+    bar_d = A * pdf(d) + bar_d2
+    bar_kappa_log_iS = -A * X * N_d2
+    bar_log_iS = -2 * bar_d2 / vsT + bar_kappa_log_iS * kappa
+    bar_kappa = bar_kappa_log_iS * log_iS
+    bar_vsT = (2 * bar_d2 * log_iS / vsT - bar_d * d) / vsT
+    bar_log_Sh = -bar_d / vsT
+    bar_q = -bar_d * T / vsT
+    bar_rate = bar_log_A * T
+
+    dS = (bar_log_A * gamma_ + bar_log_Sh - bar_log_iS) / S
+    dT = -bar_d * q / vsT + bar_log_A * rate + bar_vsT * v / (2 * sqrt_T)
+    dgamma = (
+        bar_log_A * log(S) + bar_rate * q + bar_q * v ** 2 + 2 * bar_kappa
     )
+    dh = -bar_log_Sh / h
+    di = bar_log_iS / i
+    dr = -bar_rate
+    db = bar_rate * gamma_ + bar_q + bar_kappa * 2 / v ** 2
+    dv = (
+        bar_rate * gamma_ * (gamma_ - 1) * v
+        + bar_q * 2 * (gamma_ - 0.5) * v
+        - bar_kappa * 4 * b / v ** 3
+        + bar_vsT * sqrt_T
+    )
+    return value, dS, dT, dgamma, dh, di, dr, db, dv
 
 
-def _ksi(
+def _ksi_gradient(
         S: float,
         T2: float,
         gamma_: float,
@@ -45,84 +248,316 @@ def _ksi(
         r: float,
         b: float,
         v: float,
-) -> float:
-    e1 = (log(S / I1) + (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * sqrt(t1))
-    e2 = (log(I2 ** 2 / (S * I1)) +
-          (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * sqrt(t1))
-    e3 = (log(S / I1) - (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * sqrt(t1))
-    e4 = (log(I2 ** 2 / (S * I1)) -
-          (b + (gamma_ - 0.5) * v ** 2) * t1) / (v * sqrt(t1))
-
-    f1 = (log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * sqrt(T2))
-    f2 = (log(I2 ** 2 / (S * h)) +
-          (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * sqrt(T2))
-    f3 = (log(I1 ** 2 / (S * h)) +
-          (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * sqrt(T2))
-    f4 = (log(S * I1 ** 2 / (h * I2 ** 2)) +
-          (b + (gamma_ - 0.5) * v ** 2) * T2) / (v * sqrt(T2))
+) -> Tuple[
+    float, float, float, float, float, float, float, float, float, float,
+    float
+]:
+    # The value of _ksi, and its derivatives with respect to S, T2, gamma_, h,
+    # I2, I1, t1, r, b and v.
+    sqrt_t1, sqrt_T2 = sqrt(t1), sqrt(T2)
+    vst1, vsT2 = v * sqrt_t1, v * sqrt_T2
+    q = b + (gamma_ - 0.5) * v ** 2
+    qt1, qT2 = q * t1, q * T2
+
+    e1 = (log(S / I1) + qt1) / vst1
+    e2 = (log(I2 ** 2 / (S * I1)) + qt1) / vst1
+    e3 = (log(S / I1) - qt1) / vst1
+    e4 = (log(I2 ** 2 / (S * I1)) - qt1) / vst1
+
+    f1 = (log(S / h) + qT2) / vsT2
+    f2 = (log(I2 ** 2 / (S * h)) + qT2) / vsT2
+    f3 = (log(I1 ** 2 / (S * h)) + qT2) / vsT2
+    f4 = (log(S * I1 ** 2 / (h * I2 ** 2)) + qT2) / vsT2
 
     rho = sqrt(t1 / T2)
-    lambda_ = -r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2
+    rate = -r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2
     kappa = 2 * b / (v ** 2) + (2 * gamma_ - 1)
 
+    log_I2S, log_I1S, log_I1I2 = log(I2 / S), log(I1 / S), log(I1 / I2)
+    E = exp(rate * T2) * S ** gamma_
+    X2, X1, X12 = (I2 / S) ** kappa, (I1 / S) ** kappa, (I1 / I2) ** kappa
+
+    M1, M1_x, M1_y, M1_rho = _cbnd_gradient(-e1, -f1, rho)
+    M2, M2_x, M2_y, M2_rho = _cbnd_gradient(-e2, -f2, rho)
+    M3, M3_x, M3_y, M3_rho = _cbnd_gradient(-e3, -f3, -rho)
+    M4, M4_x, M4_y, M4_rho = _cbnd_gradient(-e4, -f4, -rho)
+
+    value = E * (M1 - X2 * M2 - X1 * M3 + X12 * M4)
+
+    # Pass the derivatives back through each step, where E = exp(log_E) and
+    # the powers are the exponentials of kappa times their logarithms.
+    bar_log_E = value
+    bar_M1, bar_M2, bar_M3, bar_M4 = E, -E * X2, -E * X1, E * X12
+    bar_k2, bar_k1, bar_k12 = -E * X2 * M2, -E * X1 * M3, E * X12 * M4
+    bar_kappa = bar_k2 * log_I2S + bar_k1 * log_I1S + bar_k12 * log_I1I2
+
+    bar_e1, bar_f1 = -bar_M1 * M1_x, -bar_M1 * M1_y
+    bar_e2, bar_f2 = -bar_M2 * M2_x, -bar_M2 * M2_y
+    bar_e3, bar_f3 = -bar_M3 * M3_x, -bar_M3 * M3_y
+    bar_e4, bar_f4 = -bar_M4 * M4_x, -bar_M4 * M4_y
+    bar_rho = (
+        bar_M1 * M1_rho + bar_M2 * M2_rho - bar_M3 * M3_rho - bar_M4 * M4_rho
+    )
+
+    # The numerators of the e and f terms are log moneyness plus or minus
+    # q times the time.
+    bar_e13, bar_e24 = (bar_e1 + bar_e3) / vst1, (bar_e2 + bar_e4) / vst1
+    bar_qt1 = (bar_e1 + bar_e2 - bar_e3 - bar_e4) / vst1
+    bar_vst1 = -(bar_e1 * e1 + bar_e2 * e2 + bar_e3 * e3 + bar_e4 * e4) / vst1
+    bar_f1, bar_f2, bar_f3, bar_f4 = (
+        bar_f1 / vsT2, bar_f2 / vsT2, bar_f3 / vsT2, bar_f4 / vsT2
+    )
+    bar_qT2 = bar_f1 + bar_f2 + bar_f3 + bar_f4
+    bar_vsT2 = -(bar_f1 * f1 + bar_f2 * f2 + bar_f3 * f3 + bar_f4 * f4)
+
+    bar_log_S = (
+        bar_e13 - bar_e24 + bar_f1 - bar_f2 - bar_f3 + bar_f4
+        - (bar_k2 + bar_k1) * kappa + bar_log_E * gamma_
+    )
+    bar_log_I1 = (
+        -bar_e13 - bar_e24 + 2 * (bar_f3 + bar_f4)
+        + (bar_k1 + bar_k12) * kappa
+    )
+    bar_log_I2 = (
+        2 * (bar_e24 + bar_f2 - bar_f4) + (bar_k2 - bar_k12) * kappa
+    )
+    bar_log_h = -bar_qT2
+
+    bar_q = bar_qt1 * t1 + bar_qT2 * T2
+    bar_rate = bar_log_E * T2
+
+    dS = bar_log_S / S
+    dT2 = (
+        bar_qT2 * q
+        - bar_rho * rho / (2 * T2)
+        + bar_log_E * rate
+        + bar_vsT2 * v / (2 * sqrt_T2)
+    )
+    dgamma = (
+        bar_log_E * log(S) + bar_rate * q + bar_q * v ** 2 + 2 * bar_kappa
+    )
+    dh = bar_log_h / h
+    dI2 = bar_log_I2 / I2
+    dI1 = bar_log_I1 / I1
+    dt1 = (
+        bar_qt1 * q
+        + bar_rho * rho / (2 * t1)
+        + bar_vst1 * v / (2 * sqrt_t1)
+    )
+    dr = -bar_rate
+    db = bar_rate * gamma_ + bar_q + bar_kappa * 2 / v ** 2
+    dv = (
+        bar_rate * gamma_ * (gamma_ - 1) * v
+        + bar_q * 2 * (gamma_ - 0.5) * v
+        - bar_kappa * 4 * b / v ** 3
+        + bar_vst1 * sqrt_t1
+        + bar_vsT2 * sqrt_T2
+    )
+    return value, dS, dT2, dgamma, dh, dI2, dI1, dt1, dr, db, dv
+
+
+def _bs_call_price_gradient(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+) -> Tuple[float, float, float, float, float, float, float]:
+    value = bs_price(True, S, K, T, r, b, v)
+    sqrt_T = sqrt(T)
+    d1 = (log(S / K) + (b + v ** 2 / 2) * T) / (v * sqrt_T)
+    d2 = d1 - v * sqrt_T
+    S_carry = S * exp((b - r) * T)
+    K_df = K * exp(-r * T)
+    N_d1, N_d2 = cdf(d1), cdf(d2)
     return (
-        exp(lambda_ * T2) *
-        S ** gamma_ *
+        value,
+        N_d1 * S_carry / S,
+        -N_d2 * K_df / K,
         (
-            cbnd(-e1, -f1, rho) -
-            (I2 / S) ** kappa * cbnd(-e2, -f2, rho) -
-            (I1 / S) ** kappa * cbnd(-e3, -f3, -rho) +
-            (I1 / I2) ** kappa * cbnd(-e4, -f4, -rho)
-        )
+            S_carry * (pdf(d1) * v / (2 * sqrt_T) + (b - r) * N_d1)
+            + r * K_df * N_d2
+        ),
+        -T * value,
+        T * S_carry * N_d1,
+        S_carry * pdf(d1) * sqrt_T
     )
 
 
-def _call_price(
+def _call_price_gradient(
         S: float,
         K: float,
         T: float,
         r: float,
         b: float,
         v: float,
-) -> float:
-
-    t1 = 1 / 2 * (sqrt(5) - 1) * T
+) -> Tuple[float, float, float, float, float, float, float]:
+    # The price, and its derivatives with respect to S, K, T, r, b and v.
+    c = 1 / 2 * (sqrt(5) - 1)
+    t1 = c * T
 
     if b >= r:
-        # Use Black-Scholes as it is never optimal to exercise before maturity.
-        return bs_price(True, S, K, T, r, b, v)
+        return _bs_call_price_gradient(S, K, T, r, b, v)
 
-    beta = (
-        (1 / 2 - b / v ** 2)
-        + sqrt((b / v ** 2 - 1 / 2) ** 2 + 2 * r / v ** 2)
-    )
+    w = b / v ** 2
+    root = sqrt((w - 1 / 2) ** 2 + 2 * r / v ** 2)
+    beta = (1 / 2 - w) + root
     b_infinity = beta / (beta - 1) * K
     b0 = max(K, r / (r - b) * K)
 
-    ht1 = -(b * t1 + 2 * v * sqrt(t1)) * K ** 2 / ((b_infinity - b0) * b0)
-    ht2 = -(b * T + 2 * v * sqrt(T)) * K ** 2 / ((b_infinity - b0) * b0)
-    I1 = b0 + (b_infinity - b0) * (1 - exp(ht1))
-    I2 = b0 + (b_infinity - b0) * (1 - exp(ht2))
+    Q = K ** 2 / ((b_infinity - b0) * b0)
+    P1 = b * t1 + 2 * v * sqrt(t1)
+    P2 = b * T + 2 * v * sqrt(T)
+    ht1, ht2 = -P1 * Q, -P2 * Q
+    exp_ht1, exp_ht2 = exp(ht1), exp(ht2)
+    I1 = b0 + (b_infinity - b0) * (1 - exp_ht1)
+    I2 = b0 + (b_infinity - b0) * (1 - exp_ht2)
     alfa1 = (I1 - K) * I1 ** (-beta)
     alfa2 = (I2 - K) * I2 ** (-beta)
 
     if S >= I2:
-        return S - K
-    else:
-        return (
-            alfa2 * S ** beta
-            - alfa2 * _phi(S, t1, beta, I2, I2, r, b, v)
-            + _phi(S, t1, 1, I2, I2, r, b, v)
-            - _phi(S, t1, 1, I1, I2, r, b, v)
-            - K * _phi(S, t1, 0, I2, I2, r, b, v)
-            + K * _phi(S, t1, 0, I1, I2, r, b, v)
-            + alfa1 * _phi(S, t1, beta, I1, I2, r, b, v)
-            - alfa1 * _ksi(S, T, beta, I1, I2, I1, t1, r, b, v)
-            + _ksi(S, T, 1, I1, I2, I1, t1, r, b, v)
-            - _ksi(S, T, 1, K, I2, I1, t1, r, b, v)
-            - K * _ksi(S, T, 0, I1, I2, I1, t1, r, b, v)
-            + K * _ksi(S, T, 0, K, I2, I1, t1, r, b, v)
+        return S - K, 1.0, -1.0, 0.0, 0.0, 0.0, 0.0
+
+    S_beta = S ** beta
+    value = alfa2 * S_beta
+    bar = {
+        'S': alfa2 * beta * S_beta / S,
+        'K': 0.0,
+        'T': 0.0,
+        't1': 0.0,
+        'beta': value * log(S),
+        'I1': 0.0,
+        'I2': 0.0,
+        'alfa1': 0.0,
+        'alfa2': S_beta,
+        'r': 0.0,
+        'b': 0.0,
+        'v': 0.0,
+    }
+    values = {
+        'K': K, 'I1': I1, 'I2': I2, 'alfa1': alfa1, 'alfa2': alfa2
+    }
+
+    for sign, coefficient, gamma_, h in _PHI_TERMS:
+        p, dS, dT, dgamma, dh, di, dr, db, dv = _phi_gradient(
+            S, t1, beta if gamma_ is None else gamma_, values[h], I2, r, b, v
+        )
+        scale = sign if coefficient is None else sign * values[coefficient]
+        value += scale * p
+        if coefficient is not None:
+            bar[coefficient] += sign * p
+        if gamma_ is None:
+            bar['beta'] += scale * dgamma
+        bar[h] += scale * dh
+        bar['S'] += scale * dS
+        bar['t1'] += scale * dT
+        bar['I2'] += scale * di
+        bar['r'] += scale * dr
+        bar['b'] += scale * db
+        bar['v'] += scale * dv
+
+    for sign, coefficient, gamma_, h in _KSI_TERMS:
+        p, dS, dT, dgamma, dh, dI2, dI1, dt1, dr, db, dv = _ksi_gradient(
+            S, T, beta if gamma_ is None else gamma_, values[h], I2, I1, t1,
+            r, b, v
         )
+        scale = sign if coefficient is None else sign * values[coefficient]
+        value += scale * p
+        if coefficient is not None:
+            bar[coefficient] += sign * p
+        if gamma_ is None:
+            bar['beta'] += scale * dgamma
+        bar[h] += scale * dh
+        bar['S'] += scale * dS
+        bar['T'] += scale * dT
+        bar['I2'] += scale * dI2
+        bar['I1'] += scale * dI1
+        bar['t1'] += scale * dt1
+        bar['r'] += scale * dr
+        bar['b'] += scale * db
+        bar['v'] += scale * dv
+
+    # The exercise coefficients.
+    for alfa, I in (('alfa1', 'I1'), ('alfa2', 'I2')):
+        I_beta = values[I] ** (-beta)
+        bar[I] += bar[alfa] * (I_beta - beta * values[alfa] / values[I])
+        bar['K'] -= bar[alfa] * I_beta
+        bar['beta'] -= bar[alfa] * values[alfa] * log(values[I])
+
+    # The trigger prices.
+    bar_b0 = bar_b_infinity = bar_Q = 0.0
+    for I, exp_ht, tau, P in (
+            ('I1', exp_ht1, 't1', P1),
+            ('I2', exp_ht2, 'T', P2),
+    ):
+        bar_b0 += bar[I] * exp_ht
+        bar_b_infinity += bar[I] * (1 - exp_ht)
+        bar_ht = -bar[I] * (b_infinity - b0) * exp_ht
+        tau_value = t1 if tau == 't1' else T
+        bar['b'] -= bar_ht * tau_value * Q
+        bar['v'] -= bar_ht * 2 * sqrt(tau_value) * Q
+        bar[tau] -= bar_ht * (b + v / sqrt(tau_value)) * Q
+        bar_Q -= bar_ht * P
+
+    bar['K'] += bar_Q * 2 * Q / K
+    bar_b_infinity -= bar_Q * Q / (b_infinity - b0)
+    bar_b0 += bar_Q * Q * (1 / (b_infinity - b0) - 1 / b0)
+
+    if r / (r - b) * K > K:
+        bar['K'] += bar_b0 * r / (r - b)
+        bar['r'] -= bar_b0 * K * b / (r - b) ** 2
+        bar['b'] += bar_b0 * r * K / (r - b) ** 2
+    else:
+        bar['K'] += bar_b0
+
+    bar['K'] += bar_b_infinity * beta / (beta - 1)
+    bar['beta'] -= bar_b_infinity * K / (beta - 1) ** 2
+
+    # The exponent of the exercise coefficients.
+    dbeta_dw = -1 + (w - 1 / 2) / root
+    bar['b'] += bar['beta'] * dbeta_dw / v ** 2
+    bar['r'] += bar['beta'] / (root * v ** 2)
+    bar['v'] -= bar['beta'] * (
+        dbeta_dw * 2 * b / v ** 3 + 2 * r / (root * v ** 3)
+    )
+
+    bar['T'] += bar['t1'] * c
+
+    return value, bar['S'], bar['K'], bar['T'], bar['r'], bar['b'], bar['v']
+
+
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        S (Any): The current asset price.
+        K (Any): The option strike price
+        T (Any): The time to maturity of the option in years.
+        r (Any): The risk free rate.
+        b (Any): The cost of carry of the asset.
+        v (Any): The volatility of the asset.
+
+    Returns:
+        Any: The price of the option.
+    """
+    if is_call:
+        return _call_price(m, S, K, T, r, b, v)
+    else:
+        # Use the Bjerksund and Stensland put-call transformation
+        return _call_price(m, K, S, T, r - b, -b, v)
 
 
 def price(
@@ -148,12 +583,48 @@ def price(
     Returns:
         float: The price of the option.
     """
+    return price_kernel(FLOAT_MATH, is_call, S, K, T, r, b, v)
+
+
+def price_gradient(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+) -> PriceGradient:
+    """The Bjerksund and Stensland (2002) American approximation, with its
+    derivatives with respect to each of the pricing arguments.
+
+    The derivatives are found by reverse mode differentiation, at a cost
+    which is a small multiple of the cost of the price.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+
+    Returns:
+        PriceGradient: The price, and its derivatives with respect to the
+            asset price, strike, time to maturity, risk free rate, cost of
+            carry and volatility.
+    """
 
     if is_call:
-        return _call_price(S, K, T, r, b, v)
-    else:
-        # Use the Bjerksund and Stensland put-call transformation
-        return _call_price(K, S, T, r - b, -b, v)
+        return PriceGradient(*_call_price_gradient(S, K, T, r, b, v))
+
+    # Use the Bjerksund and Stensland put-call transformation, under which
+    # the rate of the call moves with both the rate and the carry of the put.
+    value, dK, dS, dT, dr, db, dv = _call_price_gradient(
+        K, S, T, r - b, -b, v
+    )
+    return PriceGradient(value, dS, dK, dT, dr, -dr - db, dv)
 
 
 def ivol(
@@ -187,7 +658,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_call, S, K, T, r, b, v),
+        Pricer(price, is_call, S, K, T, r, b),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -203,16 +674,4 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_call, S, K, T, r, b, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_call))
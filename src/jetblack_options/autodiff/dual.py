@@ -0,0 +1,210 @@
+"""Dual numbers for forward mode automatic differentiation.
+"""
+
+from __future__ import annotations
+
+from math import log
+from operator import add, neg, sub
+from typing import Tuple, Union
+
+Real = Union[float, int]
+
+
+class Dual:
+    r"""A dual number, carrying the derivatives of a value along one or more
+    directions.
+
+    A dual number $a + \sum_i b_i \epsilon_i$, where
+    $\epsilon_i \epsilon_j = 0$, propagates the first derivatives with
+    respect to several inputs through arithmetic and the functions of
+    `jetblack_options.autodiff.functions`.
+    Each input is given a gradient with a one in its own direction, so a
+    single evaluation finds the derivatives with respect to all of them.
+
+    Comparisons use the values, so branches follow the path taken by the
+    values. There is no conversion to float, so functions which do not
+    support dual numbers raise a `TypeError` rather than losing the
+    derivatives.
+    """
+
+    __slots__ = ('value', 'gradient')
+
+    def __init__(self, value: Real, gradient: Tuple[float, ...]) -> None:
+        """Initialise the dual number.
+
+        Args:
+            value (Real): The value.
+            gradient (Tuple[float, ...]): The derivatives of the value along
+                each direction.
+        """
+        self.value = value
+        self.gradient = gradient
+
+    @classmethod
+    def variables(cls, *values: Real) -> Tuple[Dual, ...]:
+        """Make dual numbers for independent inputs, each with its own
+        direction.
+
+        Args:
+            *values (Real): The values of the inputs.
+
+        Returns:
+            Tuple[Dual, ...]: The dual numbers.
+        """
+        n = len(values)
+        return tuple(
+            cls(value, tuple(1.0 if i == j else 0.0 for j in range(n)))
+            for i, value in enumerate(values)
+        )
+
+    def chain(self, f: float, df: float, d2f: float = 0.0) -> Dual:
+        """Apply a function with the chain rule.
+
+        Args:
+            f (float): The function at the value.
+            df (float): The first derivative of the function at the value.
+            d2f (float, optional): The second derivative, which is not used
+                by first order dual numbers. Defaults to 0.0.
+
+        Returns:
+            Dual: The function of the dual number.
+        """
+        return Dual(f, tuple([df * g for g in self.gradient]))
+
+    def __add__(self, other: Union[Dual, Real]) -> Dual:
+        if isinstance(other, Dual):
+            return Dual(
+                self.value + other.value,
+                tuple(map(add, self.gradient, other.gradient))
+            )
+        return Dual(self.value + other, self.gradient)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Dual, Real]) -> Dual:
+        if isinstance(other, Dual):
+            return Dual(
+                self.value - other.value,
+                tuple(map(sub, self.gradient, other.gradient))
+            )
+        return Dual(self.value - other, self.gradient)
+
+    def __rsub__(self, other: Real) -> Dual:
+        return Dual(other - self.value, tuple(map(neg, self.gradient)))
+
+    def __mul__(self, other: Union[Dual, Real]) -> Dual:
+        if isinstance(other, Dual):
+            a, b = self.value, other.value
+            return Dual(
+                a * b,
+                tuple([
+                    a * db + b * da
+                    for da, db in zip(self.gradient, other.gradient)
+                ])
+            )
+        return Dual(
+            self.value * other,
+            tuple([other * g for g in self.gradient])
+        )
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union[Dual, Real]) -> Dual:
+        if isinstance(other, Dual):
+            a, b = self.value, other.value
+            return Dual(
+                a / b,
+                tuple([
+                    (da * b - a * db) / (b * b)
+                    for da, db in zip(self.gradient, other.gradient)
+                ])
+            )
+        return Dual(
+            self.value / other,
+            tuple([g / other for g in self.gradient])
+        )
+
+    def __rtruediv__(self, other: Real) -> Dual:
+        b = self.value
+        return self.chain(other / b, -other / (b * b))
+
+    def __pow__(self, other: Union[Dual, Real]) -> Dual:
+        if isinstance(other, Dual):
+            return _pow(self, other)
+        a = self.value
+        if other == 0:
+            return Dual(1.0, tuple(0.0 for _ in self.gradient))
+        return self.chain(a ** other, other * a ** (other - 1))
+
+    def __rpow__(self, other: Real) -> Dual:
+        return _pow(other, self)
+
+    def __neg__(self) -> Dual:
+        return Dual(-self.value, tuple(map(neg, self.gradient)))
+
+    def __pos__(self) -> Dual:
+        return self
+
+    def __abs__(self) -> Dual:
+        return -self if self.value < 0 else self
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __floor__(self) -> int:
+        return int(self.value // 1)
+
+    def __ceil__(self) -> int:
+        return -int(-self.value // 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (Dual, float, int)):
+            return NotImplemented
+        return self.value == _value(other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, (Dual, float, int)):
+            return NotImplemented
+        return self.value != _value(other)
+
+    def __lt__(self, other: Union[Dual, Real]) -> bool:
+        return self.value < _value(other)
+
+    def __le__(self, other: Union[Dual, Real]) -> bool:
+        return self.value <= _value(other)
+
+    def __gt__(self, other: Union[Dual, Real]) -> bool:
+        return self.value > _value(other)
+
+    def __ge__(self, other: Union[Dual, Real]) -> bool:
+        return self.value >= _value(other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"Dual({self.value!r}, {self.gradient!r})"
+
+
+def _value(x: Union[Dual, Real]) -> Real:
+    return x.value if isinstance(x, Dual) else x
+
+
+def _pow(x: Union[Dual, Real], y: Union[Dual, Real]) -> Dual:
+    # The derivative of x ** y is y x^(y-1) dx + log(x) x^y dy, for a
+    # positive x.
+    if not isinstance(x, Dual):
+        assert isinstance(y, Dual)
+        f = x ** y.value
+        return y.chain(f, log(x) * f)
+    if not isinstance(y, Dual):
+        return x ** y
+
+    a, b = x.value, y.value
+    f = a ** b
+    return Dual(
+        f,
+        tuple(
+            b * a ** (b - 1) * da + log(a) * f * db
+            for da, db in zip(x.gradient, y.gradient)
+        )
+    )
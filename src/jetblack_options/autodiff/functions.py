@@ -0,0 +1,148 @@
+"""Mathematical functions for floats, dual numbers and hyper-dual numbers.
+
+Each function calls the `math` function, or the distribution function, for a
+float, and applies the chain rule for a dual or hyper-dual number, so the
+pricing formulae can be evaluated with either.
+
+The pricing kernels take the functions as a
+`jetblack_options.distributions.MathNamespace`: `DUAL_MATH` holds the
+functions of this module, and `jetblack_options.distributions.FLOAT_MATH`
+the float functions they call, which avoid the type checks.
+"""
+
+import math
+from typing import TypeVar
+
+from ..distributions import MathNamespace, cdf as real_cdf, pdf as real_pdf
+from .dual import Dual
+from .hyper_dual import HyperDual
+
+Number = TypeVar('Number', float, Dual, HyperDual)
+
+_DUALS = (Dual, HyperDual)
+
+
+def exp(x: Number) -> Number:
+    """The exponential function.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The exponential of the value.
+    """
+    if isinstance(x, _DUALS):
+        f = math.exp(x.value)
+        return x.chain(f, f, f)
+    return math.exp(x)
+
+
+def log(x: Number) -> Number:
+    """The natural logarithm.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The logarithm of the value.
+    """
+    if isinstance(x, _DUALS):
+        a = x.value
+        return x.chain(math.log(a), 1 / a, -1 / (a * a))
+    return math.log(x)
+
+
+def sqrt(x: Number) -> Number:
+    """The square root.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The square root of the value.
+    """
+    if isinstance(x, _DUALS):
+        f = math.sqrt(x.value)
+        return x.chain(f, 0.5 / f, -0.25 / (f * x.value))
+    return math.sqrt(x)
+
+
+def sin(x: Number) -> Number:
+    """The sine function.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The sine of the value.
+    """
+    if isinstance(x, _DUALS):
+        f = math.sin(x.value)
+        return x.chain(f, math.cos(x.value), -f)
+    return math.sin(x)
+
+
+def asin(x: Number) -> Number:
+    """The inverse sine function.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The inverse sine of the value.
+    """
+    if isinstance(x, _DUALS):
+        a = x.value
+        c = 1 - a * a
+        return x.chain(math.asin(a), 1 / math.sqrt(c), a / c ** 1.5)
+    return math.asin(x)
+
+
+def cdf(x: Number) -> Number:
+    """The standard normal cumulative distribution function.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The probability of a value less than or equal to x.
+    """
+    if isinstance(x, _DUALS):
+        a = x.value
+        n = real_pdf(a)
+        return x.chain(real_cdf(a), n, -a * n)
+    return real_cdf(x)
+
+
+def pdf(x: Number) -> Number:
+    """The standard normal probability density function.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        Number: The density at x.
+    """
+    if isinstance(x, _DUALS):
+        a = x.value
+        n = real_pdf(a)
+        return x.chain(n, -a * n, (a * a - 1) * n)
+    return real_pdf(x)
+
+
+def real(x: Number) -> float:
+    """The real value, without the derivatives.
+
+    Args:
+        x (Number): The value.
+
+    Returns:
+        float: The value of a dual or hyper-dual number, or the float.
+    """
+    if isinstance(x, _DUALS):
+        return x.value
+    return x
+
+
+DUAL_MATH = MathNamespace(exp, log, sqrt, sin, asin, cdf, pdf, real)
+"""The functions for floats, dual numbers and hyper-dual numbers."""
@@ -0,0 +1,173 @@
+"""Greeks from forward mode automatic differentiation.
+
+The kernel of the model is evaluated with dual numbers, so a single
+evaluation gives the price and the first order greeks, exactly rather than
+by finite differences. The second order greeks each take an evaluation with
+hyper-dual numbers.
+
+The differentiated price is the price as it is calculated, so for an
+approximation which iterates the greeks include the derivative of the
+iterations. The Cox-Ross-Rubinstein and Jarrow-Rudd trees give the first
+order greeks only, as the second derivative of their piecewise linear price
+is not a useful gamma, and their delta is the slope of the price between the
+asset prices at which a final node crosses the strike.
+"""
+
+from typing import Any, Callable, Tuple
+
+from ..greeks import Greeks
+from .dual import Dual
+from .functions import DUAL_MATH
+from .hyper_dual import HyperDual
+from .kernels import TreeKernel, kernel
+
+
+class AutodiffGreeks:
+    """Greeks by forward mode automatic differentiation, for the generalised
+    style using cost of carry.
+
+    The model is given by its pricing function, which must have a kernel in
+    `jetblack_options.autodiff.kernels.KERNELS`, with its leading arguments,
+    and optionally some keyword arguments, held fixed as for a
+    `jetblack_options.pricers.Pricer`. For example
+    `AutodiffGreeks(bjerksund_stensland_2002.price, True)`, or
+    `AutodiffGreeks(cox_ross_rubinstein.price, False, True, n=200)`.
+
+    As for `jetblack_options.numeric_greeks.with_carry.NumericGreeks`, the
+    theta is the sensitivity to the passage of time per year, and the rho
+    moves both the risk free rate and the cost of carry.
+    """
+
+    def __init__(
+            self,
+            price: Callable[..., float],
+            *args: Any,
+            **keywords: Any
+    ) -> None:
+        """Initialise the greeks.
+
+        Args:
+            price (Callable[..., float]): The pricing function of the model.
+            *args (Any): The leading arguments to hold fixed, such as the
+                option type.
+            **keywords (Any): The keyword arguments to hold fixed, such as
+                the number of the steps of a tree.
+
+        Raises:
+            TypeError: If the model has no kernel.
+        """
+        self.kernel = kernel(price)
+        self.args = args
+        self.keywords = keywords
+
+    def first_order(
+            self,
+            S: float,
+            K: float,
+            T: float,
+            r: float,
+            b: float,
+            v: float
+    ) -> Tuple[float, float, float, float, float]:
+        """Calculate the price and the first order greeks with a single
+        evaluation.
+
+        Args:
+            S (float): The asset price.
+            K (float): The strike price.
+            T (float): The time to expiry in years.
+            r (float): The risk free rate.
+            b (float): The cost of carry.
+            v (float): The asset volatility.
+
+        Returns:
+            Tuple[float, float, float, float, float]: The price, delta, theta,
+                vega and rho.
+        """
+        S_, T_, v_, r_ = Dual.variables(S, T, v, r)
+        # The rate and the cost of carry move together.
+        b_ = Dual(b, r_.gradient)
+        value = self.kernel(
+            DUAL_MATH, *self.args, S_, K, T_, r_, b_, v_, **self.keywords
+        )
+        if not isinstance(value, Dual):
+            return value, 0.0, 0.0, 0.0, 0.0
+        delta, dT, vega, rho = value.gradient
+        return value.value, delta, -dT, vega, rho
+
+    def _second_order(
+            self,
+            S: float,
+            K: float,
+            T: float,
+            r: float,
+            b: float,
+            v: float,
+            first: str,
+            second: str
+    ) -> float:
+        args = {
+            name: HyperDual(
+                value,
+                1.0 if name == first else 0.0,
+                1.0 if name == second else 0.0
+            )
+            for name, value in (('S', S), ('T', T), ('v', v))
+        }
+        value = self.kernel(
+            DUAL_MATH, *self.args, args['S'], K, args['T'], r, b, args['v'],
+            **self.keywords
+        )
+        return value.e12 if isinstance(value, HyperDual) else 0.0
+
+    def all(
+            self,
+            S: float,
+            K: float,
+            T: float,
+            r: float,
+            b: float,
+            v: float
+    ) -> Greeks:
+        """Calculate the price and the first and second order greeks.
+
+        This takes one evaluation with dual numbers and four with hyper-dual
+        numbers.
+
+        Args:
+            S (float): The asset price.
+            K (float): The strike price.
+            T (float): The time to expiry in years.
+            r (float): The risk free rate.
+            b (float): The cost of carry.
+            v (float): The asset volatility.
+
+        Raises:
+            TypeError: If the model is a tree.
+
+        Returns:
+            Greeks: The price and greeks.
+        """
+        if isinstance(self.kernel, TreeKernel):
+            raise TypeError(
+                "The second order greeks of a tree are taken from the lattice "
+                "by the all_greeks function of the Leisen-Reimer and "
+                "trinomial trees"
+            )
+
+        price, delta, theta, vega, rho = self.first_order(S, K, T, r, b, v)
+
+        def second_order(first: str, second: str) -> float:
+            return self._second_order(S, K, T, r, b, v, first, second)
+
+        return Greeks(
+            price=price,
+            delta=delta,
+            gamma=second_order('S', 'S'),
+            theta=theta,
+            vega=vega,
+            rho=rho,
+            vanna=second_order('S', 'v'),
+            charm=-second_order('S', 'T'),
+            vomma=second_order('v', 'v')
+        )
@@ -0,0 +1,207 @@
+"""Hyper-dual numbers for second order forward mode automatic differentiation.
+"""
+
+from __future__ import annotations
+
+from math import exp, log
+from typing import Union
+
+Real = Union[float, int]
+
+
+class HyperDual:
+    r"""A hyper-dual number, carrying the first derivatives of a value along
+    two directions and the second derivative along both.
+
+    A hyper-dual number $a + b \epsilon_1 + c \epsilon_2 + d \epsilon_1
+    \epsilon_2$, where $\epsilon_1^2 = \epsilon_2^2 = 0$, propagates the
+    derivatives with respect to two inputs, and the mixed second derivative,
+    exactly. To find the second derivative with respect to a single input
+    give it a one in both directions.
+
+    As for `jetblack_options.autodiff.dual.Dual`, comparisons use the values
+    and there is no conversion to float.
+    """
+
+    __slots__ = ('value', 'e1', 'e2', 'e12')
+
+    def __init__(
+            self,
+            value: Real,
+            e1: float = 0.0,
+            e2: float = 0.0,
+            e12: float = 0.0
+    ) -> None:
+        """Initialise the hyper-dual number.
+
+        Args:
+            value (Real): The value.
+            e1 (float, optional): The derivative along the first direction.
+                Defaults to 0.0.
+            e2 (float, optional): The derivative along the second direction.
+                Defaults to 0.0.
+            e12 (float, optional): The second derivative along both
+                directions. Defaults to 0.0.
+        """
+        self.value = value
+        self.e1 = e1
+        self.e2 = e2
+        self.e12 = e12
+
+    def chain(self, f: float, df: float, d2f: float = 0.0) -> HyperDual:
+        """Apply a function with the chain rule.
+
+        Args:
+            f (float): The function at the value.
+            df (float): The first derivative of the function at the value.
+            d2f (float, optional): The second derivative of the function at
+                the value. Defaults to 0.0.
+
+        Returns:
+            HyperDual: The function of the hyper-dual number.
+        """
+        return HyperDual(
+            f,
+            df * self.e1,
+            df * self.e2,
+            df * self.e12 + d2f * self.e1 * self.e2
+        )
+
+    def __add__(self, other: Union[HyperDual, Real]) -> HyperDual:
+        if isinstance(other, HyperDual):
+            return HyperDual(
+                self.value + other.value,
+                self.e1 + other.e1,
+                self.e2 + other.e2,
+                self.e12 + other.e12
+            )
+        return HyperDual(self.value + other, self.e1, self.e2, self.e12)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[HyperDual, Real]) -> HyperDual:
+        if isinstance(other, HyperDual):
+            return HyperDual(
+                self.value - other.value,
+                self.e1 - other.e1,
+                self.e2 - other.e2,
+                self.e12 - other.e12
+            )
+        return HyperDual(self.value - other, self.e1, self.e2, self.e12)
+
+    def __rsub__(self, other: Real) -> HyperDual:
+        return HyperDual(other - self.value, -self.e1, -self.e2, -self.e12)
+
+    def __mul__(self, other: Union[HyperDual, Real]) -> HyperDual:
+        if isinstance(other, HyperDual):
+            return HyperDual(
+                self.value * other.value,
+                self.value * other.e1 + self.e1 * other.value,
+                self.value * other.e2 + self.e2 * other.value,
+                self.value * other.e12 + self.e1 * other.e2
+                + self.e2 * other.e1 + self.e12 * other.value
+            )
+        return HyperDual(
+            self.value * other,
+            self.e1 * other,
+            self.e2 * other,
+            self.e12 * other
+        )
+
+    __rmul__ = __mul__
+
+    def _reciprocal(self) -> HyperDual:
+        a = self.value
+        return self.chain(1 / a, -1 / (a * a), 2 / (a * a * a))
+
+    def __truediv__(self, other: Union[HyperDual, Real]) -> HyperDual:
+        if isinstance(other, HyperDual):
+            return self * other._reciprocal()
+        return HyperDual(
+            self.value / other,
+            self.e1 / other,
+            self.e2 / other,
+            self.e12 / other
+        )
+
+    def __rtruediv__(self, other: Real) -> HyperDual:
+        return self._reciprocal() * other
+
+    def __pow__(self, other: Union[HyperDual, Real]) -> HyperDual:
+        if isinstance(other, HyperDual):
+            return _pow(self, other)
+        if other == 0:
+            return HyperDual(1.0)
+        a = self.value
+        return self.chain(
+            a ** other,
+            other * a ** (other - 1),
+            other * (other - 1) * a ** (other - 2) if other != 1 else 0.0
+        )
+
+    def __rpow__(self, other: Real) -> HyperDual:
+        return _pow(other, self)
+
+    def __neg__(self) -> HyperDual:
+        return HyperDual(-self.value, -self.e1, -self.e2, -self.e12)
+
+    def __pos__(self) -> HyperDual:
+        return self
+
+    def __abs__(self) -> HyperDual:
+        return -self if self.value < 0 else self
+
+    def __int__(self) -> int:
+        return int(self.value)
+
+    def __floor__(self) -> int:
+        return int(self.value // 1)
+
+    def __ceil__(self) -> int:
+        return -int(-self.value // 1)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (HyperDual, float, int)):
+            return NotImplemented
+        return self.value == _value(other)
+
+    def __ne__(self, other: object) -> bool:
+        if not isinstance(other, (HyperDual, float, int)):
+            return NotImplemented
+        return self.value != _value(other)
+
+    def __lt__(self, other: Union[HyperDual, Real]) -> bool:
+        return self.value < _value(other)
+
+    def __le__(self, other: Union[HyperDual, Real]) -> bool:
+        return self.value <= _value(other)
+
+    def __gt__(self, other: Union[HyperDual, Real]) -> bool:
+        return self.value > _value(other)
+
+    def __ge__(self, other: Union[HyperDual, Real]) -> bool:
+        return self.value >= _value(other)
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return (
+            f"HyperDual({self.value!r}, {self.e1!r}, {self.e2!r}, {self.e12!r})"
+        )
+
+
+def _value(x: Union[HyperDual, Real]) -> Real:
+    return x.value if isinstance(x, HyperDual) else x
+
+
+def _pow(x: Union[HyperDual, Real], y: Union[HyperDual, Real]) -> HyperDual:
+    # x ** y = exp(y log(x)), for a positive x.
+    if not isinstance(x, HyperDual):
+        assert isinstance(y, HyperDual)
+        f = x ** y.value
+        log_x = log(x)
+        return y.chain(f, log_x * f, log_x * log_x * f)
+    a = x.value
+    exponent = y * x.chain(log(a), 1 / a, -1 / (a * a))
+    f = exp(exponent.value)
+    return exponent.chain(f, f, f)
@@ -0,0 +1,171 @@
+"""The pricing kernels of the models.
+
+A kernel is the pricing formula of a model written against a
+`jetblack_options.distributions.MathNamespace`, which it takes as its first
+argument. The kernels live with the models, as the `price_kernel` of each
+model module, and the `price` function of the model is its kernel evaluated
+with `FLOAT_MATH`, so each formula exists once. With `DUAL_MATH` a kernel
+can be evaluated with dual and hyper-dual numbers.
+
+The kernels follow the formulae of the models step by step, so the
+derivatives are those of the price as it is calculated, including the
+iterations of the Barone-Adesi and Whaley critical price.
+
+The Cox-Ross-Rubinstein and Jarrow-Rudd trees have a `TreeKernel`, which
+evaluates the parameters of the tree with the mathematical functions and
+carries their derivatives through the lattice, so the first order greeks
+take two passes through the lattice rather than a tree for each bump. The
+price of a tree is piecewise linear in the asset price, so its second
+derivative is not a useful gamma, and the tree kernels have no second
+order. The Leisen-Reimer and trinomial trees have an `all_greeks` function
+which reads the delta, gamma and theta from the lattice.
+"""
+
+from typing import Any, Callable, Dict, List, Tuple
+
+from ..american import (
+    barone_adesi_whaley as baw,
+    bjerksund_stensland_1993 as bs1993,
+    bjerksund_stensland_2002 as bs2002,
+)
+from ..distributions import MathNamespace
+from ..european import generalised_black_scholes as gbs
+from ..trees import cox_ross_rubinstein as crr, jarrow_rudd as jr
+from ..trees.lattice import backward_induction, backward_induction_derivative
+from .dual import Dual
+from .hyper_dual import HyperDual
+
+Kernel = Callable[..., Any]
+
+
+class TreeKernel:
+    """The kernel of a binomial tree.
+
+    The parameters of the tree, the up and down moves, the probability of an
+    up move and the discount factor of a step, are found with the
+    mathematical functions. For dual numbers the lattice is built with their
+    values, and the derivatives of the parameters and the asset price are
+    carried through the backward induction as tangents, two directions at a
+    time as the real and imaginary parts of a complex tangent.
+
+    The tree is not pruned, and the derivatives are of the first order only.
+    """
+
+    def __init__(
+            self,
+            tree_parameters: Callable[..., Tuple[Any, Any, Any, Any, Any]]
+    ) -> None:
+        """Initialise the kernel.
+
+        Args:
+            tree_parameters (Callable[..., Tuple[Any, Any, Any, Any, Any]]):
+                The `tree_parameters` function of the tree, which gives the
+                time step, up and down moves, probability of an up move and
+                discount factor of a step.
+        """
+        self.tree_parameters = tree_parameters
+
+    def __call__(
+            self,
+            m: MathNamespace,
+            is_european: bool,
+            is_call: bool,
+            S: Any,
+            K: float,
+            T: Any,
+            r: Any,
+            b: Any,
+            v: Any,
+            n: int
+    ) -> Any:
+        """Value the option.
+
+        Args:
+            m (MathNamespace): The mathematical functions.
+            is_european (bool): True for European, false for American.
+            is_call (bool): True for a call, false for a put.
+            S (Any): The current asset price.
+            K (float): The option strike price
+            T (Any): The time to maturity of the option in years.
+            r (Any): The risk free rate.
+            b (Any): The cost of carry of the asset.
+            v (Any): The volatility of the asset.
+            n (int): The number of the steps in the tree.
+
+        Raises:
+            TypeError: For hyper-dual numbers, as a tree has no useful second
+                order derivatives.
+
+        Returns:
+            Any: The price of the option.
+        """
+        _, u, d, p, df = self.tree_parameters(m, T, r, b, v, n)
+        inputs = (S, u, d, p, df)
+
+        if any(isinstance(x, HyperDual) for x in inputs):
+            raise TypeError(
+                "The price of a tree is piecewise linear in the asset price, "
+                "so a tree has no second order derivatives"
+            )
+
+        duals = [x for x in inputs if isinstance(x, Dual)]
+        if not duals:
+            value, *_ = backward_induction(
+                is_european, is_call, S, K, u, d, p, df, n
+            )
+            return value
+
+        size = len(duals[0].gradient)
+        gradients = [
+            x.gradient if isinstance(x, Dual) else (0.0,) * size
+            for x in inputs
+        ]
+        S, u, d, p, df = (m.real(x) for x in inputs)
+
+        gradient: List[float] = []
+        for i in range(0, size, 2):
+            dS, du, dd, dp, ddf = (complex(*g[i:i+2]) for g in gradients)
+            value, _, _, derivative = backward_induction_derivative(
+                is_european, is_call, S, K, u, d, p, df, n, du, dd, dp, ddf,
+                dS=dS
+            )
+            derivative = complex(derivative)
+            gradient += [derivative.real, derivative.imag][:size - i]
+
+        return Dual(value, tuple(gradient))
+
+
+KERNELS: Dict[Callable[..., float], Kernel] = {
+    gbs.price: gbs.price_kernel,
+    bs1993.price: bs1993.price_kernel,
+    bs2002.price: bs2002.price_kernel,
+    baw.price: baw.price_kernel,
+    crr.price: TreeKernel(crr.tree_parameters),
+    jr.price: TreeKernel(jr.tree_parameters),
+}
+"""The kernels of the pricing functions of the models."""
+
+
+def kernel(price: Callable[..., float]) -> Kernel:
+    """Find the kernel of the pricing function of a model.
+
+    Args:
+        price (Callable[..., float]): The pricing function, such as
+            `bjerksund_stensland_2002.price`.
+
+    Raises:
+        TypeError: If the function has no kernel.
+
+    Returns:
+        Kernel: The kernel.
+    """
+    kernel_ = KERNELS.get(price)
+    if kernel_ is not None:
+        return kernel_
+    if getattr(price, '__module__', '').startswith('jetblack_options.trees.'):
+        raise TypeError(
+            f"{price!r} is a tree without a kernel, whose greeks are taken "
+            f"from the lattice by the all_greeks function of the "
+            f"Leisen-Reimer and trinomial trees"
+        )
+    raise TypeError(f"{price!r} has no differentiable kernel")
@@ -0,0 +1,205 @@
+"""Batch pricing across worker processes.
+
+The trees and the American approximations are pure Python, so they are
+bound by the interpreter and threads do not run them in parallel. The
+`BatchEngine` spreads a book of contracts across a pool of worker
+processes instead.
+
+The cost of a contract varies widely: a tree with $n$ steps values of the
+order of $n^2$ nodes, while an approximation costs about the same as a small
+tree. Splitting the book into equal numbers of contracts would leave some
+workers idle while others finish the large trees, so the contracts are
+grouped into chunks of roughly equal cost. There are several chunks for
+each worker, so a worker which finishes early takes another chunk.
+
+The pool is created on first use and kept, so the workers are warm on later
+calls: their modules are imported, and caches such as the critical prices of
+the Barone-Adesi and Whaley approximation are kept.
+
+Each contract is a pricing function and its arguments. The function must be
+picklable, such as a module level function or a
+`jetblack_options.pricers.Pricer`. The number of steps of a tree is found by
+binding the arguments to the signature of the pricing function, so it may be
+held fixed by the pricer or passed with the arguments.
+"""
+
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from heapq import heapify, heapreplace
+from inspect import signature
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+Task = Tuple[Callable[..., Any], Sequence[Any]]
+
+APPROXIMATION_COST = 1000.0
+"""The cost of a contract which is not priced with a tree, in tree nodes."""
+
+
+def task_steps(task: Task) -> Optional[int]:
+    """Find the number of steps of a tree.
+
+    The arguments of the task, with those held fixed by any partial
+    application such as a `jetblack_options.pricers.Pricer`, are bound to
+    the signature of the pricing function, and the number of steps is the
+    argument named `n`.
+
+    Args:
+        task (Task): The pricing function and its arguments.
+
+    Returns:
+        Optional[int]: The number of steps, or None if the function is not a
+            tree or the arguments do not match its signature.
+    """
+    func, args = task
+    keywords: Dict[str, Any] = {}
+    while isinstance(func, partial):
+        args = (*func.args, *args)
+        keywords = {**func.keywords, **keywords}
+        func = func.func
+
+    try:
+        bound = signature(func).bind(*args, **keywords)
+    except (TypeError, ValueError):
+        return None
+    bound.apply_defaults()
+    n = bound.arguments.get('n')
+    return n if isinstance(n, int) else None
+
+
+def task_cost(task: Task) -> float:
+    """Estimate the relative cost of a contract.
+
+    A tree, such as `cox_ross_rubinstein.price` with its arguments or
+    `Pricer(cox_ross_rubinstein.price, False, True, n=200)`, costs the
+    square of the number of steps. Any other function is given the cost of
+    an approximation.
+
+    Args:
+        task (Task): The pricing function and its arguments.
+
+    Returns:
+        float: The estimated cost.
+    """
+    n = task_steps(task)
+    return float(n * n) if n else APPROXIMATION_COST
+
+
+def balanced_chunks(costs: Sequence[float], count: int) -> List[List[int]]:
+    """Split tasks into chunks of roughly equal total cost.
+
+    The tasks are taken from the most to the least costly, and each is added
+    to the chunk with the lowest total cost so far.
+
+    Args:
+        costs (Sequence[float]): The cost of each task.
+        count (int): The largest number of chunks.
+
+    Returns:
+        List[List[int]]: The indices of the tasks in each chunk, with no
+            empty chunks.
+    """
+    count = max(1, min(count, len(costs)))
+    chunks: List[List[int]] = [[] for _ in range(count)]
+    # The total cost and the index of each chunk.
+    loads = [(0.0, i) for i in range(count)]
+    heapify(loads)
+    order = sorted(range(len(costs)), key=costs.__getitem__, reverse=True)
+    for index in order:
+        load, i = loads[0]
+        chunks[i].append(index)
+        heapreplace(loads, (load + costs[index], i))
+    return [chunk for chunk in chunks if chunk]
+
+
+def _evaluate_chunk(
+        chunk: List[Tuple[int, Callable[..., Any], Sequence[Any]]]
+) -> List[Tuple[int, Any]]:
+    return [(index, func(*args)) for index, func, args in chunk]
+
+
+class BatchEngine:
+    """Price books of contracts on a pool of worker processes.
+
+    The engine can be used as a context manager, which shuts down the pool
+    on exit.
+    """
+
+    def __init__(
+            self,
+            max_workers: Optional[int] = None,
+            *,
+            chunks_per_worker: int = 4,
+            cost: Callable[[Task], float] = task_cost
+    ) -> None:
+        """Initialise the engine.
+
+        Args:
+            max_workers (Optional[int], optional): The number of worker
+                processes. Defaults to None, for the number of processors.
+            chunks_per_worker (int, optional): The number of chunks the book
+                is split into for each worker. Defaults to 4.
+            cost (Callable[[Task], float], optional): A function estimating
+                the relative cost of a contract from its pricing function
+                and arguments. Defaults to `task_cost`.
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.chunks_per_worker = chunks_per_worker
+        self.cost = cost
+        self._executor: Optional[Executor] = None
+
+    def evaluate(self, tasks: Iterable[Task]) -> List[Any]:
+        """Evaluate a book of contracts.
+
+        Args:
+            tasks (Iterable[Task]): The pricing function and the arguments of
+                each contract.
+
+        Returns:
+            List[Any]: The results, in the order of the tasks.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return []
+
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(self.max_workers)
+
+        chunks = balanced_chunks(
+            [self.cost(task) for task in tasks],
+            self.max_workers * self.chunks_per_worker
+        )
+        futures = [
+            self._executor.submit(
+                _evaluate_chunk,
+                [(index, *tasks[index]) for index in chunk]
+            )
+            for chunk in chunks
+        ]
+
+        results: List[Any] = [None] * len(tasks)
+        for future in futures:
+            for index, result in future.result():
+                results[index] = result
+        return results
+
+    def shutdown(self) -> None:
+        """Shut down the worker processes."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'BatchEngine':
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
@@ -0,0 +1,88 @@
+r"""Functions for complex step differentiation.
+
+For an analytic function the derivative can be found from a single
+evaluation with a small imaginary step,
+
+$$
+f'(x) = \frac{\Im f(x + i h)}{h}
+$$
+
+As there is no subtraction there is no cancellation error, so the step can
+be tiny and the derivative is accurate to machine precision.
+
+The pricing formulae need the exponential, logarithm and square root, which
+are provided for complex numbers by `cmath`, and the normal distribution
+functions, which are not. As the step is tiny the first order term of the
+Taylor series of a distribution function is exact, and this is used here.
+
+The functions are collected in `COMPLEX_MATH`, with which the pricing
+kernels of the models give the complex prices.
+"""
+
+from cmath import asin, exp, log, sin, sqrt
+
+from .distributions import MathNamespace, cdf as real_cdf, pdf as real_pdf
+
+STEP = 1e-20
+"""The size of the imaginary step."""
+
+__all__ = [
+    'COMPLEX_MATH',
+    'STEP',
+    'asin',
+    'cdf',
+    'exp',
+    'log',
+    'pdf',
+    'real',
+    'sin',
+    'sqrt'
+]
+
+
+def cdf(z: complex) -> complex:
+    """The standard normal cumulative distribution function for a point
+    a tiny imaginary step from the real line.
+
+    Args:
+        z (complex): The value, with an imaginary part of the order of the
+            step.
+
+    Returns:
+        complex: The probability, with the derivative along the step as the
+            imaginary part.
+    """
+    return complex(real_cdf(z.real), real_pdf(z.real) * z.imag)
+
+
+def pdf(z: complex) -> complex:
+    """The standard normal probability density function for a point a tiny
+    imaginary step from the real line.
+
+    Args:
+        z (complex): The value, with an imaginary part of the order of the
+            step.
+
+    Returns:
+        complex: The density, with the derivative along the step as the
+            imaginary part.
+    """
+    x = z.real
+    density = real_pdf(x)
+    return complex(density, -x * density * z.imag)
+
+
+def real(z: complex) -> float:
+    """The real part, which is the unperturbed value.
+
+    Args:
+        z (complex): The value.
+
+    Returns:
+        float: The real part.
+    """
+    return z.real
+
+
+COMPLEX_MATH = MathNamespace(exp, log, sqrt, sin, asin, cdf, pdf, real)
+"""The functions for complex numbers a tiny step from the real line."""
@@ -1,12 +1,89 @@
 """Distributions"""
 
-from math import asin, exp, log, nan, pi, sin, sqrt
+import math
+from math import erfc, exp, log, nan, pi, sqrt
 from statistics import NormalDist
+from typing import Any, Callable, NamedTuple, Tuple
 
 NORMAL_DIST = NormalDist()
 PDF = NORMAL_DIST.pdf
 CDF = NORMAL_DIST.cdf
 INV_CDF = NORMAL_DIST.inv_cdf
+
+SQRT_2 = sqrt(2)
+INV_SQRT_2PI = 1 / sqrt(2 * pi)
+
+
+def cdf(x: float) -> float:
+    """The standard normal cumulative distribution function.
+
+    This gives the same results as `NormalDist().cdf` without the overhead of
+    the method call and the normalisation by the mean and standard deviation.
+    The complementary error function keeps its relative precision in the
+    lower tail.
+
+    Args:
+        x (float): The value.
+
+    Returns:
+        float: The probability of a value less than or equal to x.
+    """
+    return 0.5 * erfc(-x / SQRT_2)
+
+
+def pdf(x: float) -> float:
+    """The standard normal probability density function.
+
+    Args:
+        x (float): The value.
+
+    Returns:
+        float: The density at x.
+    """
+    return INV_SQRT_2PI * exp(-x * x / 2)
+
+
+inv_cdf = INV_CDF
+
+
+class MathNamespace(NamedTuple):
+    """The mathematical functions used by the pricing kernels.
+
+    A pricing kernel takes the functions as its first argument, so the same
+    formula can be evaluated with floats, or with numbers which carry their
+    derivatives.
+    """
+
+    exp: Callable[[Any], Any]
+    """The exponential function."""
+    log: Callable[[Any], Any]
+    """The natural logarithm."""
+    sqrt: Callable[[Any], Any]
+    """The square root."""
+    sin: Callable[[Any], Any]
+    """The sine function."""
+    asin: Callable[[Any], Any]
+    """The inverse sine function."""
+    cdf: Callable[[Any], Any]
+    """The standard normal cumulative distribution function."""
+    pdf: Callable[[Any], Any]
+    """The standard normal probability density function."""
+    real: Callable[[Any], float]
+    """The real value, which the branches of a kernel compare, as complex
+    numbers cannot be ordered."""
+
+
+FLOAT_MATH = MathNamespace(
+    math.exp,
+    math.log,
+    math.sqrt,
+    math.sin,
+    math.asin,
+    cdf,
+    pdf,
+    float
+)
+"""The functions for floats."""
                                                                                          
 # The normal distribution function
 def ND(x: float) -> float:
@@ -19,7 +96,7 @@ def CND(x: float)-> float:
     
     y = abs(x)
     if y > 37:
-        return 0
+        c = 0.0
     else:
         e = exp(-y ** 2 / 2)
         if y < 7.07106781186547:
@@ -117,8 +194,75 @@ def CHIINV(p: float, df: int) -> float:
 
     return x
 
-# The cumulative bivariate normal distribution function
-def CBND(x: float, y: float, rho: float) -> float:
+
+# The Gauss-Legendre weights and abscissae used by CBND. More points are used
+# for larger correlations.
+CBND_W_3 = (
+    0.17132449237917,
+    0.360761573048138,
+    0.46791393457269
+)
+CBND_XX_3 = (
+    -0.932469514203152,
+    -0.661209386466265,
+    -0.238619186083197
+)
+CBND_W_6 = (
+    4.71753363865118E-02,
+    0.106939325995318,
+    0.160078328543346,
+    0.203167426723066,
+    0.233492536538355,
+    0.249147045813403
+)
+CBND_XX_6 = (
+    -0.981560634246719,
+    -0.904117256370475,
+    -0.769902674194305,
+    -0.587317954286617,
+    -0.36783149899818,
+    -0.125233408511469
+)
+CBND_W_10 = (
+    1.76140071391521E-02,
+    4.06014298003869E-02,
+    6.26720483341091E-02,
+    8.32767415767048E-02,
+    0.10193011981724,
+    0.118194531961518,
+    0.131688638449177,
+    0.142096109318382,
+    0.149172986472604,
+    0.152753387130726,
+)
+CBND_XX_10 = (
+    -0.993128599185095,
+    -0.963971927277914,
+    -0.912234428251326,
+    -0.839116971822219,
+    -0.746331906460151,
+    -0.636053680726515,
+    -0.510867001950827,
+    -0.37370608871542,
+    -0.227785851141645,
+    -7.65265211334973E-02
+)
+
+
+def cbnd(m: MathNamespace, x: Any, y: Any, rho: Any) -> Any:
+    """The kernel of the cumulative bivariate normal distribution function.
+
+    This is `CBND` written against a `MathNamespace`.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        x (Any): The first upper limit.
+        y (Any): The second upper limit.
+        rho (Any): The correlation.
+
+    Returns:
+        Any: The probability.
+    """
     #     A function for computing bivariate normal probabilities.
     #
     #       Alan Genz
@@ -134,108 +278,67 @@ def CBND(x: float, y: float, rho: float) -> float:
     #    with major modifications for double precision, and for |R| close to 1.
     #   This code was originally translated into VBA by Graeme West
 
+    W: Tuple[float, ...]
+    XX: Tuple[float, ...]
     if abs(rho) < 0.3:
-        W = [
-            0.17132449237917,
-            0.360761573048138,
-            0.46791393457269
-        ]
-        XX = [
-            -0.932469514203152,
-            -0.661209386466265,
-            -0.238619186083197
-        ]
+        W, XX = CBND_W_3, CBND_XX_3
     elif abs(rho) < 0.75:
-        W = [
-            4.71753363865118E-02,
-            0.106939325995318,
-            0.160078328543346,
-            0.203167426723066,
-            0.233492536538355,
-            0.249147045813403
-        ]
-        XX = [
-            -0.981560634246719,
-            -0.904117256370475,
-            -0.769902674194305,
-            -0.587317954286617,
-            -0.36783149899818,
-            -0.125233408511469
-        ]
+        W, XX = CBND_W_6, CBND_XX_6
     else:
-        W = [
-            1.76140071391521E-02,
-            4.06014298003869E-02,
-            6.26720483341091E-02,
-            8.32767415767048E-02,
-            0.10193011981724,
-            0.118194531961518,
-            0.131688638449177,
-            0.142096109318382,
-            0.149172986472604,
-            0.152753387130726,
-        ]
-        XX = [
-            -0.993128599185095,
-            -0.963971927277914,
-            -0.912234428251326,
-            -0.839116971822219,
-            -0.746331906460151,
-            -0.636053680726515,
-            -0.510867001950827,
-            -0.37370608871542,
-            -0.227785851141645,
-            -7.65265211334973E-02
-        ]
-          
+        W, XX = CBND_W_10, CBND_XX_10
+
     h = -x
     k = -y
     hk = h * k
-    BVN = 0.0
-          
+    BVN: Any = 0.0
+
     if abs(rho) < 0.925:
         if abs(rho) > 0:
             hs = (h * h + k * k) / 2
-            asr = asin(rho)
+            asr = m.asin(rho)
             for i in range(len(W)):
                 for ISs in (-1, 1):
-                    sn = sin(asr * (ISs * XX[i] + 1) / 2)
-                    BVN = BVN + W[i] * exp((sn * hk - hs) / (1 - sn * sn))
+                    sn = m.sin(asr * (ISs * XX[i] + 1) / 2)
+                    BVN = BVN + W[i] * m.exp((sn * hk - hs) / (1 - sn * sn))
             BVN = BVN * asr / (4 * pi)
-        BVN = BVN + CND(-h) * CND(-k)
+        BVN = BVN + m.cdf(-h) * m.cdf(-k)
     else:
         if rho < 0:
             k = -k
             hk = -hk
         if abs(rho) < 1:
             Ass = (1 - rho) * (1 + rho)
-            A = sqrt(Ass)
+            A = m.sqrt(Ass)
             bs = (h - k) ** 2
             c = (4 - hk) / 8
             d = (12 - hk) / 16
             asr = -(bs / Ass + hk) / 2
             if asr > -100:
-                BVN = A * exp(asr) * (1 - c * (bs - Ass) * (1 - d * bs / 5) / 3 + c * d * Ass * Ass / 5)
+                BVN = A * m.exp(asr) * (1 - c * (bs - Ass) * (1 - d * bs / 5) / 3 + c * d * Ass * Ass / 5)
             if -hk < 100:
-                b = sqrt(bs)
-                BVN = BVN - exp(-hk / 2) * sqrt(2 * pi) * CND(-b / A) * b * (1 - c * bs * (1 - d * bs / 5) / 3)
+                b = m.sqrt(bs)
+                BVN = BVN - m.exp(-hk / 2) * sqrt(2 * pi) * m.cdf(-b / A) * b * (1 - c * bs * (1 - d * bs / 5) / 3)
             A = A / 2
             for i in range(len(W)):
                 for ISs in (-1, 1):
                     xs = (A * (ISs * XX[i] + 1)) ** 2
-                    rs = sqrt(1 - xs)
+                    rs = m.sqrt(1 - xs)
                     asr = -(bs / xs + hk) / 2
                     if asr > -100:
-                        BVN = BVN + A * W[i] * exp(asr) * (
-                            exp(-hk * (1 - rs) / (2 * (1 + rs))) / rs -
+                        BVN = BVN + A * W[i] * m.exp(asr) * (
+                            m.exp(-hk * (1 - rs) / (2 * (1 + rs))) / rs -
                             (1 + c * xs * (1 + d * xs))
                         )
             BVN = -BVN / (2 * pi)
         if rho > 0:
-            BVN = BVN + CND(-max(h, k))
+            BVN = BVN + m.cdf(-max(h, k))
         else:
             BVN = -BVN
             if k > h:
-                BVN = BVN + CND(k) - CND(h)
+                BVN = BVN + m.cdf(k) - m.cdf(h)
     return BVN
 
+
+# The cumulative bivariate normal distribution function
+def CBND(x: float, y: float, rho: float) -> float:
+    return cbnd(FLOAT_MATH, x, y, rho)
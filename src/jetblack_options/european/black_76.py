@@ -28,14 +28,53 @@ $$
 """
 
 from math import exp, log, sqrt
-from statistics import NormalDist
-
-from ..implied_volatility import solve_ivol
+from typing import Any
+
+from ..distributions import FLOAT_MATH, MathNamespace, cdf, pdf
+from ..implied_volatility import (
+    IVolMethod,
+    inflection_vol,
+    solve_ivol,
+    solve_ivol_newton
+)
+from .normalised_black import normalised_ivol
+from ..complex_step import COMPLEX_MATH
+from ..greeks import Greeks
 from ..numeric_greeks.without_carry import NumericGreeks
+from ..pricers import Pricer
 
-norm = NormalDist()
-cdf = norm.cdf
-pdf = norm.pdf
+
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        F: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        v: Any,
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        F (Any): The price of the future.
+        K (Any): The strike price.
+        T (Any): The time to expiry in years.
+        r (Any): The risk free rate.
+        v (Any): The asset volatility.
+
+    Returns:
+        Any: The option price.
+    """
+
+    d1 = (m.log(F / K) + (v ** 2 / 2) * T) / (v * m.sqrt(T))
+    d2 = d1 - v * m.sqrt(T)
+    if is_call:
+        return m.exp(-r * T) * (F * m.cdf(d1) - K * m.cdf(d2))
+    else:
+        return m.exp(-r * T) * (K * m.cdf(-d2) - F * m.cdf(-d1))
 
 
 def price(
@@ -71,13 +110,32 @@ def price(
     Returns:
         float: The option price.
     """
+    return price_kernel(FLOAT_MATH, is_call, F, K, T, r, v)
 
-    d1 = (log(F / K) + (v ** 2 / 2) * T) / (v * sqrt(T))
-    d2 = d1 - v * sqrt(T)
-    if is_call:
-        return exp(-r * T) * (F * cdf(d1) - K * cdf(d2))
-    else:
-        return exp(-r * T) * (K * cdf(-d2) - F * cdf(-d1))
+
+def complex_price(
+        is_call: bool,
+        F: complex,
+        K: complex,
+        T: complex,
+        r: complex,
+        v: complex,
+) -> complex:
+    """The Black 76 price for complex arguments, for complex step
+    differentiation.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        F (complex): The price of the future.
+        K (complex): The strike price.
+        T (complex): The time to expiry in years.
+        r (complex): The risk free rate.
+        v (complex): The asset volatility.
+
+    Returns:
+        complex: The price of the option.
+    """
+    return price_kernel(COMPLEX_MATH, is_call, F, K, T, r, v)
 
 
 def ivol(
@@ -89,7 +147,8 @@ def ivol(
         p: float,
         *,
         max_iterations: int = 20,
-        epsilon=1e-8
+        epsilon=1e-8,
+        method: IVolMethod = 'regula_falsi'
 ) -> float:
     r"""Calculate the volatility of a Black 76 option that is implied by the price.
 
@@ -103,15 +162,93 @@ def ivol(
         max_iterations (int, Optional): The maximum number of iterations before
             a price is returned. Defaults to 20.
         epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+        method (IVolMethod, Optional): The solver. 'regula_falsi' brackets the
+            volatility. 'newton' uses the analytic vega, and 'halley' also
+            uses the vomma. 'rational' inverts the normalised Black price
+            to near machine precision, and ignores the iteration limit and
+            tolerance. Defaults to 'regula_falsi'.
 
     Returns:
         float: The implied volatility.
     """
-    return solve_ivol(
-        p,
-        lambda v: price(is_call, F, K, T, r, v),
-        max_iterations=max_iterations,
-        epsilon=epsilon
+    if method == 'regula_falsi':
+        return solve_ivol(
+            p,
+            Pricer(price, is_call, F, K, T, r),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'newton' or method == 'halley':
+        return solve_ivol_newton(
+            p,
+            Pricer(price, is_call, F, K, T, r),
+            Pricer(vega, F, K, T, r),
+            inflection_vol(log(F / K), T),
+            vomma=(
+                Pricer(vomma, F, K, T, r) if method == 'halley'
+                else None
+            ),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'rational':
+        s = normalised_ivol(
+            p * exp(r * T) / sqrt(F * K),
+            log(F / K),
+            1 if is_call else -1
+        )
+        return s / sqrt(T)
+    else:
+        raise ValueError('Invalid method')
+
+
+def all_greeks(
+        is_call: bool,
+        F: float,
+        K: float,
+        T: float,
+        r: float,
+        v: float,
+) -> Greeks:
+    """Calculate the price and greeks of an option in a single pass.
+
+    The intermediate values shared by the greeks are calculated once, so this
+    is cheaper than calling the individual functions.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        F (float): The current futures price.
+        K (float): The strike price.
+        T (float): The time to expiry in years.
+        r (float): The risk free rate.
+        v (float): The volatility.
+
+    Returns:
+        Greeks: The price and greeks.
+    """
+    sqrt_T = sqrt(T)
+    v_sqrt_T = v * sqrt_T
+    d1 = (log(F / K) + (v ** 2 / 2) * T) / v_sqrt_T
+    d2 = d1 - v_sqrt_T
+
+    w = 1 if is_call else -1
+    df = exp(-r * T)
+    n_d1 = pdf(d1)
+    N_d1 = cdf(w * d1)
+    N_d2 = cdf(w * d2)
+    p = w * df * (F * N_d1 - K * N_d2)
+    dv = F * df * n_d1 * sqrt_T
+
+    return Greeks(
+        price=p,
+        delta=w * df * N_d1,
+        gamma=df * n_d1 / (F * v_sqrt_T),
+        theta=-F * df * n_d1 * v / (2 * sqrt_T) + r * p,
+        vega=dv,
+        rho=-T * p,
+        vanna=-df * n_d1 * d2 / v,
+        charm=df * (n_d1 * d2 / (2 * T) + w * r * N_d1),
+        vomma=dv * d1 * d2 / v,
     )
 
 
@@ -125,12 +262,10 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(S: float, K: float, T: float, r: float, b: float) -> float:
-        return price(is_call, S, K, T, r, b)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(
+        Pricer(price, is_call),
+        Pricer(complex_price, is_call)
+    )
 
 
 def delta(
@@ -13,14 +13,12 @@ $$
 """
 
 from math import exp, log, sqrt
-from statistics import NormalDist
 
+from ..distributions import cdf, pdf
 from ..implied_volatility import solve_ivol
+from ..greeks import Greeks
 from ..numeric_greeks.without_carry import NumericGreeks
-
-norm = NormalDist()
-cdf = norm.cdf
-pdf = norm.pdf
+from ..pricers import Pricer
 
 
 def price(
@@ -90,12 +88,61 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_call, S, K, T, r, v),
+        Pricer(price, is_call, S, K, T, r),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
 
 
+def all_greeks(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        v: float,
+) -> Greeks:
+    """Calculate the price and greeks of an option in a single pass.
+
+    The intermediate values shared by the greeks are calculated once, so this
+    is cheaper than calling the individual functions.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The asset price.
+        K (float): The strike price.
+        T (float): The time to expiry in years.
+        r (float): The risk free rate.
+        v (float): The asset volatility.
+
+    Returns:
+        Greeks: The price and greeks.
+    """
+    sqrt_T = sqrt(T)
+    v_sqrt_T = v * sqrt_T
+    d1 = (log(S / K) + (r + v ** 2 / 2) * T) / v_sqrt_T
+    d2 = d1 - v_sqrt_T
+
+    w = 1 if is_call else -1
+    df = exp(-r * T)
+    n_d1 = pdf(d1)
+    N_d1 = cdf(w * d1)
+    N_d2 = cdf(w * d2)
+    dv = S * sqrt_T * n_d1
+
+    return Greeks(
+        price=w * (S * N_d1 - K * df * N_d2),
+        delta=w * N_d1,
+        gamma=n_d1 / (S * v_sqrt_T),
+        theta=-S * n_d1 * v / (2 * sqrt_T) - w * r * K * df * N_d2,
+        vega=dv,
+        rho=w * K * T * df * N_d2,
+        vanna=-d2 * n_d1 / v,
+        charm=-n_d1 * (r / v_sqrt_T - d2 / (2 * T)),
+        vomma=dv * d1 * d2 / v,
+    )
+
+
 def make_numeric_greeks(is_call: bool) -> NumericGreeks:
     """Make a class to generate greeks numerically using finite difference methods.
 
@@ -106,12 +153,7 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(S: float, K: float, T: float, r: float, v: float) -> float:
-        return price(is_call, S, K, T, r, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_call))
 
 
 def delta(
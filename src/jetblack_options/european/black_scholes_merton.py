@@ -27,17 +27,57 @@ $$
 """
 
 from math import exp, log, pi, sqrt
-from statistics import NormalDist
-from typing import Literal
-
-from ..implied_volatility import solve_ivol
+from typing import Any, Literal
+
+from ..distributions import FLOAT_MATH, MathNamespace, cdf, pdf, inv_cdf
+from ..implied_volatility import (
+    IVolMethod,
+    inflection_vol,
+    solve_ivol,
+    solve_ivol_newton
+)
+from .normalised_black import normalised_ivol
+from ..complex_step import COMPLEX_MATH
+from ..greeks import Greeks
 from ..numeric_greeks.with_dividend_yield import NumericGreeks
+from ..pricers import Pricer
 
 
-norm = NormalDist()
-cdf = norm.cdf
-pdf = norm.pdf
-inv_cdf = norm.inv_cdf
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        q: Any,
+        v: Any,
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        S (Any): The current asset price.
+        K (Any): The option strike price
+        T (Any): The time to maturity of the option in years.
+        r (Any): The risk free rate.
+        q (Any): The dividend yield.
+        v (Any): The volatility of the asset.
+
+    Returns:
+        Any: The price of the option.
+    """
+
+    d1 = (m.log(S / K) + T * (r - q + v ** 2 / 2)) / (v * m.sqrt(T))
+    d2 = d1 - v * m.sqrt(T)
+
+    F = S * m.exp((r - q) * T)
+    if is_call:
+        return m.exp(-r * T) * (F * m.cdf(d1) - K * m.cdf(d2))
+    else:
+        return m.exp(-r * T) * (K * m.cdf(-d2) - F * m.cdf(-d1))
 
 
 def price(
@@ -67,15 +107,34 @@ def price(
     Returns:
         float: The price of the options.
     """
+    return price_kernel(FLOAT_MATH, is_call, S, K, T, r, q, v)
 
-    d1 = (log(S / K) + T * (r - q + v ** 2 / 2)) / (v * sqrt(T))
-    d2 = d1 - v * sqrt(T)
 
-    F = S * exp((r - q) * T)
-    if is_call:
-        return exp(-r * T) * (F * cdf(d1) - K * cdf(d2))
-    else:
-        return exp(-r * T) * (K * cdf(-d2) - F * cdf(-d1))
+def complex_price(
+        is_call: bool,
+        S: complex,
+        K: complex,
+        T: complex,
+        r: complex,
+        q: complex,
+        v: complex,
+) -> complex:
+    """The Black-Scholes-Merton price for complex arguments, for complex step
+    differentiation.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (complex): The current asset price.
+        K (complex): The option strike price
+        T (complex): The time to maturity of the option in years.
+        r (complex): The risk free rate.
+        q (complex): The dividend yield.
+        v (complex): The volatility of the asset.
+
+    Returns:
+        complex: The price of the option.
+    """
+    return price_kernel(COMPLEX_MATH, is_call, S, K, T, r, q, v)
 
 
 def ivol(
@@ -88,7 +147,8 @@ def ivol(
         p: float,
         *,
         max_iterations: int = 20,
-        epsilon=1e-8
+        epsilon=1e-8,
+        method: IVolMethod = 'regula_falsi'
 ) -> float:
     """Calculate the volatility of an option that is implied by the price.
 
@@ -103,15 +163,102 @@ def ivol(
         max_iterations (int, Optional): The maximum number of iterations before
             a price is returned. Defaults to 20.
         epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+        method (IVolMethod, Optional): The solver. 'regula_falsi' brackets the
+            volatility. 'newton' uses the analytic vega, and 'halley' also
+            uses the vomma. 'rational' inverts the normalised Black price
+            to near machine precision, and ignores the iteration limit and
+            tolerance. Defaults to 'regula_falsi'.
 
     Returns:
         float: The implied volatility.
     """
-    return solve_ivol(
-        p,
-        lambda v: price(is_call, S, K, T, r, q, v),
-        max_iterations=max_iterations,
-        epsilon=epsilon
+    if method == 'regula_falsi':
+        return solve_ivol(
+            p,
+            Pricer(price, is_call, S, K, T, r, q),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'newton' or method == 'halley':
+        return solve_ivol_newton(
+            p,
+            Pricer(price, is_call, S, K, T, r, q),
+            Pricer(vega, S, K, T, r, q),
+            inflection_vol(log(S / K) + (r - q) * T, T),
+            vomma=(
+                Pricer(vomma, S, K, T, r, q) if method == 'halley'
+                else None
+            ),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'rational':
+        F = S * exp((r - q) * T)
+        s = normalised_ivol(
+            p * exp(r * T) / sqrt(F * K),
+            log(F / K),
+            1 if is_call else -1
+        )
+        return s / sqrt(T)
+    else:
+        raise ValueError('Invalid method')
+
+
+def all_greeks(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        q: float,
+        v: float,
+) -> Greeks:
+    """Calculate the price and greeks of an option in a single pass.
+
+    The intermediate values shared by the greeks are calculated once, so this
+    is cheaper than calling the individual functions.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        q (float): The dividend yield.
+        v (float): The volatility of the asset.
+
+    Returns:
+        Greeks: The price and greeks.
+    """
+    sqrt_T = sqrt(T)
+    v_sqrt_T = v * sqrt_T
+    d1 = (log(S / K) + T * (r - q + v ** 2 / 2)) / v_sqrt_T
+    d2 = d1 - v_sqrt_T
+
+    w = 1 if is_call else -1
+    df_r = exp(-r * T)
+    df_q = exp(-q * T)
+    n_d1 = pdf(d1)
+    N_d1 = cdf(w * d1)
+    N_d2 = cdf(w * d2)
+    dv = S * df_q * n_d1 * sqrt_T
+
+    return Greeks(
+        price=w * (S * df_q * N_d1 - K * df_r * N_d2),
+        delta=w * df_q * N_d1,
+        gamma=df_q * n_d1 / (S * v_sqrt_T),
+        theta=(
+            -S * df_q * n_d1 * v / (2 * sqrt_T)
+            + w * (q * S * df_q * N_d1 - r * K * df_r * N_d2)
+        ),
+        vega=dv,
+        rho=w * K * T * df_r * N_d2,
+        vanna=-df_q * d2 / v * n_d1,
+        charm=(
+            w * q * df_q * N_d1
+            - df_q * n_d1 * (2 * (r - q) * T - d2 * v_sqrt_T) / (2 * T * v_sqrt_T)
+        ),
+        vomma=dv * d1 * d2 / v,
     )
 
 
@@ -125,12 +272,10 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(S: float, K: float, T: float, r: float, q: float, v: float) -> float:
-        return price(is_call, S, K, T, r, q, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(
+        Pricer(price, is_call),
+        Pricer(complex_price, is_call)
+    )
 
 
 def delta(
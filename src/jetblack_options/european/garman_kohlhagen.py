@@ -34,15 +34,56 @@ $$
 """
 
 from math import exp, log, sqrt
-from statistics import NormalDist
+from typing import Any
 
-from ..implied_volatility import solve_ivol
+from ..distributions import FLOAT_MATH, MathNamespace, cdf, pdf, inv_cdf
+from ..implied_volatility import (
+    IVolMethod,
+    inflection_vol,
+    solve_ivol,
+    solve_ivol_newton
+)
+from .normalised_black import normalised_ivol
+from ..complex_step import COMPLEX_MATH
+from ..greeks import Greeks
 from ..numeric_greeks.with_dividend_yield import NumericGreeks
+from ..pricers import Pricer
 
-norm = NormalDist()
-cdf = norm.cdf
-pdf = norm.pdf
-inv_cdf = norm.inv_cdf
+
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        rf: Any,
+        v: Any,
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        S (Any): The asset price.
+        K (Any): The strike price.
+        T (Any): The time to expiry in years.
+        r (Any): The risk free rate of the base currency.
+        rf (Any): The risk free rate of the quote currency.
+        v (Any): The asset volatility.
+
+    Returns:
+        Any: The price of the option.
+    """
+    # Garman and Kohlhagen (1983) Currency options
+
+    d1 = (m.log(S / K) + (r - rf + v ** 2 / 2) * T) / (v * m.sqrt(T))
+    d2 = d1 - v * m.sqrt(T)
+    if is_call:
+        return S * m.exp(-rf * T) * m.cdf(d1) - K * m.exp(-r * T) * m.cdf(d2)
+    else:
+        return K * m.exp(-r * T) * m.cdf(-d2) - S * m.exp(-rf * T) * m.cdf(-d1)
 
 
 def price(
@@ -68,14 +109,34 @@ def price(
     Returns:
         float: _description_
     """
-    # Garman and Kohlhagen (1983) Currency options
+    return price_kernel(FLOAT_MATH, is_call, S, K, T, r, rf, v)
 
-    d1 = (log(S / K) + (r - rf + v ** 2 / 2) * T) / (v * sqrt(T))
-    d2 = d1 - v * sqrt(T)
-    if is_call:
-        return S * exp(-rf * T) * cdf(d1) - K * exp(-r * T) * cdf(d2)
-    else:
-        return K * exp(-r * T) * cdf(-d2) - S * exp(-rf * T) * cdf(-d1)
+
+def complex_price(
+        is_call: bool,
+        S: complex,
+        K: complex,
+        T: complex,
+        r: complex,
+        rf: complex,
+        v: complex,
+) -> complex:
+    """The Garman and Kohlhagen price for complex arguments, for complex step
+    differentiation.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (complex): The asset price.
+        K (complex): The strike price.
+        T (complex): The time to expiry in years.
+        r (complex): The risk free rate of the base currency.
+        rf (complex): The risk free rate of the quote currency.
+        v (complex): The asset volatility.
+
+    Returns:
+        complex: The price of the option.
+    """
+    return price_kernel(COMPLEX_MATH, is_call, S, K, T, r, rf, v)
 
 
 def ivol(
@@ -88,7 +149,8 @@ def ivol(
         p: float,
         *,
         max_iterations: int = 20,
-        epsilon=1e-8
+        epsilon=1e-8,
+        method: IVolMethod = 'regula_falsi'
 ) -> float:
     """Calculate the volatility of an option that is implied by the price.
 
@@ -103,15 +165,102 @@ def ivol(
         max_iterations (int, Optional): The maximum number of iterations before
             a price is returned. Defaults to 20.
         epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+        method (IVolMethod, Optional): The solver. 'regula_falsi' brackets the
+            volatility. 'newton' uses the analytic vega, and 'halley' also
+            uses the vomma. 'rational' inverts the normalised Black price
+            to near machine precision, and ignores the iteration limit and
+            tolerance. Defaults to 'regula_falsi'.
 
     Returns:
         float: The implied volatility.
     """
-    return solve_ivol(
-        p,
-        lambda v: price(is_call, S, K, T, r, rf, v),
-        max_iterations=max_iterations,
-        epsilon=epsilon
+    if method == 'regula_falsi':
+        return solve_ivol(
+            p,
+            Pricer(price, is_call, S, K, T, r, rf),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'newton' or method == 'halley':
+        return solve_ivol_newton(
+            p,
+            Pricer(price, is_call, S, K, T, r, rf),
+            Pricer(vega, S, K, T, r, rf),
+            inflection_vol(log(S / K) + (r - rf) * T, T),
+            vomma=(
+                Pricer(vomma, S, K, T, r, rf) if method == 'halley'
+                else None
+            ),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'rational':
+        F = S * exp((r - rf) * T)
+        s = normalised_ivol(
+            p * exp(r * T) / sqrt(F * K),
+            log(F / K),
+            1 if is_call else -1
+        )
+        return s / sqrt(T)
+    else:
+        raise ValueError('Invalid method')
+
+
+def all_greeks(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        rf: float,
+        v: float,
+) -> Greeks:
+    """Calculate the price and greeks of an option in a single pass.
+
+    The intermediate values shared by the greeks are calculated once, so this
+    is cheaper than calling the individual functions.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The asset price.
+        K (float): The strike price.
+        T (float): The time to expiry in years.
+        r (float): The risk free rate of the base currency.
+        rf (float): The risk free rate of the quote currency.
+        v (float): The asset volatility.
+
+    Returns:
+        Greeks: The price and greeks.
+    """
+    sqrt_T = sqrt(T)
+    v_sqrt_T = v * sqrt_T
+    d1 = (log(S / K) + (r - rf + v ** 2 / 2) * T) / v_sqrt_T
+    d2 = d1 - v_sqrt_T
+
+    w = 1 if is_call else -1
+    df_r = exp(-r * T)
+    df_rf = exp(-rf * T)
+    n_d1 = pdf(d1)
+    N_d1 = cdf(w * d1)
+    N_d2 = cdf(w * d2)
+    dv = S * df_rf * n_d1 * sqrt_T
+
+    return Greeks(
+        price=w * (S * df_rf * N_d1 - K * df_r * N_d2),
+        delta=w * df_rf * N_d1,
+        gamma=df_rf * n_d1 / (S * v_sqrt_T),
+        theta=(
+            -S * df_rf * n_d1 * v / (2 * sqrt_T)
+            + w * (rf * S * df_rf * N_d1 - r * K * df_r * N_d2)
+        ),
+        vega=dv,
+        rho=w * K * T * df_r * N_d2,
+        vanna=-df_rf * d2 / v * n_d1,
+        charm=(
+            w * rf * df_rf * N_d1
+            - df_rf * n_d1 * (2 * (r - rf) * T - d2 * v_sqrt_T) / (2 * T * v_sqrt_T)
+        ),
+        vomma=dv * d1 * d2 / v,
     )
 
 
@@ -125,16 +274,60 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            rf: float,
-            v: float
-    ) -> float:
-        return price(is_call, S, K, T, r, rf, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(
+        Pricer(price, is_call),
+        Pricer(complex_price, is_call)
+    )
+
+
+def vega(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        rf: float,
+        v: float,
+) -> float:
+    """The sensitivity of the option price to a change in the volatility.
+
+    Args:
+        S (float): The asset price.
+        K (float): The strike price.
+        T (float): The time to expiry in years.
+        r (float): The risk free rate of the base currency.
+        rf (float): The risk free rate of the quote currency.
+        v (float): The asset volatility.
+
+    Returns:
+        float: The vega.
+    """
+    d1 = (log(S / K) + (r - rf + v ** 2 / 2) * T) / (v * sqrt(T))
+    return S * exp(-rf * T) * pdf(d1) * sqrt(T)
+
+
+def vomma(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        rf: float,
+        v: float,
+) -> float:
+    """The second order sensitivity of the option price to the volatility.
+
+    Also known as DvegaDvol.
+
+    Args:
+        S (float): The asset price.
+        K (float): The strike price.
+        T (float): The time to expiry in years.
+        r (float): The risk free rate of the base currency.
+        rf (float): The risk free rate of the quote currency.
+        v (float): The asset volatility.
+
+    Returns:
+        float: The vomma.
+    """
+    d1 = (log(S / K) + (r - rf + v ** 2 / 2) * T) / (v * sqrt(T))
+    d2 = d1 - v * sqrt(T)
+    return vega(S, K, T, r, rf, v) * d1 * d2 / v
@@ -11,16 +11,62 @@ The cost of carry rate (b) is:
 """
 
 from math import exp, log, pi, sqrt
-from statistics import NormalDist
-from typing import Literal
-
-from ..implied_volatility import solve_ivol
+from typing import Any, Literal
+
+from ..distributions import FLOAT_MATH, MathNamespace, cdf, pdf, inv_cdf
+from ..implied_volatility import (
+    IVolMethod,
+    inflection_vol,
+    solve_ivol,
+    solve_ivol_newton
+)
+from .normalised_black import normalised_ivol
+from ..complex_step import COMPLEX_MATH
+from ..greeks import Greeks
 from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+
+
+def price_kernel(
+        m: MathNamespace,
+        is_call: bool,
+        S: Any,
+        K: Any,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any
+) -> Any:
+    """The kernel of the price, written against the mathematical functions,
+    so it can be evaluated with numbers which carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        is_call (bool): True for a call, false for a put.
+        S (Any): The current asset price.
+        K (Any): The option strike price
+        T (Any): The time to expiry of the option in years.
+        r (Any): The risk free rate.
+        b (Any): The cost of carry of the asset.
+        v (Any): The volatility of the asset.
 
-norm = NormalDist()
-cdf = norm.cdf
-pdf = norm.pdf
-inv_cdf = norm.inv_cdf
+    Returns:
+        Any: The price of the option.
+    """
+
+    d1 = (m.log(S / K) + T * (b + v ** 2 / 2)) / (v * m.sqrt(T))
+    d2 = d1 - v * m.sqrt(T)
+
+    if is_call:
+        return (
+            S * m.exp((b - r) * T) * m.cdf(d1)
+            - K * m.exp(-r * T) * m.cdf(d2)
+        )
+    else:
+        return (
+            K * m.exp(-r * T) * m.cdf(-d2)
+            - S * m.exp((b - r) * T) * m.cdf(-d1)
+        )
 
 
 def price(
@@ -46,14 +92,34 @@ def price(
     Returns:
         float: The price of the options.
     """
+    return price_kernel(FLOAT_MATH, is_call, S, K, T, r, b, v)
 
-    d1 = (log(S / K) + T * (b + v ** 2 / 2)) / (v * sqrt(T))
-    d2 = d1 - v * sqrt(T)
 
-    if is_call:
-        return S * exp((b - r) * T) * cdf(d1) - K * exp(-r * T) * cdf(d2)
-    else:
-        return K * exp(-r * T) * cdf(-d2) - S * exp((b - r) * T) * cdf(-d1)
+def complex_price(
+        is_call: bool,
+        S: complex,
+        K: complex,
+        T: complex,
+        r: complex,
+        b: complex,
+        v: complex,
+) -> complex:
+    """The generalised Black-Scholes price for complex arguments, for complex
+    step differentiation.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (complex): The current asset price.
+        K (complex): The option strike price
+        T (complex): The time to expiry of the option in years.
+        r (complex): The risk free rate.
+        b (complex): The cost of carry of the asset.
+        v (complex): The volatility of the asset.
+
+    Returns:
+        complex: The price of the option.
+    """
+    return price_kernel(COMPLEX_MATH, is_call, S, K, T, r, b, v)
 
 
 def ivol(
@@ -66,7 +132,8 @@ def ivol(
         p: float,
         *,
         max_iterations: int = 20,
-        epsilon=1e-8
+        epsilon=1e-8,
+        method: IVolMethod = 'regula_falsi'
 ) -> float:
     """Calculate the volatility of an option that is implied by the price.
 
@@ -81,15 +148,99 @@ def ivol(
         max_iterations (int, Optional): The maximum number of iterations before
             a price is returned. Defaults to 20.
         epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+        method (IVolMethod, Optional): The solver. 'regula_falsi' brackets the
+            volatility. 'newton' uses the analytic vega, and 'halley' also
+            uses the vomma. 'rational' inverts the normalised Black price
+            to near machine precision, and ignores the iteration limit and
+            tolerance. Defaults to 'regula_falsi'.
 
     Returns:
         float: The implied volatility.
     """
-    return solve_ivol(
-        p,
-        lambda v: price(is_call, S, K, T, r, b, v),
-        max_iterations=max_iterations,
-        epsilon=epsilon
+    if method == 'regula_falsi':
+        return solve_ivol(
+            p,
+            Pricer(price, is_call, S, K, T, r, b),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'newton' or method == 'halley':
+        return solve_ivol_newton(
+            p,
+            Pricer(price, is_call, S, K, T, r, b),
+            Pricer(vega, S, K, T, r, b),
+            inflection_vol(log(S / K) + b * T, T),
+            vomma=(
+                Pricer(vomma, S, K, T, r, b) if method == 'halley'
+                else None
+            ),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+    elif method == 'rational':
+        F = S * exp(b * T)
+        s = normalised_ivol(
+            p * exp(r * T) / sqrt(F * K),
+            log(F / K),
+            1 if is_call else -1
+        )
+        return s / sqrt(T)
+    else:
+        raise ValueError('Invalid method')
+
+
+def all_greeks(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+) -> Greeks:
+    """Calculate the price and greeks of an option in a single pass.
+
+    The intermediate values shared by the greeks are calculated once, so this
+    is cheaper than calling the individual functions.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to expiry of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+
+    Returns:
+        Greeks: The price and greeks.
+    """
+    sqrt_T = sqrt(T)
+    v_sqrt_T = v * sqrt_T
+    d1 = (log(S / K) + T * (b + v ** 2 / 2)) / v_sqrt_T
+    d2 = d1 - v_sqrt_T
+
+    w = 1 if is_call else -1
+    df = exp(-r * T)
+    cf = exp((b - r) * T)
+    n_d1 = pdf(d1)
+    N_d1 = cdf(w * d1)
+    N_d2 = cdf(w * d2)
+    dv = S * cf * n_d1 * sqrt_T
+
+    return Greeks(
+        price=w * (S * cf * N_d1 - K * df * N_d2),
+        delta=w * cf * N_d1,
+        gamma=cf * n_d1 / (S * v_sqrt_T),
+        theta=(
+            -S * cf * n_d1 * v / (2 * sqrt_T)
+            - w * ((b - r) * S * cf * N_d1 + r * K * df * N_d2)
+        ),
+        vega=dv,
+        rho=w * T * K * df * N_d2,
+        vanna=-cf * d2 / v * n_d1,
+        charm=-cf * (n_d1 * (b / v_sqrt_T - d2 / (2 * T)) + w * (b - r) * N_d1),
+        vomma=dv * d1 * d2 / v,
     )
 
 
@@ -103,19 +254,10 @@ def make_numeric_greeks(is_call: bool) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_call, S, K, T, r, b, v)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(
+        Pricer(price, is_call),
+        Pricer(complex_price, is_call)
+    )
 
 
 def delta(
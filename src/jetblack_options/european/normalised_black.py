@@ -0,0 +1,160 @@
+r"""Normalised Black prices and their inversion.
+
+The Black (1976) price divided by the discount factor and $\sqrt{FK}$ depends
+only on the log moneyness $x = \ln(F/K)$ and the total volatility
+$s = \sigma\sqrt{T}$.
+
+$$
+b(x, s, \theta) = \theta \left[
+    e^{x/2} \Phi\left(\theta\left(\frac{x}{s} + \frac{s}{2}\right)\right)
+    - e^{-x/2} \Phi\left(\theta\left(\frac{x}{s} - \frac{s}{2}\right)\right)
+\right]
+$$
+
+where $\theta$ is 1 for a call and -1 for a put.
+
+The inversion follows the approach of Jäckel (2015) "Let's Be Rational".
+The price is reduced to an out of the money call, an initial guess is taken
+from the lower or upper branch of the price curve either side of its
+inflection point, and this is refined with third order Householder steps,
+of which two or three are usually enough. On the lower branch the logarithm
+of the price is used as the objective, as the price is exponentially small
+there.
+"""
+
+from math import exp, inf, log, sqrt
+
+from ..distributions import INV_SQRT_2PI, cdf, inv_cdf
+
+
+def normalised_price(x: float, s: float, theta: float) -> float:
+    """The normalised Black price.
+
+    Args:
+        x (float): The log moneyness: log(F / K).
+        s (float): The total volatility: v * sqrt(T).
+        theta (float): 1 for a call, -1 for a put.
+
+    Returns:
+        float: The normalised price.
+    """
+    if s <= 0:
+        return max(theta * (exp(x / 2) - exp(-x / 2)), 0.0)
+    return theta * (
+        exp(x / 2) * cdf(theta * (x / s + s / 2)) -
+        exp(-x / 2) * cdf(theta * (x / s - s / 2))
+    )
+
+
+def normalised_vega(x: float, s: float) -> float:
+    """The derivative of the normalised Black price with respect to the total
+    volatility.
+
+    Args:
+        x (float): The log moneyness: log(F / K).
+        s (float): The total volatility: v * sqrt(T).
+
+    Returns:
+        float: The normalised vega.
+    """
+    return INV_SQRT_2PI * exp(-0.5 * (x * x / (s * s) + s * s / 4))
+
+
+def _householder_step(
+        f: float,
+        f1: float,
+        f2: float,
+        f3: float
+) -> float:
+    nu = -f / f1
+    h2 = f2 / f1
+    h3 = f3 / f1
+    return nu * (1 + 0.5 * nu * h2) / (1 + nu * (h2 + nu * h3 / 6))
+
+
+def normalised_ivol(
+        beta: float,
+        x: float,
+        theta: float,
+        *,
+        max_iterations: int = 10,
+) -> float:
+    """Find the total volatility implied by a normalised Black price.
+
+    Args:
+        beta (float): The normalised price.
+        x (float): The log moneyness: log(F / K).
+        theta (float): 1 for a call, -1 for a put.
+        max_iterations (int, optional): The maximum number of Householder
+            steps. Defaults to 10.
+
+    Raises:
+        ValueError: If the price is outside the no arbitrage bounds.
+
+    Returns:
+        float: The total volatility: v * sqrt(T).
+    """
+    # Remove the intrinsic value, leaving the price of an out of the money
+    # option, and use the symmetry b(x, s, θ) = b(-x, s, -θ) to make it a
+    # call.
+    intrinsic = max(theta * (exp(x / 2) - exp(-x / 2)), 0.0)
+    beta -= intrinsic
+    x = -abs(x)
+
+    b_max = exp(x / 2)
+    if beta < 0 or beta >= b_max:
+        raise ValueError('price out of range')
+    if beta == 0:
+        return 0.0
+    if x == 0:
+        return 2 * inv_cdf(0.5 * (1 + beta))
+
+    s_c = sqrt(-2 * x)
+    b_c = normalised_price(x, s_c, 1)
+    s_t = s_c + (beta - b_c) / normalised_vega(x, s_c)
+
+    # The price is convex below the inflection point and concave above it, so
+    # the chord from the origin and the tangent at the inflection point
+    # bracket the solution.
+    is_lower = beta < b_c
+    if is_lower:
+        s_lo, s_hi = s_c * beta / b_c, min(s_t, s_c)
+        s = sqrt(2 * x * x / (-x - 4 * log(beta / b_c)))
+    else:
+        s_lo, s_hi = max(s_t, s_c), inf
+        s = -2 * inv_cdf((b_max - beta) / (b_max - b_c) * cdf(-s_c / 2))
+    s = min(max(s, s_lo), s_hi)
+
+    for _ in range(max_iterations):
+        b = normalised_price(x, s, 1)
+        if b < beta:
+            s_lo = s
+        else:
+            s_hi = s
+
+        b1 = normalised_vega(x, s)
+        if b1 <= 0:
+            break
+        u = x * x / (s * s * s) - s / 4
+        b2 = b1 * u
+        b3 = b1 * (u * u - 3 * x * x / (s * s * s * s) - 0.25)
+
+        if is_lower and b > 0:
+            # Use the logarithm of the price as the objective.
+            g1 = b1 / b
+            g2 = b2 / b - g1 * g1
+            g3 = b3 / b - 3 * g1 * b2 / b + 2 * g1 * g1 * g1
+            ds = _householder_step(log(b / beta), g1, g2, g3)
+        else:
+            ds = _householder_step(b - beta, b1, b2, b3)
+
+        if not s_lo <= s + ds <= s_hi:
+            # The step has left the bracket, so bisect it.
+            ds = (s_lo + s_hi) / 2 - s if s_hi < inf else s
+        elif abs(ds) <= 1e-6 * s:
+            # The convergence is cubic, so the error after this step is
+            # beyond the precision of the price.
+            return s + ds
+        s += ds
+
+    return s
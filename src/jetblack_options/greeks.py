@@ -0,0 +1,63 @@
+"""The price and greeks of an option"""
+
+from typing import NamedTuple
+
+
+class Greeks(NamedTuple):
+    """The price and first and second order greeks of an option."""
+
+    price: float
+    """The option price."""
+    delta: float
+    """The sensitivity to the asset price."""
+    gamma: float
+    """The second order sensitivity to the asset price."""
+    theta: float
+    """The sensitivity to the passage of time."""
+    vega: float
+    """The sensitivity to the volatility."""
+    rho: float
+    """The sensitivity to the risk free rate."""
+    vanna: float
+    """The sensitivity of the delta to the volatility."""
+    charm: float
+    """The sensitivity of the delta to the passage of time."""
+    vomma: float
+    """The second order sensitivity to the volatility."""
+
+
+class TreeGreeks(NamedTuple):
+    """The price and first order greeks of an option valued with a tree."""
+
+    price: float
+    """The option price."""
+    delta: float
+    """The sensitivity to the asset price."""
+    gamma: float
+    """The second order sensitivity to the asset price."""
+    theta: float
+    """The sensitivity to the passage of time, per day."""
+    vega: float
+    """The sensitivity to the volatility."""
+    rho: float
+    """The sensitivity to the risk free rate, with the cost of carry."""
+
+
+class PriceGradient(NamedTuple):
+    """The price of an option and its derivatives with respect to each of
+    the pricing arguments."""
+
+    price: float
+    """The option price."""
+    dS: float
+    """The derivative with respect to the asset price."""
+    dK: float
+    """The derivative with respect to the strike price."""
+    dT: float
+    """The derivative with respect to the time to expiry."""
+    dr: float
+    """The derivative with respect to the risk free rate alone."""
+    db: float
+    """The derivative with respect to the cost of carry alone."""
+    dv: float
+    """The derivative with respect to the volatility."""
@@ -1,6 +1,9 @@
 """implied volatility"""
 
-from typing import Callable
+from math import inf, isfinite, sqrt
+from typing import Callable, Literal, Optional
+
+IVolMethod = Literal['regula_falsi', 'newton', 'halley', 'rational']
 
 
 def solve_ivol(
@@ -33,3 +36,83 @@ def solve_ivol(
         p1 = price(v)
 
     return v
+
+
+def inflection_vol(x: float, T: float, v_min: float = 0.1) -> float:
+    """The volatility at which the option price has an inflection point.
+
+    The price is convex in the volatility below this point and concave above
+    it, which makes it a good starting point for Newton's method (Manaster and
+    Koehler, 1982). Close to the money the inflection point tends to zero,
+    where the price is concave everywhere, so a minimum is applied.
+
+    Args:
+        x (float): The log moneyness of the forward: log(F / K).
+        T (float): The time to expiry in years.
+        v_min (float, optional): The minimum volatility to return. Defaults
+            to 0.1.
+
+    Returns:
+        float: The volatility.
+    """
+    return max(sqrt(2 * abs(x) / T), v_min)
+
+
+def solve_ivol_newton(
+        p: float,
+        price: Callable[[float], float],
+        vega: Callable[[float], float],
+        v: float,
+        *,
+        vomma: Optional[Callable[[float], float]] = None,
+        max_iterations: int = 20,
+        epsilon=1e-8
+) -> float:
+    """Solve for the implied volatility using the analytic vega.
+
+    Newton's method is used, or Halley's method when the vomma is provided.
+    As the price increases with the volatility, each evaluation narrows a
+    bracket around the solution. A step which leaves the bracket, or which
+    cannot be taken because the vega has vanished, is replaced with a
+    bisection.
+
+    Args:
+        p (float): The option price.
+        price (Callable[[float], float]): The option price for a volatility.
+        vega (Callable[[float], float]): The option vega for a volatility.
+        v (float): The initial volatility.
+        vomma (Optional[Callable[[float], float]], optional): The option vomma
+            for a volatility. If provided Halley's method is used. Defaults to
+            None.
+        max_iterations (int, Optional): The maximum number of iterations before
+            a price is returned. Defaults to 20.
+        epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+
+    Returns:
+        float: The implied volatility.
+    """
+    v_lo = 0.0
+    v_hi = inf
+
+    n = 0
+    p1 = price(v)
+    while abs(p - p1) > epsilon and n < max_iterations:
+        n += 1
+
+        if p1 < p:
+            v_lo = v
+        else:
+            v_hi = v
+
+        dp = vega(v)
+        step = (p - p1) / dp if dp > 0 else inf
+        if vomma is not None and isfinite(step):
+            step /= 1 + 0.5 * step * vomma(v) / dp
+
+        v_next = v + step
+        if not v_lo < v_next < v_hi:
+            v_next = (v_lo + v_hi) / 2 if v_hi < inf else 2 * v
+        v = v_next
+        p1 = price(v)
+
+    return v
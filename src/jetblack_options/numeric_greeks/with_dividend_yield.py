@@ -2,7 +2,10 @@
 methods for the dividend yield style.
 """
 
-from typing import Callable, Literal
+from typing import Callable, Dict, Literal, Optional, Tuple
+
+from ..complex_step import STEP
+from ..greeks import Greeks
 
 OptionValue = Callable[
     [
@@ -15,16 +18,34 @@ OptionValue = Callable[
     ],
     float  # The option price
 ]
-DifferenceMethod = Literal['central', 'forward', 'backward']
+ComplexOptionValue = Callable[
+    [
+        complex,  # Asset price.
+        complex,  # Strike.
+        complex,  # Time to expiry in years.
+        complex,  # Risk free rate.
+        complex,  # Dividend yield.
+        complex  # Asset volatility
+    ],
+    complex  # The option price
+]
+DifferenceMethod = Literal['central', 'forward', 'backward', 'complex']
 
 
 class NumericGreeks:
 
     def __init__(
             self,
-            price: OptionValue
+            price: OptionValue,
+            complex_price: Optional[ComplexOptionValue] = None
     ) -> None:
         self.price = price
+        self.complex_price = complex_price
+
+    def _complex_step(self, *args: complex) -> float:
+        if self.complex_price is None:
+            raise ValueError("The price does not support complex steps")
+        return self.complex_price(*args).imag / STEP
 
     def delta(
             self,
@@ -53,6 +74,8 @@ class NumericGreeks:
                 self.price(S, K, T, r, q, v)
                 - self.price(S - dS, K, T, r, q, v)
             ) / dS
+        elif method == 'complex':
+            return self._complex_step(complex(S, STEP), K, T, r, q, v)
         else:
             raise ValueError("Invalid method")
 
@@ -116,6 +139,8 @@ class NumericGreeks:
                 self.price(S, K, T - dT, r, q, v)
                 - self.price(S, K, T, r, q, v)
             ) / dT
+        elif method == 'complex':
+            return -self._complex_step(S, K, complex(T, STEP), r, q, v)
         else:
             raise ValueError("Invalid method")
 
@@ -146,6 +171,8 @@ class NumericGreeks:
                 self.price(S, K, T, r, q, v)
                 - self.price(S, K, T, r, q, v - dv)
             ) / dv
+        elif method == 'complex':
+            return self._complex_step(S, K, T, r, q, complex(v, STEP))
         else:
             raise ValueError('Invalid method')
 
@@ -176,6 +203,8 @@ class NumericGreeks:
                 self.price(S, K, T, r, q, v)
                 - self.price(S, K, T, r - dr, q, v)
             ) / dr
+        elif method == 'complex':
+            return self._complex_step(S, K, T, complex(r, STEP), q, v)
         else:
             raise ValueError('Invalid method')
 
@@ -206,6 +235,8 @@ class NumericGreeks:
                 self.price(S, K, T, r, q, v)
                 - self.price(S, K, T, r, q - dq, v)
             ) / dq
+        elif method == 'complex':
+            return self._complex_step(S, K, T, r, complex(q, STEP), v)
         else:
             raise ValueError('Invalid method')
 
@@ -452,3 +483,78 @@ class NumericGreeks:
             - 2 * self.price(S, K, T, r, q, v)
             + self.price(S, K - dK, T, r, q, v)
         ) / dK ** 2
+
+    def all(
+            self,
+            S: float,
+            K: float,
+            T: float,
+            r: float,
+            q: float,
+            v: float,
+            *,
+            dS: float = 0.01,
+            dT: float = 1 / 365,
+            dv: float = 0.001,
+            dr: float = 0.001
+    ) -> Greeks:
+        """Calculate the price and the first and second order greeks using
+        central differences.
+
+        The greeks share many of their bumped prices. Each distinct bump is
+        priced once, so the nine values need 17 prices rather than the 23 of
+        the separate methods.
+
+        Args:
+            S (float): The asset price.
+            K (float): The strike price.
+            T (float): The time to expiry in years.
+            r (float): The risk free rate.
+            q (float): The dividend yield.
+            v (float): The asset volatility.
+            dS (float, optional): The change in the asset price. Defaults to 0.01.
+            dT (float, optional): The change in time. Defaults to 1/365.
+            dv (float, optional): The change in volatility. Defaults to 0.001.
+            dr (float, optional): The change in the rate. Defaults to 0.001.
+
+        Returns:
+            Greeks: The price and greeks.
+        """
+        # The prices are keyed by the multiples of the bumps.
+        prices: Dict[Tuple[int, int, int, int], float] = {}
+
+        def price(iS: int = 0, iT: int = 0, ir: int = 0, iv: int = 0) -> float:
+            key = (iS, iT, ir, iv)
+            if key not in prices:
+                prices[key] = self.price(
+                    S + iS * dS,
+                    K,
+                    T + iT * dT,
+                    r + ir * dr,
+                    q,
+                    v + iv * dv
+                )
+            return prices[key]
+
+        value = price()
+        return Greeks(
+            price=value,
+            delta=(price(iS=1) - price(iS=-1)) / (2 * dS),
+            gamma=(price(iS=1) - 2 * value + price(iS=-1)) / dS ** 2,
+            theta=(price(iT=-1) - price(iT=1)) / (2 * dT),
+            vega=(price(iv=1) - price(iv=-1)) / (2 * dv),
+            rho=(price(ir=1) - price(ir=-1)) / (2 * dr),
+            vanna=(
+                price(iS=1, iv=1)
+                - price(iS=1, iv=-1)
+                - price(iS=-1, iv=1)
+                + price(iS=-1, iv=-1)
+            ) / (4 * dS) / dv,
+            charm=(
+                price(iS=1, iT=1)
+                - price(iS=1, iT=-1)
+                - price(iS=-1, iT=1)
+                + price(iS=-1, iT=-1)
+            ) / (4 * dS) / -dT,
+            vomma=(price(iv=1) - 2 * value + price(iv=-1)) / dv ** 2
+        )
@@ -0,0 +1,57 @@
+"""Picklable pricing functions.
+
+The numeric greeks, the implied volatility solvers and the tree
+extrapolation take pricing functions of some of the pricing arguments, with
+the others, such as the option type, held fixed. A `Pricer` holds them
+fixed by partial application of a module level pricing function, rather
+than with a closure or a lambda. It can be pickled and sent to another
+process, and it calls the pricing function without an extra Python frame.
+"""
+
+from functools import partial
+from typing import Any, Callable, Optional
+
+
+class Pricer(partial):
+    """A pricing function with its leading arguments, and optionally some
+    keyword arguments such as the number of steps of a tree, held fixed.
+
+    For example `Pricer(cox_ross_rubinstein.price, False, True, n=100)` is a
+    function of the asset price, strike, time to expiry, risk free rate,
+    cost of carry and volatility, and
+    `Pricer(generalised_black_scholes.price, True, S, K, T, r, b)` is a
+    function of the volatility alone.
+
+    The pricing function must be a module level function for the pricer to
+    be pickled.
+    """
+
+    __slots__ = ()
+
+    def __new__(
+            cls,
+            model: Callable[..., Any],
+            *args: Any,
+            **keywords: Any
+    ) -> 'Pricer':
+        """Make a pricer.
+
+        Args:
+            model (Callable[..., Any]): The pricing function.
+            *args (Any): The leading arguments to hold fixed.
+            **keywords (Any): The keyword arguments to hold fixed.
+
+        Returns:
+            Pricer: The pricer.
+        """
+        return super().__new__(cls, model, *args, **keywords)
+
+    @property
+    def model(self) -> Callable[..., Any]:
+        """The pricing function."""
+        return self.func
+
+    @property
+    def n(self) -> Optional[int]:
+        """The number of the steps of a tree, if it is held fixed."""
+        return self.keywords.get('n')
@@ -0,0 +1,161 @@
+r"""Option valuations using the Binomial Black-Scholes method of Broadie and
+Detemple (1996).
+
+This is a Cox-Ross-Rubinstein binomial tree where the values at the step
+before expiry are given by the Black-Scholes price of a European option with
+a single step to expiry. This smooths the payoff, removing the oscillation
+of the error with the number of steps, so the error decreases as $1/n$ and
+can be extrapolated (BBSR).
+"""
+
+from math import exp, nan, sqrt
+from typing import Tuple
+
+from ..european.generalised_black_scholes import price as bs_price
+from ..pricers import Pricer
+from .lattice import backward_induction
+from .richardson import ExtrapolatedPrice, extrapolate
+
+
+def greeks(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> Tuple[float, float, float, float]:
+    """A Binomial Black-Scholes option pricer returning the price and some
+    greeks.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree, including the
+            Black-Scholes step.
+
+    Returns:
+        Tuple[float, float, float, float]: The price, delta, gamma, theta.
+    """
+    z = 1 if is_call else -1
+
+    dT = T / n
+    u = exp(v * sqrt(dT))
+    d = 1 / u
+    a = exp(b * dT)
+    p = (a - d) / (u - d)
+    df = exp(-r * dT)
+
+    final_value = []
+    for i in range(n):
+        asset = S * u ** i * d ** (n - 1 - i)
+        value = bs_price(is_call, asset, K, dT, r, b, v)
+        if not is_european:
+            value = max(z * (asset - K), value)
+        final_value.append(value)
+
+    value, step_1, step_2 = backward_induction(
+        is_european, is_call, S, K, u, d, p, df, n - 1,
+        final_value=final_value
+    )
+
+    delta = gamma = theta = nan
+
+    if step_2 is not None:
+        gamma = (
+            (step_2[2] - step_2[1]) / (S * u ** 2 - S)
+            - (step_2[1] - step_2[0]) / (S - S * d ** 2)
+        ) / (0.5 * (S * u ** 2 - S * d ** 2))
+        theta = step_2[1]
+
+    if step_1 is not None:
+        delta = (step_1[1] - step_1[0]) / (S * u - S * d)
+
+    theta = (theta - value) / (2 * dT) / 365
+
+    return value, delta, gamma, theta
+
+
+def price(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> float:
+    """Calculate the price of an option using the Binomial Black-Scholes
+    method.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree, including the
+            Black-Scholes step.
+
+    Returns:
+        float: The price of the option.
+    """
+    p, *_ = greeks(is_european, is_call, S, K, T, r, b, v, n)
+    return p
+
+
+def extrapolated_price(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> ExtrapolatedPrice:
+    """Calculate the price of an option using the Binomial Black-Scholes
+    method with Richardson extrapolation (BBSR).
+
+    The prices of trees with n // 2 and n steps are extrapolated.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the larger tree.
+
+    Raises:
+        ValueError: If there are fewer than two steps.
+
+    Returns:
+        ExtrapolatedPrice: The price and an error estimate.
+    """
+    if n < 2:
+        raise ValueError("The number of steps must be at least 2")
+
+    return extrapolate(
+        Pricer(price, is_european, is_call, S, K, T, r, b, v),
+        n // 2,
+        n
+    )
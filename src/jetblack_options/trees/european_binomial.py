@@ -1,10 +1,51 @@
 """Optional valuation with a European binomial implementation.
 """
 
-from math import comb, exp, log, sqrt
+from math import exp, floor, fsum, log, sqrt
+from typing import List
 
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+
+
+def binomial_weights(n: int, p: float) -> List[float]:
+    """The probabilities of reaching each node at the final step of a
+    binomial tree.
+
+    The probability of j up moves is $C(n, j) p^j (1 - p)^{n-j}$. Rather
+    than forming the binomial coefficients and powers, which overflow for
+    large n, the weights are found from the ratio of neighbouring weights,
+    (n - j) / (j + 1) * p / (1 - p), moving out from the most likely node,
+    and are then scaled to sum to one. The weights fall away from the most
+    likely node, so they cannot overflow, and those too small to represent
+    are zero.
+
+    Args:
+        n (int): The number of the steps in the tree.
+        p (float): The probability of an up move.
+
+    Raises:
+        ValueError: If the probability is not between 0 and 1.
+
+    Returns:
+        List[float]: The weights, for 0 to n up moves.
+    """
+    if not 0 < p < 1:
+        raise ValueError("The probability of an up move must be in (0, 1)")
+
+    odds = p / (1 - p)
+    mode = min(floor((n + 1) * p), n)
+
+    weights = [0.0] * (n + 1)
+    weights[mode] = 1.0
+    for j in range(mode, n):
+        weights[j + 1] = weights[j] * (n - j) * odds / (j + 1)
+    for j in range(mode, 0, -1):
+        weights[j - 1] = weights[j] * j / ((n - j + 1) * odds)
+
+    total = fsum(weights)
+    return [w / total for w in weights]
 
 
 def price(
@@ -29,6 +70,9 @@ def price(
         v (float): The volatility of the asset.
         n (int): The number of the steps in the tree.
 
+    Raises:
+        ValueError: If the probability of an up move is not in (0, 1).
+
     Returns:
         float: The price of the option.
     """
@@ -40,17 +84,26 @@ def price(
     p = (a - d) / (u - d)
     A = int(log(K / (S * d ** n)) / log(u / d)) + 1
 
-    sum = 0
+    weights = binomial_weights(n, p)
+
+    # The asset prices of the final nodes are found by moving out from the
+    # node nearest the strike, multiplying by u / d or d / u for each node,
+    # rather than forming the powers for each node.
+    sum = 0.0
     if is_call:
-        for j in range(A, n+1):
-            sum += comb(n, j) * p ** j * (1 - p) ** (n - j) * (
-                S * u ** j * d ** (n - j) - K
-            )
+        start = max(A, 0)
+        asset = S * u ** start * d ** (n - start)
+        ratio = u / d
+        for j in range(start, n+1):
+            sum += weights[j] * (asset - K)
+            asset *= ratio
     else:
-        for j in range(A):
-            sum += comb(n, j) * p ** j * (1 - p) ** (n - j) * (
-                K - S * u ** j * d ** (n - j)
-            )
+        start = min(A, n+1) - 1
+        asset = S * u ** start * d ** (n - start)
+        ratio = d / u
+        for j in range(start, -1, -1):
+            sum += weights[j] * (K - asset)
+            asset *= ratio
 
     return exp(-r * T) * sum
 
@@ -88,7 +141,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_call, S, K, T, r, b, v, n),
+        Pricer(price, is_call, S, K, T, r, b, n=n),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -105,16 +158,4 @@ def make_numeric_greeks(is_call: bool, n: int) -> NumericGreeks:
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_call, S, K, T, r, b, v, n)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_call, n=n))
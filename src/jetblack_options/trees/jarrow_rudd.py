@@ -1,11 +1,47 @@
 """Option valuations using a Jarrow-Rudd binomial pricing tree.
 """
 
-from math import exp, nan, sqrt
-from typing import Tuple
+from math import nan
+from typing import Any, List, Tuple
 
+from ..distributions import FLOAT_MATH, MathNamespace
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+from .lattice import backward_induction
+
+
+def tree_parameters(
+        m: MathNamespace,
+        T: Any,
+        r: Any,
+        b: Any,
+        v: Any,
+        n: int
+) -> Tuple[Any, Any, Any, Any, Any]:
+    """The parameters of a Jarrow-Rudd tree, written against the
+    mathematical functions, so they can be evaluated with numbers which
+    carry their derivatives.
+
+    Args:
+        m (MathNamespace): The mathematical functions.
+        T (Any): The time to maturity of the option in years.
+        r (Any): The risk free rate.
+        b (Any): The cost of carry of the asset.
+        v (Any): The volatility of the asset.
+        n (int): The number of the steps in the tree.
+
+    Returns:
+        Tuple[Any, Any, Any, Any, Any]: The time step, the up and down moves,
+            the probability of an up move and the discount factor of a step.
+    """
+    dT = T / n
+    u = m.exp((b - v ** 2 / 2) * dT + v * m.sqrt(dT))
+    d = m.exp((b - v ** 2 / 2) * dT - v * m.sqrt(dT))
+    p = 0.5
+    df = m.exp(-r * dT)
+
+    return dT, u, d, p, df
 
 
 def greeks(
@@ -35,52 +71,67 @@ def greeks(
     Returns:
         Tuple[float, float, float, float]: The price, delta, gamma, theta.
     """
-    z = 1 if is_call else -1
+    dT, u, d, p, df = tree_parameters(FLOAT_MATH, T, r, b, v, n)
 
-    dT = T / n
-    u = exp((b - v ** 2 / 2) * dT + v * sqrt(dT))
-    d = exp((b - v ** 2 / 2) * dT - v * sqrt(dT))
-    p = 0.5
-    df = exp(-r * dT)
+    value, step_1, step_2 = backward_induction(
+        is_european, is_call, S, K, u, d, p, df, n
+    )
 
-    option_value = [
-        max(0, z * (S * u ** i * d ** (n - i) - K))
-        for i in range(n+1)
+    delta = gamma = theta = nan
 
-    ]
+    if step_2 is not None:
+        gamma = (
+            (step_2[2] - step_2[1]) / (S * u ** 2 - S * u * d)
+            - (step_2[1] - step_2[0]) /
+            (S * u * d - S * d ** 2)
+        ) / (0.5 * (S * u ** 2 - S * d ** 2))
+        theta = step_2[1]
 
-    delta = gamma = theta = nan
+    if step_1 is not None:
+        delta = (step_1[1] - step_1[0]) / (S * u - S * d)
+
+    theta = (theta - value) / (2 * dT) / 365
+
+    return value, delta, gamma, theta
+
+
+def exercise_boundary(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> List[float]:
+    """Find the early exercise boundary of an American option using
+    a Jarrow-Rudd binomial tree.
+
+    The boundary at step j, at time j * T / n, is the asset price of the node
+    closest to the money at which the option is exercised. Where the option
+    is not exercised at a step the boundary is nan.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree.
 
-    for j in range(n-1, -1, -1):
-        for i in range(j+1):
-            if is_european:
-                option_value[i] = (
-                    p * option_value[i + 1]
-                    + (1 - p) * option_value[i]
-                ) * df
-            else:
-                option_value[i] = max(
-                    (z * (S * u ** i * d ** (j - i) - K)),
-                    (
-                        p * option_value[i + 1]
-                        + (1 - p) * option_value[i]
-                    ) * df
-                )
-
-        if j == 2:
-            gamma = (
-                (option_value[2] - option_value[1]) / (S * u ** 2 - S * u * d)
-                - (option_value[1] - option_value[0]) /
-                (S * u * d - S * d ** 2)
-            ) / (0.5 * (S * u ** 2 - S * d ** 2))
-            theta = option_value[1]
-
-        if j == 1:
-            delta = (option_value[1] - option_value[0]) / (S * u - S * d)
-
-    theta = (theta - option_value[0]) / (2 * dT) / 365
-
-    return option_value[0], delta, gamma, theta
+    Returns:
+        List[float]: The exercise boundary for each step.
+    """
+    _, u, d, p, df = tree_parameters(FLOAT_MATH, T, r, b, v, n)
+
+    boundary = [nan] * n
+    backward_induction(
+        False, is_call, S, K, u, d, p, df, n, boundary=boundary
+    )
+    return boundary
 
 
 def price(
@@ -149,7 +200,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_european, is_call, S, K, T, r, b, v, n),
+        Pricer(price, is_european, is_call, S, K, T, r, b, n=n),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -167,16 +218,4 @@ def make_numeric_greeks(is_european: bool, is_call: bool, n: int) -> NumericGree
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_european, is_call, S, K, T, r, b, v, n)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_european, is_call, n=n))
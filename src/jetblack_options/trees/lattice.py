@@ -0,0 +1,427 @@
+"""Backward induction through a recombining binomial tree.
+
+The asset price at node i of step j is $S u^i d^{j-i}$. The powers of the up
+and down moves are calculated once for the whole tree, so no powers are
+taken inside the node loop, and each step is built in a single pass over the
+step after it.
+
+With a tolerance, the tree is pruned. Only the nodes within a band of
+standard deviations of the expected path are valued by induction. The nodes
+at the edges of the band are given the value they would have if the payoff
+were linear beyond them: the discounted forward intrinsic value, or zero.
+For American options the exercise region at each step is assumed to be
+contiguous, so once a node is exercised the nodes further in the money are
+given their intrinsic value without calculating the continuation value.
+"""
+
+from math import ceil, exp, floor, lgamma, log, nan, sqrt
+from typing import List, Optional, Tuple, Union
+
+from ..distributions import inv_cdf
+
+# The derivative along a direction in the tree parameters. A complex number
+# carries two directions, as the real and imaginary parts.
+Tangent = Union[float, complex]
+
+
+def band_width(tolerance: float) -> float:
+    """The number of standard deviations of a band beyond which the
+    probability of reaching a node is less than the tolerance.
+
+    Args:
+        tolerance (float): The probability.
+
+    Returns:
+        float: The number of standard deviations.
+    """
+    return -inv_cdf(tolerance / 2)
+
+
+def backward_induction(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        u: float,
+        d: float,
+        p: float,
+        df: float,
+        n: int,
+        *,
+        boundary: Optional[List[float]] = None,
+        tolerance: Optional[float] = None,
+        final_value: Optional[List[float]] = None
+) -> Tuple[float, Optional[List[float]], Optional[List[float]]]:
+    """Value an option by backward induction through a binomial tree.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        u (float): The up move.
+        d (float): The down move.
+        p (float): The probability of an up move.
+        df (float): The discount factor for a single step.
+        n (int): The number of the steps in the tree.
+        boundary (Optional[List[float]], optional): If provided for an
+            American option, this is filled with the early exercise boundary:
+            the asset price at each step beyond which the option is
+            exercised, or nan if it is not exercised at that step. Defaults
+            to None.
+        tolerance (Optional[float], optional): If provided the tree is
+            pruned to the nodes which are reached with at least this
+            probability. Defaults to None.
+        final_value (Optional[List[float]], optional): The option values at
+            the nodes of the final step. Defaults to None, in which case the
+            payoff is used.
+
+    Returns:
+        Tuple[float, Optional[List[float]], Optional[List[float]]]: The option
+            value, and the option values at the nodes of the first and second
+            steps, or None if the tree does not have that step.
+    """
+    if tolerance is not None:
+        return _pruned_backward_induction(
+            is_european, is_call, S, K, u, d, p, df, n, boundary, tolerance,
+            final_value
+        )
+
+    z = 1 if is_call else -1
+    q = 1 - p
+
+    # The asset price at node i of step j is S_u[i] * d_pow[j - i].
+    S_u = [S * u ** i for i in range(n+1)]
+    d_pow = [d ** i for i in range(n+1)]
+
+    option_value = list(final_value) if final_value is not None else [
+        max(0, z * (S_u[i] * d_pow[n - i] - K))
+        for i in range(n+1)
+    ]
+
+    step_1: Optional[List[float]] = None
+    step_2: Optional[List[float]] = None
+
+    for j in range(n-1, -1, -1):
+        if is_european:
+            option_value = [
+                (p * up + q * down) * df
+                for down, up in zip(option_value, option_value[1:])
+            ]
+        elif boundary is None:
+            option_value = [
+                max(z * (s * dp - K), (p * up + q * down) * df)
+                for s, dp, down, up in zip(
+                    S_u, d_pow[j::-1], option_value, option_value[1:]
+                )
+            ]
+        else:
+            # Record the exercised node closest to the continuation region.
+            exercised: Optional[int] = None
+            for i in range(j+1):
+                exercise = z * (S_u[i] * d_pow[j - i] - K)
+                continuation = (
+                    p * option_value[i + 1] + q * option_value[i]
+                ) * df
+                option_value[i] = max(exercise, continuation)
+                if exercise > continuation and exercise > 0 and (
+                    exercised is None or not is_call
+                ):
+                    exercised = i
+            boundary[j] = (
+                nan if exercised is None
+                else S_u[exercised] * d_pow[j - exercised]
+            )
+
+        if j == 2:
+            step_2 = option_value[:3]
+
+        if j == 1:
+            step_1 = option_value[:2]
+
+    return option_value[0], step_1, step_2
+
+
+def _pruned_backward_induction(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        u: float,
+        d: float,
+        p: float,
+        df: float,
+        n: int,
+        boundary: Optional[List[float]],
+        tolerance: float,
+        final_value: Optional[List[float]]
+) -> Tuple[float, Optional[List[float]], Optional[List[float]]]:
+    z = 1 if is_call else -1
+    q = 1 - p
+
+    S_u = [S * u ** i for i in range(n+1)]
+    d_pow = [d ** i for i in range(n+1)]
+
+    # The forward growth and discount over the remaining steps, for the values
+    # at the edges of the band.
+    g = p * u + q * d
+    g_pow = [g ** i for i in range(n+1)]
+    df_pow = [df ** i for i in range(n+1)]
+
+    def edge_value(i: int, j: int) -> float:
+        asset = S_u[i] * d_pow[j - i]
+        value = max(0, z * (asset * g_pow[n - j] - K) * df_pow[n - j])
+        return value if is_european else max(value, z * (asset - K))
+
+    if not 0 <= p <= 1:
+        raise ValueError(
+            "The probability of an up move must be in [0, 1] to prune the tree"
+        )
+
+    # The number of up moves to node i of step j is binomially distributed.
+    k = band_width(tolerance) * sqrt(p * q)
+
+    option_value = list(final_value) if final_value is not None else [
+        max(0, z * (S_u[i] * d_pow[n - i] - K))
+        for i in range(n+1)
+    ]
+
+    step_1: Optional[List[float]] = None
+    step_2: Optional[List[float]] = None
+
+    for j in range(n-1, -1, -1):
+        if j > 2:
+            lo = max(ceil(j * p - k * sqrt(j)) - 1, 0)
+            hi = min(floor(j * p + k * sqrt(j)) + 1, j)
+        else:
+            lo, hi = 0, j
+
+        if is_european:
+            for i in range(lo, hi + 1):
+                option_value[i] = (
+                    p * option_value[i + 1] + q * option_value[i]
+                ) * df
+        else:
+            # Move from the continuation region towards the exercise region,
+            # which is up the tree for a call and down the tree for a put.
+            exercised: Optional[int] = None
+            if is_call:
+                for i in range(lo, hi + 1):
+                    exercise = z * (S_u[i] * d_pow[j - i] - K)
+                    continuation = (
+                        p * option_value[i + 1] + q * option_value[i]
+                    ) * df
+                    if exercise > continuation and exercise > 0:
+                        exercised = i
+                        break
+                    option_value[i] = continuation
+            else:
+                # Moving down the tree overwrites the node above, so its
+                # value from the next step is kept.
+                up = option_value[hi + 1]
+                for i in range(hi, lo - 1, -1):
+                    down = option_value[i]
+                    exercise = z * (S_u[i] * d_pow[j - i] - K)
+                    continuation = (p * up + q * down) * df
+                    if exercise > continuation and exercise > 0:
+                        exercised = i
+                        break
+                    option_value[i] = continuation
+                    up = down
+
+            if exercised is not None:
+                rest = (
+                    range(exercised, hi + 1) if is_call
+                    else range(lo, exercised + 1)
+                )
+                for i in rest:
+                    option_value[i] = z * (S_u[i] * d_pow[j - i] - K)
+
+            if boundary is not None:
+                boundary[j] = (
+                    nan if exercised is None
+                    else S_u[exercised] * d_pow[j - exercised]
+                )
+
+        if lo > 0:
+            option_value[lo - 1] = edge_value(lo - 1, j)
+        if hi < j:
+            option_value[hi + 1] = edge_value(hi + 1, j)
+
+        if j == 2:
+            step_2 = option_value[:3]
+
+        if j == 1:
+            step_1 = option_value[:2]
+
+    return option_value[0], step_1, step_2
+
+
+def backward_induction_derivative(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        u: float,
+        d: float,
+        p: float,
+        df: float,
+        n: int,
+        du: Tangent,
+        dd: Tangent,
+        dp: Tangent,
+        ddf: Tangent,
+        *,
+        dS: Tangent = 0.0
+) -> Tuple[float, Optional[List[float]], Optional[List[float]], Tangent]:
+    """Value an option by backward induction through a binomial tree, with
+    the derivative of the value along a direction in the tree parameters.
+
+    The derivatives of the tree parameters with respect to a model parameter,
+    such as the volatility, give the derivative of the value with respect to
+    that parameter. The derivatives may be complex numbers, to find the
+    derivatives with respect to two model parameters at once: as the tree is
+    real, the real and imaginary parts do not interact.
+
+    For an American option the derivatives are carried through the backward
+    induction with the values. Where a node is exercised the derivative is
+    that of the payoff. A European option is valued by backward induction,
+    but the derivative is found from the binomial weights of the final
+    nodes.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        u (float): The up move.
+        d (float): The down move.
+        p (float): The probability of an up move.
+        df (float): The discount factor for a single step.
+        n (int): The number of the steps in the tree.
+        du (Tangent): The derivative of the up move.
+        dd (Tangent): The derivative of the down move.
+        dp (Tangent): The derivative of the probability of an up move.
+        ddf (Tangent): The derivative of the discount factor.
+        dS (Tangent, optional): The derivative of the asset price. Defaults
+            to 0.0.
+
+    Returns:
+        Tuple[float, Optional[List[float]], Optional[List[float]], Tangent]:
+            The option value, the option values at the nodes of the first and
+            second steps, or None if the tree does not have that step, and
+            the derivative of the option value.
+    """
+    step_1: Optional[List[float]] = None
+    step_2: Optional[List[float]] = None
+
+    if is_european:
+        value, step_1, step_2 = backward_induction(
+            True, is_call, S, K, u, d, p, df, n
+        )
+        derivative = _european_derivative(
+            is_call, S, K, u, d, p, df, n, du, dd, dp, ddf, dS
+        )
+        return value, step_1, step_2, derivative
+
+    z = 1 if is_call else -1
+    q = 1 - p
+
+    S_u = [S * u ** i for i in range(n+1)]
+    d_pow = [d ** i for i in range(n+1)]
+
+    # The derivative of the asset price at node i of step j is the asset
+    # price multiplied by dS / S + i * du / u + (j - i) * dd / d.
+    dS_S = dS / S
+    du_u = du / u
+    dd_d = dd / d
+    dp_df = dp * df
+    ddf_df = ddf / df
+    p_df = p * df
+    q_df = q * df
+
+    asset = [S_u[i] * d_pow[n - i] for i in range(n+1)]
+    option_value = [max(0, z * (a - K)) for a in asset]
+    tangent: List[Tangent] = [
+        z * a * (dS_S + i * du_u + (n - i) * dd_d) if value > 0 else 0.0
+        for i, (a, value) in enumerate(zip(asset, option_value))
+    ]
+
+    for j in range(n-1, -1, -1):
+        asset = [s * dp for s, dp in zip(S_u, d_pow[j::-1])]
+        continuation = [
+            (p * up + q * down) * df
+            for down, up in zip(option_value, option_value[1:])
+        ]
+        tangent = [
+            z * a * (dS_S + i * du_u + (j - i) * dd_d) if z * (a - K) > c
+            else dp_df * (up - down) + p_df * t_up + q_df * t_down + ddf_df * c
+            for i, (a, c, down, up, t_down, t_up) in enumerate(zip(
+                asset,
+                continuation,
+                option_value,
+                option_value[1:],
+                tangent,
+                tangent[1:]
+            ))
+        ]
+        option_value = [
+            max(z * (a - K), c)
+            for a, c in zip(asset, continuation)
+        ]
+
+        if j == 2:
+            step_2 = option_value[:3]
+
+        if j == 1:
+            step_1 = option_value[:2]
+
+    return option_value[0], step_1, step_2, tangent[0]
+
+
+def _european_derivative(
+        is_call: bool,
+        S: float,
+        K: float,
+        u: float,
+        d: float,
+        p: float,
+        df: float,
+        n: int,
+        du: Tangent,
+        dd: Tangent,
+        dp: Tangent,
+        ddf: Tangent,
+        dS: Tangent
+) -> Tangent:
+    # The value is df^n sum(w_i * payoff_i), with the binomial weights
+    # w_i = C(n, i) p^i q^(n-i) calculated as logarithms to avoid overflow.
+    z = 1 if is_call else -1
+    q = 1 - p
+    log_p, log_q = log(p), log(q)
+    log_n = lgamma(n + 1)
+
+    total = d_total_dp = d_total_du = d_total_dd = d_total_dS = 0.0
+    for i in range(n+1):
+        asset = S * u ** i * d ** (n - i)
+        payoff = z * (asset - K)
+        if payoff <= 0:
+            continue
+        w = exp(
+            log_n - lgamma(i + 1) - lgamma(n - i + 1)
+            + i * log_p + (n - i) * log_q
+        )
+        total += w * payoff
+        d_total_dp += w * payoff * (i / p - (n - i) / q)
+        d_total_du += w * z * asset * i / u
+        d_total_dd += w * z * asset * (n - i) / d
+        d_total_dS += w * z * asset / S
+
+    df_n = df ** n
+    return (
+        df_n * (
+            d_total_dp * dp + d_total_du * du + d_total_dd * dd
+            + d_total_dS * dS
+        )
+        + n * df ** (n - 1) * total * ddf
+    )
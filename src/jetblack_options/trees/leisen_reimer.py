@@ -2,10 +2,20 @@
 """
 
 from math import exp, log, nan, sqrt
-from typing import Literal, Tuple, Union
+from typing import List, Literal, Optional, Tuple, Union
 
+from ..greeks import TreeGreeks
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+from .lattice import backward_induction, backward_induction_derivative
+from .richardson import ExtrapolatedPrice, extrapolate
+
+
+# The change in the volatility and rates used to differentiate the tree
+# parameters. The parameters are smooth, closed form functions, so the
+# differences are accurate to around ten significant figures.
+_PARAMETER_BUMP = 1e-6
 
 
 def _sign(n: Union[float, int]) -> Literal[-1, 0, 1]:
@@ -25,6 +35,39 @@ def _odd(n: int) -> int:
     return n * s
 
 
+def _parameters(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> Tuple[int, float, float, float, float, float]:
+    n = _odd(n)
+
+    d1 = (log(S / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
+    d2 = d1 - v * sqrt(T)
+
+    # Using Preizer-Pratt inversion method 2
+    hd1 = 0.5 + _sign(d1) * (
+        0.25
+        - 0.25 * exp(-(d1 / (n + 1 / 3 + 0.1 / (n + 1))) ** 2 * (n + 1 / 6))
+    ) ** 0.5
+    hd2 = 0.5 + _sign(d2) * (
+        0.25
+        - 0.25 * exp(-(d2 / (n + 1 / 3 + 0.1 / (n + 1))) ** 2 * (n + 1 / 6))
+    ) ** 0.5
+
+    dT = T / n
+    p = hd2
+    u = exp(b * dT) * hd1 / hd2
+    d = (exp(b * dT) - p * u) / (1 - p)
+    df = exp(-r * dT)
+
+    return n, dT, u, d, p, df
+
+
 def greeks(
         is_european: bool,
         is_call: bool,
@@ -52,65 +95,145 @@ def greeks(
     Returns:
         Tuple[float, float, float, float]: The price, delta, gamma, theta.
     """
+    n, dT, u, d, p, df = _parameters(S, K, T, r, b, v, n)
 
-    n = _odd(n)
-    z = 1 if is_call else -1
-
-    d1 = (log(S / K) + (b + v ** 2 / 2) * T) / (v * sqrt(T))
-    d2 = d1 - v * sqrt(T)
+    value, step_1, step_2 = backward_induction(
+        is_european, is_call, S, K, u, d, p, df, n
+    )
 
-    # Using Preizer-Pratt inversion method 2
-    hd1 = 0.5 + _sign(d1) * (
-        0.25
-        - 0.25 * exp(-(d1 / (n + 1 / 3 + 0.1 / (n + 1))) ** 2 * (n + 1 / 6))
-    ) ** 0.5
-    hd2 = 0.5 + _sign(d2) * (
-        0.25
-        - 0.25 * exp(-(d2 / (n + 1 / 3 + 0.1 / (n + 1))) ** 2 * (n + 1 / 6))
-    ) ** 0.5
+    return _lattice_greeks(S, u, d, dT, value, step_1, step_2)
 
-    dT = T / n
-    p = hd2
-    u = exp(b * dT) * hd1 / hd2
-    d = (exp(b * dT) - p * u) / (1 - p)
-    df = exp(-r * dT)
-    option_value = [
-        max(0, z * (S * u ** i * d ** (n - i) - K))
-        for i in range(n+1)
-    ]
 
+def _lattice_greeks(
+        S: float,
+        u: float,
+        d: float,
+        dT: float,
+        value: float,
+        step_1: Optional[List[float]],
+        step_2: Optional[List[float]]
+) -> Tuple[float, float, float, float]:
     delta = gamma = theta = nan
 
-    for j in range(n-1, -1, -1):
-        for i in range(j+1):
-            if is_european:
-                option_value[i] = (
-                    p * option_value[i + 1]
-                    + (1 - p) * option_value[i]
-                ) * df
-            else:
-                option_value[i] = max(
-                    (z * (S * u ** i * d ** (j - i) - K)),
-                    (
-                        p * option_value[i + 1]
-                        + (1 - p) * option_value[i]
-                    ) * df
-                )
-
-        if j == 2:
-            gamma = (
-                (option_value[2] - option_value[1]) / (S * u ** 2 - S * u * d)
-                - (option_value[1] - option_value[0]) /
-                (S * u * d - S * d ** 2)
-            ) / (0.5 * (S * u ** 2 - S * d ** 2))
-            theta = option_value[1]
-
-        if j == 1:
-            delta = (option_value[1] - option_value[0]) / (S * u - S * d)
-
-    theta = (theta - option_value[0]) / (2 * dT) / 365
-
-    return option_value[0], delta, gamma, theta
+    if step_2 is not None:
+        gamma = (
+            (step_2[2] - step_2[1]) / (S * u ** 2 - S * u * d)
+            - (step_2[1] - step_2[0]) /
+            (S * u * d - S * d ** 2)
+        ) / (0.5 * (S * u ** 2 - S * d ** 2))
+        theta = step_2[1]
+
+    if step_1 is not None:
+        delta = (step_1[1] - step_1[0]) / (S * u - S * d)
+
+    theta = (theta - value) / (2 * dT) / 365
+
+    return value, delta, gamma, theta
+
+
+def all_greeks(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> TreeGreeks:
+    """Calculate the price and first order greeks using a single
+    Leisen-Reimer binomial tree.
+
+    The price, delta, gamma and theta are those of `greeks`. The vega and rho
+    are the derivatives of the tree price, found by differentiating the
+    backward induction rather than by valuing bumped trees. As for the
+    numeric greeks, the cost of carry moves with the risk free rate for the
+    rho.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree.
+
+    Returns:
+        TreeGreeks: The price, delta, gamma, theta, vega and rho.
+    """
+    n, dT, u, d, p, df = _parameters(S, K, T, r, b, v, n)
+
+    # The derivatives of the tree parameters with respect to the volatility,
+    # and the rate and carry, as the real and imaginary parts.
+    h = _PARAMETER_BUMP
+    _, _, *vol_up = _parameters(S, K, T, r, b, v + h, n)
+    _, _, *vol_down = _parameters(S, K, T, r, b, v - h, n)
+    _, _, *rate_up = _parameters(S, K, T, r + h, b + h, v, n)
+    _, _, *rate_down = _parameters(S, K, T, r - h, b - h, v, n)
+    du, dd, dp, ddf = (
+        complex(v_up - v_down, r_up - r_down) / (2 * h)
+        for v_up, v_down, r_up, r_down in zip(
+            vol_up, vol_down, rate_up, rate_down
+        )
+    )
+
+    value, step_1, step_2, derivative = backward_induction_derivative(
+        is_european, is_call, S, K, u, d, p, df, n, du, dd, dp, ddf
+    )
+
+    _, delta, gamma, theta = _lattice_greeks(
+        S, u, d, dT, value, step_1, step_2
+    )
+    derivative = complex(derivative)
+
+    return TreeGreeks(
+        value, delta, gamma, theta, derivative.real, derivative.imag
+    )
+
+
+def exercise_boundary(
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> List[float]:
+    """Find the early exercise boundary of an American option using
+    a Leisen-Reimer binomial tree.
+
+    The boundary at step j, at time j * T / n, is the asset price of the node
+    closest to the money at which the option is exercised. Where the option
+    is not exercised at a step the boundary is nan.
+
+    The number of steps is made odd, as for the price.
+
+    Args:
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree.
+
+    Returns:
+        List[float]: The exercise boundary for each step.
+    """
+    n, _, u, d, p, df = _parameters(S, K, T, r, b, v, n)
+
+    boundary = [nan] * n
+    backward_induction(
+        False, is_call, S, K, u, d, p, df, n, boundary=boundary
+    )
+    return boundary
 
 
 def price(
@@ -144,6 +267,52 @@ def price(
     return p
 
 
+def extrapolated_price(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> ExtrapolatedPrice:
+    """Calculate the price using Richardson extrapolation of Leisen-Reimer
+    binomial trees.
+
+    The prices of trees with n // 2 and n steps (rounded up to be odd) are
+    extrapolated. The error of a European price decreases as $1/n^2$, while
+    early exercise reduces this to $1/n$ for an American price.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the larger tree.
+
+    Raises:
+        ValueError: If there are fewer than two steps.
+
+    Returns:
+        ExtrapolatedPrice: The price and an error estimate.
+    """
+    if n < 2:
+        raise ValueError("The number of steps must be at least 2")
+
+    return extrapolate(
+        Pricer(price, is_european, is_call, S, K, T, r, b, v),
+        _odd(n // 2),
+        _odd(n),
+        2 if is_european else 1
+    )
+
+
 def ivol(
         is_european: bool,
         is_call: bool,
@@ -179,7 +348,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_european, is_call, S, K, T, r, b, v, n),
+        Pricer(price, is_european, is_call, S, K, T, r, b, n=n),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -201,16 +370,4 @@ def make_numeric_greeks(
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_european, is_call, S, K, T, r, b, v, n)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_european, is_call, n=n))
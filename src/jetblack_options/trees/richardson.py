@@ -0,0 +1,54 @@
+r"""Richardson extrapolation of tree prices.
+
+If the error of a tree with $n$ steps is proportional to $n^{-k}$, the prices
+of trees with $m < n$ steps can be combined to cancel the leading error term.
+
+$$
+P^* = \frac{n^k P_n - m^k P_m}{n^k - m^k}
+$$
+
+The difference between the extrapolated price and the price of the larger
+tree is an estimate of the error of the larger tree, and an upper bound for
+the error of the extrapolated price when the extrapolation is effective.
+"""
+
+from typing import Callable, NamedTuple
+
+
+class ExtrapolatedPrice(NamedTuple):
+    """An extrapolated price with an error estimate."""
+
+    price: float
+    """The extrapolated price."""
+    error: float
+    """An estimate of the error: the difference between the extrapolated
+    price and the price of the larger tree."""
+
+
+def extrapolate(
+        price: Callable[[int], float],
+        m: int,
+        n: int,
+        order: int = 1
+) -> ExtrapolatedPrice:
+    """Extrapolate the prices of two trees.
+
+    Args:
+        price (Callable[[int], float]): The price of a tree for a number of
+            steps.
+        m (int): The number of steps in the smaller tree.
+        n (int): The number of steps in the larger tree.
+        order (int, optional): The order of convergence of the tree. Defaults
+            to 1.
+
+    Returns:
+        ExtrapolatedPrice: The extrapolated price and an error estimate.
+    """
+    p_m = price(m)
+    p_n = price(n)
+
+    w_m = m ** order
+    w_n = n ** order
+    p = (w_n * p_n - w_m * p_m) / (w_n - w_m)
+
+    return ExtrapolatedPrice(p, abs(p - p_n))
@@ -1,11 +1,14 @@
 """Option valuations using a trinomial tree.
 """
 
-from math import exp, nan, sqrt
-from typing import Tuple
+from math import ceil, exp, floor, nan, sqrt
+from typing import List, Optional, Tuple
 
+from ..greeks import TreeGreeks
 from ..implied_volatility import solve_ivol
 from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+from .lattice import band_width
 
 
 def greeks(
@@ -17,10 +20,18 @@ def greeks(
         r: float,
         b: float,
         v: float,
-        n: int
+        n: int,
+        *,
+        tolerance: Optional[float] = None
 ) -> Tuple[float, float, float, float]:
     """A trinomial tree options pricer returning the price and some greeks.
 
+    With a tolerance the tree is pruned to the band of nodes which are
+    reached with at least that probability. The nodes at the edges of the
+    band are given the value they would have if the payoff were linear beyond
+    them. The error in the price is of the order of the tolerance multiplied
+    by the strike.
+
     Args:
         is_european (bool): True for European, false for American.
         is_call (bool): True for a call, false for a put.
@@ -31,6 +42,9 @@ def greeks(
         b (float): The cost of carry of the asset.
         v (float): The volatility of the asset.
         n (int): The number of the steps in the tree.
+        tolerance (Optional[float], optional): If provided the tree is pruned
+            to the nodes which are reached with at least this probability.
+            Defaults to None.
 
     Returns:
         Tuple[float, float, float, float]: The price, delta, gamma, theta.
@@ -38,6 +52,49 @@ def greeks(
 
     z = 1 if is_call else -1
 
+    dT, u, d, pu, pm, pd, Df = _parameters(T, r, b, v, n)
+
+    step_1: Optional[List[float]] = None
+    if tolerance is not None:
+        value, step_1 = _pruned_induction(
+            is_european, z, S, K, u, d, pu, pm, pd, Df, n, tolerance
+        )
+    else:
+        option_value = [
+            max(0, z * (S * u ** max(i - n, 0) * d ** max(n - i, 0) - K))
+            for i in range(1 + 2*n)
+        ]
+
+        for j in range(n-1, -1, -1):
+            for i in range(1 + j*2):
+
+                option_value[i] = (
+                    pu * option_value[i + 2]
+                    + pm * option_value[i + 1]
+                    + pd * option_value[i]
+                ) * Df
+
+                if is_european:
+                    option_value[i] = max(
+                        z * (S * u ** max(i - j, 0) * d ** max(j - i, 0) - K),
+                        option_value[i]
+                    )
+
+            if j == 1:
+                step_1 = option_value[:3]
+
+        value = option_value[0]
+
+    return _lattice_greeks(S, u, d, dT, value, step_1)
+
+
+def _parameters(
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> Tuple[float, float, float, float, float, float, float]:
     dT = T / n
     u = exp(v * sqrt(2 * dT))
     d = exp(-v * sqrt(2 * dT))
@@ -62,15 +119,211 @@ def greeks(
     pm = 1 - pu - pd
     Df = exp(-r * dT)
 
-    option_value = [
-        max(0, z * (S * u ** max(i - n, 0) * d ** max(n - i, 0) - K))
+    return dT, u, d, pu, pm, pd, Df
+
+
+def _lattice_greeks(
+        S: float,
+        u: float,
+        d: float,
+        dT: float,
+        value: float,
+        step_1: Optional[List[float]]
+) -> Tuple[float, float, float, float]:
+    delta = gamma = theta = nan
+
+    if step_1 is not None:
+        delta = (step_1[2] - step_1[0]) / (S * u - S * d)
+        gamma = (
+            (step_1[2] - step_1[1]) / (S * u - S)
+            - (step_1[1] - step_1[0]) / (S - S * d)
+        ) / (0.5 * (S * u - S * d))
+        theta = step_1[1]
+
+    theta = (theta - value) / dT / 365
+
+    return value, delta, gamma, theta
+
+
+def all_greeks(
+        is_european: bool,
+        is_call: bool,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> TreeGreeks:
+    """Calculate the price and first order greeks using a single trinomial
+    tree.
+
+    The price, delta, gamma and theta are those of `greeks`. The vega and rho
+    are the derivatives of the tree price, found by differentiating the
+    backward induction rather than by valuing bumped trees. As for the
+    numeric greeks, the cost of carry moves with the risk free rate for the
+    rho.
+
+    Args:
+        is_european (bool): True for European, false for American.
+        is_call (bool): True for a call, false for a put.
+        S (float): The current asset price.
+        K (float): The option strike price
+        T (float): The time to maturity of the option in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree.
+
+    Returns:
+        TreeGreeks: The price, delta, gamma, theta, vega and rho.
+    """
+    z = 1 if is_call else -1
+
+    dT, u, d, pu, pm, pd, Df = _parameters(T, r, b, v, n)
+
+    # The derivatives of the tree parameters with respect to the volatility,
+    # and the rate and carry, as the real and imaginary parts. The
+    # parameters are smooth, closed form functions, so the differences are
+    # accurate to around ten significant figures.
+    h = 1e-6
+    _, *vol_up = _parameters(T, r, b, v + h, n)
+    _, *vol_down = _parameters(T, r, b, v - h, n)
+    _, *rate_up = _parameters(T, r + h, b + h, v, n)
+    _, *rate_down = _parameters(T, r - h, b - h, v, n)
+    du, dd, dpu, dpm, dpd, dDf = (
+        complex(v_up - v_down, r_up - r_down) / (2 * h)
+        for v_up, v_down, r_up, r_down in zip(
+            vol_up, vol_down, rate_up, rate_down
+        )
+    )
+    du_u = du / u
+    dd_d = dd / d
+    dDf_Df = dDf / Df
+
+    dpu_Df, dpm_Df, dpd_Df = dpu * Df, dpm * Df, dpd * Df
+    pu_Df, pm_Df, pd_Df = pu * Df, pm * Df, pd * Df
+
+    # The derivative of the asset price at node i of step j is the asset
+    # price multiplied by max(i - j, 0) * du / u + max(j - i, 0) * dd / d.
+    asset = [
+        S * u ** max(i - n, 0) * d ** max(n - i, 0)
         for i in range(1 + 2*n)
     ]
+    option_value = [max(0, z * (a - K)) for a in asset]
+    tangent: List[complex] = [
+        z * a * (max(i - n, 0) * du_u + max(n - i, 0) * dd_d)
+        if value > 0 else 0j
+        for i, (a, value) in enumerate(zip(asset, option_value))
+    ]
+    step_1: Optional[List[float]] = None
 
-    delta = gamma = theta = nan
+    for j in range(n-1, -1, -1):
+        continuation = [
+            (pu * up + pm * middle + pd * down) * Df
+            for down, middle, up in zip(
+                option_value, option_value[1:], option_value[2:]
+            )
+        ]
+        tangent = [
+            dpu_Df * up + dpm_Df * middle + dpd_Df * down
+            + pu_Df * t_up + pm_Df * t_middle + pd_Df * t_down
+            + dDf_Df * c
+            for c, down, middle, up, t_down, t_middle, t_up in zip(
+                continuation,
+                option_value,
+                option_value[1:],
+                option_value[2:],
+                tangent,
+                tangent[1:],
+                tangent[2:]
+            )
+        ]
+        option_value = continuation
+
+        if is_european:
+            asset = [
+                S * u ** max(i - j, 0) * d ** max(j - i, 0)
+                for i in range(1 + 2*j)
+            ]
+            tangent = [
+                z * a * (max(i - j, 0) * du_u + max(j - i, 0) * dd_d)
+                if z * (a - K) > c else t
+                for i, (a, c, t) in enumerate(zip(
+                    asset, option_value, tangent
+                ))
+            ]
+            option_value = [
+                max(z * (a - K), c)
+                for a, c in zip(asset, option_value)
+            ]
+
+        if j == 1:
+            step_1 = option_value[:3]
+
+    value = option_value[0]
+    _, delta, gamma, theta = _lattice_greeks(S, u, d, dT, value, step_1)
+
+    return TreeGreeks(
+        value, delta, gamma, theta, tangent[0].real, tangent[0].imag
+    )
+
+
+def _pruned_induction(
+        is_european: bool,
+        z: int,
+        S: float,
+        K: float,
+        u: float,
+        d: float,
+        pu: float,
+        pm: float,
+        pd: float,
+        Df: float,
+        n: int,
+        tolerance: float
+) -> Tuple[float, Optional[List[float]]]:
+    u_pow = [u ** i for i in range(n+1)]
+    d_pow = [d ** i for i in range(n+1)]
+
+    # The forward growth and discount over the remaining steps, for the values
+    # at the edges of the band.
+    g = pu * u + pm + pd * d
+    g_pow = [g ** i for i in range(n+1)]
+    Df_pow = [Df ** i for i in range(n+1)]
+
+    def edge_value(i: int, j: int) -> float:
+        asset = S * u_pow[max(i - j, 0)] * d_pow[max(j - i, 0)]
+        value = max(0, z * (asset * g_pow[n - j] - K) * Df_pow[n - j])
+        if is_european:
+            value = max(z * (asset - K), value)
+        return value
+
+    if not (0 <= pu <= 1 and 0 <= pm <= 1 and 0 <= pd <= 1):
+        raise ValueError(
+            "The probabilities of the moves must be in [0, 1] to prune the tree"
+        )
+
+    # The node index moves up by one with probability pu and down by one
+    # with probability pd.
+    drift = pu - pd
+    k = band_width(tolerance) * sqrt(pu + pd - drift ** 2)
+
+    option_value = [
+        max(0, z * (S * u_pow[max(i - n, 0)] * d_pow[max(n - i, 0)] - K))
+        for i in range(1 + 2*n)
+    ]
+    step_1: Optional[List[float]] = None
 
     for j in range(n-1, -1, -1):
-        for i in range(1 + j*2):
+        if j > 1:
+            lo = max(ceil(j * (1 + drift) - k * sqrt(j)) - 1, 0)
+            hi = min(floor(j * (1 + drift) + k * sqrt(j)) + 1, 2 * j)
+        else:
+            lo, hi = 0, 2 * j
+
+        for i in range(lo, hi + 1):
 
             option_value[i] = (
                 pu * option_value[i + 2]
@@ -80,21 +333,19 @@ def greeks(
 
             if is_european:
                 option_value[i] = max(
-                    z * (S * u ** max(i - j, 0) * d ** max(j - i, 0) - K),
+                    z * (S * u_pow[max(i - j, 0)] * d_pow[max(j - i, 0)] - K),
                     option_value[i]
                 )
 
-        if j == 1:
-            delta = (option_value[2] - option_value[0]) / (S * u - S * d)
-            gamma = (
-                (option_value[2] - option_value[1]) / (S * u - S)
-                - (option_value[1] - option_value[0]) / (S - S * d)
-            ) / (0.5 * (S * u - S * d))
-            theta = option_value[1]
+        # The band may move by up to two nodes a step.
+        for i in (lo - 2, lo - 1, hi + 1, hi + 2):
+            if 0 <= i <= 2 * j:
+                option_value[i] = edge_value(i, j)
 
-    theta = (theta - option_value[0]) / dT / 365
+        if j == 1:
+            step_1 = option_value[:3]
 
-    return option_value[0], delta, gamma, theta
+    return option_value[0], step_1
 
 
 def price(
@@ -106,7 +357,9 @@ def price(
         r: float,
         b: float,
         v: float,
-        n: int
+        n: int,
+        *,
+        tolerance: Optional[float] = None
 ) -> float:
     """Calculate the price of an option using a trinomial tree.
 
@@ -120,11 +373,16 @@ def price(
         b (float): The cost of carry of the asset.
         v (float): The volatility of the asset.
         n (int): The number of the steps in the tree.
+        tolerance (Optional[float], optional): If provided the tree is pruned
+            to the nodes which are reached with at least this probability.
+            Defaults to None.
 
     Returns:
         Tuple[float, float, float, float]: The price, delta, gamma, theta.
     """
-    p, *_ = greeks(is_european, is_call, S, K, T, r, b, v, n)
+    p, *_ = greeks(
+        is_european, is_call, S, K, T, r, b, v, n, tolerance=tolerance
+    )
     return p
 
 
@@ -163,7 +421,7 @@ def ivol(
     """
     return solve_ivol(
         p,
-        lambda v: price(is_european, is_call, S, K, T, r, b, v, n),
+        Pricer(price, is_european, is_call, S, K, T, r, b, n=n),
         max_iterations=max_iterations,
         epsilon=epsilon
     )
@@ -185,16 +443,4 @@ def make_numeric_greeks(
         NumericGreeks: A class which can generate Greeks using finite difference
             methods.
     """
-    # Normalize the price function to match that required by the finite
-    # difference methods.
-    def evaluate(
-            S: float,
-            K: float,
-            T: float,
-            r: float,
-            b: float,
-            v: float
-    ) -> float:
-        return price(is_european, is_call, S, K, T, r, b, v, n)
-
-    return NumericGreeks(evaluate)
+    return NumericGreeks(Pricer(price, is_european, is_call, n=n))
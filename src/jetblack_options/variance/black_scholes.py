@@ -1,10 +1,8 @@
 """Black Scholes variance analytic solutions"""
 
 from math import exp, log, sqrt
-from statistics import NormalDist
 
-norm = NormalDist()
-cdf = norm.cdf
+from ..distributions import cdf
 
 
 def price(
@@ -0,0 +1,440 @@
+"""The Barone-Adesi and Whaley (1987) American approximation for NumPy
+arrays.
+
+This is an array based version of
+`jetblack_options.american.barone_adesi_whaley`. The critical prices of all
+the contracts are found together with Newton-Raphson, where each iteration
+updates only the rows which have not converged. The critical prices are
+returned with the prices, as they give the early exercise boundaries.
+
+The arguments may be scalars, NumPy arrays or pandas Series, and are
+broadcast against each other. The results are NumPy arrays.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+from numpy import exp, log, sqrt
+from numpy.typing import ArrayLike, NDArray
+
+from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+from .distributions import cdf, pdf
+from .generalised_black_scholes import price as bs_price
+from .implied_volatility import IVolResult, solve_ivol
+
+FloatArray = NDArray[np.float64]
+BoolArray = NDArray[np.bool_]
+
+
+def _broadcast(
+        is_call: ArrayLike,
+        *args: ArrayLike
+) -> Tuple[Tuple[int, ...], BoolArray, Tuple[FloatArray, ...]]:
+    arrays = np.broadcast_arrays(
+        np.asarray(is_call, dtype=np.bool_),
+        *(np.asarray(x, dtype=np.float64) for x in args)
+    )
+    shape = arrays[0].shape
+    is_call, *rest = (x.ravel() for x in arrays)
+    return shape, is_call, tuple(rest)
+
+
+def _call_terms(
+        Si: FloatArray,
+        K: FloatArray,
+        strike_pv: FloatArray,
+        carry: FloatArray,
+        drift: FloatArray,
+        vol: FloatArray,
+        q2: FloatArray
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    # The right hand side of the boundary condition, with the European price
+    # inlined so both probabilities are found with one call.
+    d1 = (log(Si / K) + drift) / vol
+    N1, N2 = cdf(np.stack((d1, d1 - vol)))
+    rhs = Si * carry * N1 - strike_pv * N2 + (1 - carry * N1) * Si / q2
+    return rhs, d1, N1
+
+
+def _kc(
+        K: FloatArray,
+        T: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+        epsilon: float,
+        max_iterations: Optional[int]
+) -> FloatArray:
+    # The formulae follow the scalar version exactly, so the critical prices
+    # are the same.
+
+    # Calculate the seed value Si
+    n = 2 * b / v ** 2
+    m = 2 * r / v ** 2
+    q2u = (-(n - 1) + sqrt((n - 1) ** 2 + 4 * m)) / 2
+    su = K / (1 - 1 / q2u)
+    h2 = -(b * T + 2 * v * sqrt(T)) * K / (su - K)
+    Si = K + (su - K) * (1 - exp(h2))
+
+    k = 2 * r / (v ** 2 * (1 - exp(-r * T)))
+    q2 = (-(n - 1) + sqrt((n - 1) ** 2 + 4 * k)) / 2
+    strike_pv = K * exp(-r * T)
+    carry = exp((b - r) * T)
+    drift = (b + v ** 2 / 2) * T
+    vol = v * sqrt(T)
+
+    lhs = Si - K
+    rhs, d1, N1 = _call_terms(Si, K, strike_pv, carry, drift, vol, q2)
+    bi = carry * N1 * (1 - 1 / q2) + (1 - carry * N1 / vol) / q2
+
+    # Using the Newton Raphson algorithm solve for Si. The state of the rows
+    # which have not converged is kept in compact arrays, and converged rows
+    # are dropped.
+    result = Si
+    rows = np.arange(len(K))
+    iterations = 0
+    while True:
+        active = np.abs(lhs - rhs) / K > epsilon
+        if not active.all():
+            result[rows] = Si
+            rows = rows[active]
+            K, strike_pv, carry, drift, vol = (
+                K[active], strike_pv[active], carry[active], drift[active],
+                vol[active]
+            )
+            q2, Si, rhs, bi = q2[active], Si[active], rhs[active], bi[active]
+        if len(rows) == 0 or (
+                max_iterations is not None and iterations == max_iterations
+        ):
+            break
+        iterations += 1
+
+        Si = (K + rhs - bi * Si) / (1 - bi)
+        lhs = Si - K
+        rhs, d1, N1 = _call_terms(Si, K, strike_pv, carry, drift, vol, q2)
+        bi = carry * N1 * (1 - 1 / q2) + (1 - carry * pdf(d1) / vol) / q2
+
+    result[rows] = Si
+    return result
+
+
+def _put_terms(
+        Si: FloatArray,
+        K: FloatArray,
+        strike_pv: FloatArray,
+        carry: FloatArray,
+        drift: FloatArray,
+        vol: FloatArray,
+        q1: FloatArray
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    # The right hand side of the boundary condition, with the European price
+    # inlined so both probabilities are found with one call.
+    d1 = (log(Si / K) + drift) / vol
+    N1, N2 = cdf(-np.stack((d1, d1 - vol)))
+    rhs = strike_pv * N2 - Si * carry * N1 - (1 - carry * N1) * Si / q1
+    return rhs, d1, N1
+
+
+def _kp(
+        K: FloatArray,
+        T: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+        epsilon: float,
+        max_iterations: Optional[int]
+) -> FloatArray:
+    # The formulae follow the scalar version exactly, so the critical prices
+    # are the same.
+
+    # Calculation of seed value, Si
+    n = 2 * b / v ** 2
+    m = 2 * r / v ** 2
+    q1u = (-(n - 1) - sqrt((n - 1) ** 2 + 4 * m)) / 2
+    su = K / (1 - 1 / q1u)
+    h1 = (b * T - 2 * v * sqrt(T)) * K / (K - su)
+    Si = su + (K - su) * exp(h1)
+
+    k = 2 * r / (v * 2 * (1 - exp(-r * T)))
+    q1 = (-(n - 1) - sqrt((n - 1) ** 2 + 4 * k)) / 2
+    strike_pv = K * exp(-r * T)
+    carry = exp((b - r) * T)
+    drift = (b + v ** 2 / 2) * T
+    vol = v * sqrt(T)
+
+    lhs = K - Si
+    rhs, d1, N1 = _put_terms(Si, K, strike_pv, carry, drift, vol, q1)
+    bi = -carry * N1 * (1 - 1 / q1) - (1 + carry * pdf(-d1) / vol) / q1
+
+    # Using the Newton Raphson algorithm, solve for Si. The state of the rows
+    # which have not converged is kept in compact arrays, and converged rows
+    # are dropped.
+    result = Si
+    rows = np.arange(len(K))
+    iterations = 0
+    while True:
+        active = np.abs(lhs - rhs) / K > epsilon
+        if not active.all():
+            result[rows] = Si
+            rows = rows[active]
+            K, strike_pv, carry, drift, vol = (
+                K[active], strike_pv[active], carry[active], drift[active],
+                vol[active]
+            )
+            q1, Si, rhs, bi = q1[active], Si[active], rhs[active], bi[active]
+        if len(rows) == 0 or (
+                max_iterations is not None and iterations == max_iterations
+        ):
+            break
+        iterations += 1
+
+        Si = (K - rhs + bi * Si) / (1 + bi)
+        lhs = K - Si
+        rhs, d1, N1 = _put_terms(Si, K, strike_pv, carry, drift, vol, q1)
+        bi = -carry * N1 * (1 - 1 / q1) - (1 + carry * N1 / vol) / q1
+
+    result[rows] = Si
+    return result
+
+
+def _critical_price(
+        is_call: BoolArray,
+        K: FloatArray,
+        T: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+        epsilon: float,
+        max_iterations: Optional[int]
+) -> FloatArray:
+    # A call with a cost of carry of at least the risk free rate is never
+    # exercised early.
+    Sk = np.full(K.shape, np.inf)
+
+    calls = np.flatnonzero(is_call & (b < r))
+    if len(calls) > 0:
+        Sk[calls] = _kc(
+            K[calls], T[calls], r[calls], b[calls], v[calls],
+            epsilon, max_iterations
+        )
+
+    puts = np.flatnonzero(~is_call)
+    if len(puts) > 0:
+        Sk[puts] = _kp(
+            K[puts], T[puts], r[puts], b[puts], v[puts],
+            epsilon, max_iterations
+        )
+
+    return Sk
+
+
+def critical_price(
+        is_call: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+        *,
+        epsilon: float = 1e-6,
+        max_iterations: Optional[int] = None
+) -> FloatArray:
+    """The critical asset prices, beyond which the options are exercised.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+        epsilon (float, optional): The convergence tolerance, relative to the
+            strike. Defaults to 1e-6.
+        max_iterations (Optional[int], optional): The maximum number of
+            Newton-Raphson iterations for any row, or None to iterate until
+            every row has converged, as the scalar version does. Defaults to
+            None.
+
+    Returns:
+        FloatArray: The critical prices, or infinity for calls which are
+            never exercised early, in the broadcast shape of the arguments.
+    """
+    shape, is_call, (K, T, r, b, v) = _broadcast(is_call, K, T, r, b, v)
+    return _critical_price(
+        is_call, K, T, r, b, v, epsilon, max_iterations
+    ).reshape(shape)
+
+
+def price_and_critical_price(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+        *,
+        epsilon: float = 1e-6,
+        max_iterations: Optional[int] = None
+) -> Tuple[FloatArray, FloatArray]:
+    """The Barone-Adesi and Whaley (1987) American approximation, returning
+    the prices and the critical asset prices.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+        epsilon (float, optional): The convergence tolerance of the critical
+            prices, relative to the strike. Defaults to 1e-6.
+        max_iterations (Optional[int], optional): The maximum number of
+            Newton-Raphson iterations for any row, or None to iterate until
+            every row has converged, as the scalar version does. Defaults to
+            None.
+
+    Returns:
+        Tuple[FloatArray, FloatArray]: The prices, and the critical prices
+            (infinity for calls which are never exercised early), in the
+            broadcast shape of the arguments.
+    """
+    shape, is_call, (S, K, T, r, b, v) = _broadcast(
+        is_call, S, K, T, r, b, v
+    )
+
+    Sk = _critical_price(is_call, K, T, r, b, v, epsilon, max_iterations)
+
+    # The European price, with the early exercise premium added below.
+    value = bs_price(is_call, S, K, T, r, b, v)
+
+    calls = np.flatnonzero(is_call & (b < r))
+    if len(calls) > 0:
+        S_, K_, T_, r_, b_, v_, Sk_ = (
+            x[calls] for x in (S, K, T, r, b, v, Sk)
+        )
+        n = 2 * b_ / v_ ** 2
+        k = 2 * r_ / (v_ ** 2 * (1 - exp(-r_ * T_)))
+        d1 = (log(Sk_ / K_) + (b_ + v_ ** 2 / 2) * T_) / (v_ * sqrt(T_))
+        q2 = (-(n - 1) + sqrt((n - 1) ** 2 + 4 * k)) / 2
+        a2 = (Sk_ / q2) * (1 - exp((b_ - r_) * T_) * cdf(d1))
+        value[calls] = np.where(
+            S_ < Sk_,
+            value[calls] + a2 * (S_ / Sk_) ** q2,
+            S_ - K_
+        )
+
+    puts = np.flatnonzero(~is_call)
+    if len(puts) > 0:
+        S_, K_, T_, r_, b_, v_, Sk_ = (
+            x[puts] for x in (S, K, T, r, b, v, Sk)
+        )
+        n = 2 * b_ / v_ ** 2
+        k = 2 * r_ / (v_ ** 2 * (1 - exp(-r_ * T_)))
+        d1 = (log(Sk_ / K_) + (b_ + v_ ** 2 / 2) * T_) / (v_ * sqrt(T_))
+        q1 = (-(n - 1) - sqrt((n - 1) ** 2 + 4 * k)) / 2
+        a1 = -(Sk_ / q1) * (1 - exp((b_ - r_) * T_) * cdf(-d1))
+        value[puts] = np.where(
+            S_ > Sk_,
+            value[puts] + a1 * (S_ / Sk_) ** q1,
+            K_ - S_
+        )
+
+    return value.reshape(shape), Sk.reshape(shape)
+
+
+def price(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+) -> FloatArray:
+    """The Barone-Adesi and Whaley (1987) American approximation.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The prices of the options, in the broadcast shape of the
+            arguments.
+    """
+    value, _ = price_and_critical_price(is_call, S, K, T, r, b, v)
+    return value
+
+
+def ivol(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        p: ArrayLike,
+        *,
+        max_iterations: int = 20,
+        epsilon=1e-8
+) -> IVolResult:
+    """Calculate the volatilities of options that are implied by the prices.
+
+    Only the rows that have not converged are re-priced on each iteration.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        p (ArrayLike): The option prices.
+        max_iterations (int, Optional): The maximum number of iterations for
+            any row. Defaults to 20.
+        epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+
+    Returns:
+        IVolResult: The implied volatilities, iteration counts and convergence
+            flags, in the broadcast shape of the arguments.
+    """
+    shape, is_call, (S, K, T, r, b, p) = _broadcast(
+        is_call, S, K, T, r, b, p
+    )
+
+    result = solve_ivol(
+        p,
+        lambda v, i: price(is_call[i], S[i], K[i], T[i], r[i], b[i], v),
+        max_iterations=max_iterations,
+        epsilon=epsilon
+    )
+
+    return IVolResult(
+        result.vol.reshape(shape),
+        result.iterations.reshape(shape),
+        result.converged.reshape(shape)
+    )
+
+
+def make_numeric_greeks(is_call: ArrayLike) -> NumericGreeks:
+    """Make a class to generate greeks numerically using finite difference
+    methods.
+
+    The finite differences are calculated from array prices, so the greeks
+    of every contract are found with a few calls to the batch pricer.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+
+    Returns:
+        NumericGreeks: A class which can generate Greeks using finite difference
+            methods, taking and returning arrays.
+    """
+    return NumericGreeks(Pricer(price, is_call))
@@ -0,0 +1,302 @@
+"""The Bjerksund and Stensland (1993) American approximation for NumPy
+arrays.
+
+This is an array based version of
+`jetblack_options.american.bjerksund_stensland_1993`. Puts are priced as
+calls with the put-call transformation.
+
+The trigger price, and the quantities it is derived from, do not depend on
+the asset price of a call, or the strike of a put, as these are swapped by
+the transformation. They are calculated in the broadcast shape of the other
+arguments, so a ladder of asset prices with shape (n, 1) against contracts
+with shape (m,) calculates m call triggers, and prices the n * m options
+against them. The greeks with respect to the asset price are calculated
+this way by `spot_greeks`.
+
+The arguments may be scalars, NumPy arrays or pandas Series, and are
+broadcast against each other. The results are NumPy arrays.
+"""
+
+from typing import Tuple, Union
+
+import numpy as np
+from numpy import exp, log, sqrt
+from numpy.typing import ArrayLike, NDArray
+
+from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+from .distributions import cdf
+from .generalised_black_scholes import price as bs_price
+from .implied_volatility import IVolResult, solve_ivol
+
+FloatArray = NDArray[np.float64]
+Exponent = Union[float, FloatArray]
+
+
+def _phi(
+        S: FloatArray,
+        T: FloatArray,
+        gamma_: Exponent,
+        h: FloatArray,
+        i: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+) -> FloatArray:
+    lambda_ = (-r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2) * T
+    d = -(log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T) / (v * sqrt(T))
+    kappa = 2 * b / v ** 2 + 2 * gamma_ - 1
+    return (
+        exp(lambda_) * S ** gamma_ * (
+            cdf(d)
+            - (i / S) ** kappa * cdf(d - 2 * log(i / S) / (v * sqrt(T)))
+        )
+    )
+
+
+def _trigger(
+        K: FloatArray,
+        T: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    # The quantities are not used where b >= r, as these calls are never
+    # exercised early, but may not be finite.
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        beta = (
+            (1 / 2 - b / v ** 2)
+            + sqrt((b / v ** 2 - 1 / 2) ** 2 + 2 * r / v ** 2)
+        )
+        b_infinity = beta / (beta - 1) * K
+        b0 = np.maximum(K, r / (r - b) * K)
+        ht = -(b * T + 2 * v * sqrt(T)) * b0 / (b_infinity - b0)
+        i = b0 + (b_infinity - b0) * (1 - exp(ht))
+        alpha = (i - K) * i ** (-beta)
+    return beta, i, alpha
+
+
+def _call_price(
+        S: FloatArray,
+        K: FloatArray,
+        T: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+        beta: FloatArray,
+        i: FloatArray,
+        alpha: FloatArray,
+) -> FloatArray:
+    # Use Black-Scholes where it is never optimal to exercise before maturity.
+    result = bs_price(True, S, K, T, r, b, v)
+
+    early = np.flatnonzero(b < r)
+    if len(early) == 0:
+        return result
+    S, K, T, r, b, v, beta, i, alpha = (
+        x[early] for x in (S, K, T, r, b, v, beta, i, alpha)
+    )
+
+    # Contracts beyond the trigger price are exercised immediately.
+    exercised = S >= i
+    result[early[exercised]] = (S - K)[exercised]
+
+    approximate = ~exercised
+    if not approximate.any():
+        return result
+    S, K, T, r, b, v, beta, i, alpha = (
+        x[approximate] for x in (S, K, T, r, b, v, beta, i, alpha)
+    )
+
+    result[early[approximate]] = (
+        alpha * S ** beta
+        - alpha * _phi(S, T, beta, i, i, r, b, v)
+        + _phi(S, T, 1, i, i, r, b, v)
+        - _phi(S, T, 1, K, i, r, b, v)
+        - K * _phi(S, T, 0, i, i, r, b, v)
+        + K * _phi(S, T, 0, K, i, r, b, v)
+    )
+    return result
+
+
+def price(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+) -> FloatArray:
+    """The Bjerksund and Stensland (1993) American approximation.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to maturity of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+
+    Returns:
+        FloatArray: The prices of the options, in the broadcast shape of the
+            arguments.
+    """
+    is_call = np.asarray(is_call, dtype=np.bool_)
+    S, K, T, r, b, v = (
+        np.asarray(x, dtype=np.float64) for x in (S, K, T, r, b, v)
+    )
+    shape = np.broadcast_shapes(
+        is_call.shape, S.shape, K.shape, T.shape, r.shape, b.shape, v.shape
+    )
+
+    # Calculate the triggers in the shape of the arguments they depend on,
+    # using the Bjerksund and Stensland put-call transformation for puts.
+    triggers = []
+    if is_call.any():
+        triggers.append(_trigger(K, T, r, b, v))
+    if not is_call.all():
+        triggers.append(_trigger(S, T, r - b, -b, v))
+    if len(triggers) == 1:
+        beta, i, alpha = triggers[0]
+    else:
+        (beta, i, alpha), (put_beta, put_i, put_alpha) = triggers
+        beta = np.where(is_call, beta, put_beta)
+        i = np.where(is_call, i, put_i)
+        alpha = np.where(is_call, alpha, put_alpha)
+
+    is_call, S, K, T, r, b, v, beta, i, alpha = (
+        np.broadcast_to(x, shape).ravel()
+        for x in (is_call, S, K, T, r, b, v, beta, i, alpha)
+    )
+
+    return _call_price(
+        np.where(is_call, S, K),
+        np.where(is_call, K, S),
+        T,
+        np.where(is_call, r, r - b),
+        np.where(is_call, b, -b),
+        v,
+        beta,
+        i,
+        alpha
+    ).reshape(shape)
+
+
+def spot_greeks(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+        *,
+        dS: float = 0.01
+) -> Tuple[FloatArray, FloatArray, FloatArray]:
+    """The price, delta and gamma, using central differences.
+
+    The bumped asset prices are priced in a single call, so the call
+    triggers are calculated once.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to maturity of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+        dS (float, optional): The absolute amount to change the asset price
+            by. Defaults to 0.01.
+
+    Returns:
+        Tuple[FloatArray, FloatArray, FloatArray]: The price, delta and gamma,
+            in the broadcast shape of the arguments.
+    """
+    ndim = np.broadcast(is_call, S, K, T, r, b, v).ndim
+    bumps = np.array([-dS, 0.0, dS]).reshape((3,) + (1,) * ndim)
+    down, value, up = price(
+        is_call, np.asarray(S, dtype=np.float64) + bumps, K, T, r, b, v
+    )
+    delta = (up - down) / (2 * dS)
+    gamma = (up - 2 * value + down) / dS ** 2
+    return value, delta, gamma
+
+
+def ivol(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        p: ArrayLike,
+        *,
+        max_iterations: int = 20,
+        epsilon=1e-8
+) -> IVolResult:
+    """Calculate the volatilities of options that are implied by the prices.
+
+    Only the rows that have not converged are re-priced on each iteration.
+    Where the scalar version raises an overflow error, the row has a
+    volatility of nan and is not converged.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        p (ArrayLike): The option prices.
+        max_iterations (int, Optional): The maximum number of iterations for
+            any row. Defaults to 20.
+        epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+
+    Returns:
+        IVolResult: The implied volatilities, iteration counts and convergence
+            flags, in the broadcast shape of the arguments.
+    """
+    is_call, S, K, T, r, b, p = np.broadcast_arrays(
+        np.asarray(is_call, dtype=np.bool_),
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, b, p))
+    )
+    shape = p.shape
+    is_call, S, K, T, r, b, p = (
+        x.ravel() for x in (is_call, S, K, T, r, b, p)
+    )
+
+    # The approximation overflows for some contracts at the ends of the
+    # volatility bracket. These rows are reported as not converged.
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        result = solve_ivol(
+            p,
+            lambda v, i: price(is_call[i], S[i], K[i], T[i], r[i], b[i], v),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+
+    return IVolResult(
+        result.vol.reshape(shape),
+        result.iterations.reshape(shape),
+        result.converged.reshape(shape)
+    )
+
+
+def make_numeric_greeks(is_call: ArrayLike) -> NumericGreeks:
+    """Make a class to generate greeks numerically using finite difference
+    methods.
+
+    The finite differences are calculated from array prices, so the greeks
+    of every contract are found with a few calls to the batch pricer.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+
+    Returns:
+        NumericGreeks: A class which can generate Greeks using finite difference
+            methods, taking and returning arrays.
+    """
+    return NumericGreeks(Pricer(price, is_call))
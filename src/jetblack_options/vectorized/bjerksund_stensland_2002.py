@@ -0,0 +1,276 @@
+"""The Bjerksund and Stensland (2002) American approximation for NumPy
+arrays.
+
+This is an array based version of
+`jetblack_options.american.bjerksund_stensland_2002`. Puts are priced as
+calls with the put-call transformation, and the contracts which are exercised
+immediately, or which are never exercised early, are found with masks, so
+the approximation is only evaluated for the remaining contracts. The
+bivariate normal probabilities of each term are calculated together.
+
+The arguments may be scalars, NumPy arrays or pandas Series, and are
+broadcast against each other. The results are NumPy arrays.
+"""
+
+from typing import Union
+
+import numpy as np
+from numpy import exp, log, sqrt
+from numpy.typing import ArrayLike, NDArray
+
+from ..numeric_greeks.with_carry import NumericGreeks
+from ..pricers import Pricer
+from .distributions import cbnd, cdf
+from .generalised_black_scholes import price as bs_price
+from .implied_volatility import IVolResult, solve_ivol
+
+FloatArray = NDArray[np.float64]
+Exponent = Union[float, FloatArray]
+
+
+def _phi(
+        S: FloatArray,
+        T: FloatArray,
+        gamma_: Exponent,
+        h: FloatArray,
+        i: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+) -> FloatArray:
+    lambda_ = (-r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2) * T
+    d = -(log(S / h) + (b + (gamma_ - 0.5) * v ** 2) * T) / (v * sqrt(T))
+    kappa = 2 * b / v ** 2 + 2 * gamma_ - 1
+    return (
+        exp(lambda_) * S ** gamma_ * (
+            cdf(d)
+            - (i / S) ** kappa * cdf(d - 2 * log(i / S) / (v * sqrt(T))))
+    )
+
+
+def _ksi(
+        S: FloatArray,
+        T2: FloatArray,
+        gamma_: Exponent,
+        h: FloatArray,
+        I2: FloatArray,
+        I1: FloatArray,
+        t1: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+) -> FloatArray:
+    drift = b + (gamma_ - 0.5) * v ** 2
+    e1 = (log(S / I1) + drift * t1) / (v * sqrt(t1))
+    e2 = (log(I2 ** 2 / (S * I1)) + drift * t1) / (v * sqrt(t1))
+    e3 = (log(S / I1) - drift * t1) / (v * sqrt(t1))
+    e4 = (log(I2 ** 2 / (S * I1)) - drift * t1) / (v * sqrt(t1))
+
+    f1 = (log(S / h) + drift * T2) / (v * sqrt(T2))
+    f2 = (log(I2 ** 2 / (S * h)) + drift * T2) / (v * sqrt(T2))
+    f3 = (log(I1 ** 2 / (S * h)) + drift * T2) / (v * sqrt(T2))
+    f4 = (log(S * I1 ** 2 / (h * I2 ** 2)) + drift * T2) / (v * sqrt(T2))
+
+    rho = sqrt(t1 / T2)
+    lambda_ = -r + gamma_ * b + 0.5 * gamma_ * (gamma_ - 1) * v ** 2
+    kappa = 2 * b / (v ** 2) + (2 * gamma_ - 1)
+
+    # The four probabilities are calculated in a single call.
+    m1, m2, m3, m4 = cbnd(
+        np.stack((-e1, -e2, -e3, -e4)),
+        np.stack((-f1, -f2, -f3, -f4)),
+        np.stack((rho, rho, -rho, -rho))
+    )
+
+    return (
+        exp(lambda_ * T2) *
+        S ** gamma_ *
+        (
+            m1 -
+            (I2 / S) ** kappa * m2 -
+            (I1 / S) ** kappa * m3 +
+            (I1 / I2) ** kappa * m4
+        )
+    )
+
+
+def _call_price(
+        S: FloatArray,
+        K: FloatArray,
+        T: FloatArray,
+        r: FloatArray,
+        b: FloatArray,
+        v: FloatArray,
+) -> FloatArray:
+    # Use Black-Scholes where it is never optimal to exercise before maturity.
+    result = bs_price(True, S, K, T, r, b, v)
+
+    early = np.flatnonzero(b < r)
+    if len(early) == 0:
+        return result
+    S, K, T, r, b, v = (x[early] for x in (S, K, T, r, b, v))
+
+    t1 = 1 / 2 * (np.sqrt(5) - 1) * T
+
+    beta = (
+        (1 / 2 - b / v ** 2)
+        + sqrt((b / v ** 2 - 1 / 2) ** 2 + 2 * r / v ** 2)
+    )
+    b_infinity = beta / (beta - 1) * K
+    b0 = np.maximum(K, r / (r - b) * K)
+
+    ht1 = -(b * t1 + 2 * v * sqrt(t1)) * K ** 2 / ((b_infinity - b0) * b0)
+    ht2 = -(b * T + 2 * v * sqrt(T)) * K ** 2 / ((b_infinity - b0) * b0)
+    I1 = b0 + (b_infinity - b0) * (1 - exp(ht1))
+    I2 = b0 + (b_infinity - b0) * (1 - exp(ht2))
+    alfa1 = (I1 - K) * I1 ** (-beta)
+    alfa2 = (I2 - K) * I2 ** (-beta)
+
+    # Contracts beyond the exercise boundary are exercised immediately.
+    exercised = S >= I2
+    result[early[exercised]] = (S - K)[exercised]
+
+    approximate = ~exercised
+    if not approximate.any():
+        return result
+    S, K, T, r, b, v, t1, beta, I1, I2, alfa1, alfa2 = (
+        x[approximate]
+        for x in (S, K, T, r, b, v, t1, beta, I1, I2, alfa1, alfa2)
+    )
+
+    result[early[approximate]] = (
+        alfa2 * S ** beta
+        - alfa2 * _phi(S, t1, beta, I2, I2, r, b, v)
+        + _phi(S, t1, 1, I2, I2, r, b, v)
+        - _phi(S, t1, 1, I1, I2, r, b, v)
+        - K * _phi(S, t1, 0, I2, I2, r, b, v)
+        + K * _phi(S, t1, 0, I1, I2, r, b, v)
+        + alfa1 * _phi(S, t1, beta, I1, I2, r, b, v)
+        - alfa1 * _ksi(S, T, beta, I1, I2, I1, t1, r, b, v)
+        + _ksi(S, T, 1, I1, I2, I1, t1, r, b, v)
+        - _ksi(S, T, 1, K, I2, I1, t1, r, b, v)
+        - K * _ksi(S, T, 0, I1, I2, I1, t1, r, b, v)
+        + K * _ksi(S, T, 0, K, I2, I1, t1, r, b, v)
+    )
+    return result
+
+
+def price(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+) -> FloatArray:
+    """The Bjerksund and Stensland (2002) American approximation.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to maturity of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+
+    Returns:
+        FloatArray: The prices of the options, in the broadcast shape of the
+            arguments.
+    """
+    is_call, S, K, T, r, b, v = np.broadcast_arrays(
+        np.asarray(is_call, dtype=np.bool_),
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, b, v))
+    )
+    shape = S.shape
+    is_call, S, K, T, r, b, v = (
+        x.ravel() for x in (is_call, S, K, T, r, b, v)
+    )
+
+    # Use the Bjerksund and Stensland put-call transformation
+    return _call_price(
+        np.where(is_call, S, K),
+        np.where(is_call, K, S),
+        T,
+        np.where(is_call, r, r - b),
+        np.where(is_call, b, -b),
+        v
+    ).reshape(shape)
+
+
+def ivol(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        p: ArrayLike,
+        *,
+        max_iterations: int = 20,
+        epsilon=1e-8
+) -> IVolResult:
+    """Calculate the volatilities of options that are implied by the prices.
+
+    Only the rows that have not converged are re-priced on each iteration.
+    Where the scalar version raises an overflow error, the row has a
+    volatility of nan and is not converged.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        p (ArrayLike): The option prices.
+        max_iterations (int, Optional): The maximum number of iterations for
+            any row. Defaults to 20.
+        epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+
+    Returns:
+        IVolResult: The implied volatilities, iteration counts and convergence
+            flags, in the broadcast shape of the arguments.
+    """
+    is_call, S, K, T, r, b, p = np.broadcast_arrays(
+        np.asarray(is_call, dtype=np.bool_),
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, b, p))
+    )
+    shape = p.shape
+    is_call, S, K, T, r, b, p = (
+        x.ravel() for x in (is_call, S, K, T, r, b, p)
+    )
+
+    # The approximation overflows for some contracts at the ends of the
+    # volatility bracket. These rows are reported as not converged.
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        result = solve_ivol(
+            p,
+            lambda v, i: price(is_call[i], S[i], K[i], T[i], r[i], b[i], v),
+            max_iterations=max_iterations,
+            epsilon=epsilon
+        )
+
+    return IVolResult(
+        result.vol.reshape(shape),
+        result.iterations.reshape(shape),
+        result.converged.reshape(shape)
+    )
+
+
+def make_numeric_greeks(is_call: ArrayLike) -> NumericGreeks:
+    """Make a class to generate greeks numerically using finite difference
+    methods.
+
+    The finite differences are calculated from array prices, so the greeks
+    of every contract are found with a few calls to the batch pricer.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+
+    Returns:
+        NumericGreeks: A class which can generate Greeks using finite difference
+            methods, taking and returning arrays.
+    """
+    return NumericGreeks(Pricer(price, is_call))
@@ -0,0 +1,140 @@
+"""Cox, Ross & Rubinstein binomial trees for NumPy arrays.
+
+This is an array based version of
+`jetblack_options.trees.cox_ross_rubinstein`. Every contract shares the
+number of steps, and the backward induction is performed for all the
+contracts at once, with one array operation per time step.
+
+The arguments may be scalars, NumPy arrays or pandas Series, and are
+broadcast against each other. The results are NumPy arrays.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy import exp, sqrt
+from numpy.typing import ArrayLike, NDArray
+
+FloatArray = NDArray[np.float64]
+
+
+def greeks(
+        is_european: ArrayLike,
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+        n: int
+) -> Tuple[FloatArray, FloatArray, FloatArray, FloatArray]:
+    """Cox-Ross-Rubinstein binomial trees returning the prices and some greeks.
+
+    Args:
+        is_european (ArrayLike): True for European, false for American.
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to maturity of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+        n (int): The number of the steps in the trees.
+
+    Returns:
+        Tuple[FloatArray, FloatArray, FloatArray, FloatArray]: The prices,
+            deltas, gammas and thetas, in the broadcast shape of the
+            arguments.
+    """
+    is_european, is_call, S, K, T, r, b, v = np.broadcast_arrays(
+        np.asarray(is_european, dtype=np.bool_),
+        np.asarray(is_call, dtype=np.bool_),
+        *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, b, v))
+    )
+    shape = S.shape
+
+    # Work with column vectors, so each contract is a row of the tree.
+    is_american, z, S, K, T, r, b, v = (
+        x.reshape(-1, 1)
+        for x in (~is_european, np.where(is_call, 1.0, -1.0), S, K, T, r, b, v)
+    )
+
+    dT = T / n
+    u = exp(v * sqrt(dT))
+    d = 1 / u
+    a = exp(b * dT)
+    p = (a - d) / (u - d)
+    df = exp(-r * dT)
+
+    # The asset prices at the final step. The prices at each earlier step are
+    # found by moving down from the node above.
+    asset = S * u ** np.arange(n + 1) * d ** np.arange(n, -1, -1)
+    option_value = np.maximum(0, z * (asset - K))
+
+    delta = gamma = theta = np.full(S.shape, np.nan)
+
+    for j in range(n-1, -1, -1):
+        asset = asset[:, 1:j+2] * d
+        option_value = (
+            p * option_value[:, 1:j+2] +
+            (1 - p) * option_value[:, :j+1]
+        ) * df
+        option_value = np.where(
+            is_american,
+            np.maximum(z * (asset - K), option_value),
+            option_value
+        )
+
+        if j == 2:
+            gamma = (
+                (option_value[:, 2:3] - option_value[:, 1:2]) / (S * u ** 2 - S)
+                - (option_value[:, 1:2] - option_value[:, 0:1]) / (S - S * d ** 2)
+            ) / (0.5 * (S * u ** 2 - S * d ** 2))
+            theta = option_value[:, 1:2]
+
+        if j == 1:
+            delta = (
+                option_value[:, 1:2] - option_value[:, 0:1]
+            ) / (S * u - S * d)
+
+    theta = (theta - option_value[:, 0:1]) / (2 * dT) / 365
+
+    return (
+        option_value.reshape(shape),
+        delta.reshape(shape),
+        gamma.reshape(shape),
+        theta.reshape(shape)
+    )
+
+
+def price(
+        is_european: ArrayLike,
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike,
+        n: int
+) -> FloatArray:
+    """Calculate the prices of options using Cox, Ross & Rubenstein binomial
+    trees.
+
+    Args:
+        is_european (ArrayLike): True for European, false for American.
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to maturity of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+        n (int): The number of the steps in the trees.
+
+    Returns:
+        FloatArray: The prices of the options.
+    """
+    p, *_ = greeks(is_european, is_call, S, K, T, r, b, v, n)
+    return p
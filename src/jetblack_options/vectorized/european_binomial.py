@@ -0,0 +1,125 @@
+"""European binomial trees for a ladder of strikes with NumPy arrays.
+
+This is an array based version of `jetblack_options.trees.european_binomial`
+for options which differ only in their strike and type. The options share
+the final nodes of the tree and the probabilities of reaching them, so these
+are found once. The price of each strike is then read from cumulative sums
+of the weighted payoffs above and below the strike, so a ladder of strikes
+costs little more than a single price, even for trees with many thousands of
+steps.
+
+The strikes and types may be scalars, NumPy arrays or pandas Series, and are
+broadcast against each other. The results are NumPy arrays.
+"""
+
+from math import exp, floor, sqrt
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+FloatArray = NDArray[np.float64]
+
+
+def binomial_weights(n: int, p: float) -> FloatArray:
+    """The probabilities of reaching each node at the final step of a
+    binomial tree.
+
+    The weights are found from the ratio of neighbouring weights, moving out
+    from the most likely node, and are then scaled to sum to one, as for
+    `jetblack_options.trees.european_binomial.binomial_weights`.
+
+    Args:
+        n (int): The number of the steps in the tree.
+        p (float): The probability of an up move.
+
+    Raises:
+        ValueError: If the probability is not between 0 and 1.
+
+    Returns:
+        FloatArray: The weights, for 0 to n up moves.
+    """
+    if not 0 < p < 1:
+        raise ValueError("The probability of an up move must be in (0, 1)")
+
+    odds = p / (1 - p)
+    mode = min(floor((n + 1) * p), n)
+
+    j = np.arange(n + 1, dtype=np.float64)
+    up = np.cumprod((n - j[mode:n]) * odds / (j[mode:n] + 1))
+    down = np.cumprod(j[mode:0:-1] / ((n - j[mode:0:-1] + 1) * odds))
+    weights = np.concatenate((down[::-1], [1.0], up))
+
+    return weights / weights.sum()
+
+
+def strike_ladder(
+        is_call: ArrayLike,
+        S: float,
+        K: ArrayLike,
+        T: float,
+        r: float,
+        b: float,
+        v: float,
+        n: int
+) -> FloatArray:
+    """European binomial option pricing trees for a ladder of strikes.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (float): The current asset price.
+        K (ArrayLike): The option strike prices.
+        T (float): The time to maturity of the options in years.
+        r (float): The risk free rate.
+        b (float): The cost of carry of the asset.
+        v (float): The volatility of the asset.
+        n (int): The number of the steps in the tree.
+
+    Raises:
+        ValueError: If the probability of an up move is not in (0, 1).
+
+    Returns:
+        FloatArray: The prices of the options, in the broadcast shape of the
+            types and strikes.
+    """
+    is_call, K = np.broadcast_arrays(
+        np.asarray(is_call, dtype=np.bool_),
+        np.asarray(K, dtype=np.float64)
+    )
+
+    dt = T / n
+    u = exp(v * sqrt(dt))
+    d = 1 / u
+    a = exp(b * dt)
+    p = (a - d) / (u - d)
+
+    weights = binomial_weights(n, p)
+
+    # The asset prices of the final nodes are found by moving out from the
+    # most likely node, multiplying by u / d or d / u for each node, rather
+    # than forming the powers for each node.
+    mode = int(np.argmax(weights))
+    up = np.full(n + 1 - mode, u / d)
+    up[0] = S * u ** mode * d ** (n - mode)
+    down = np.full(mode + 1, d / u)
+    down[0] = up[0]
+    asset = np.concatenate((np.cumprod(down)[:0:-1], np.cumprod(up)))
+
+    # The sums of the weights, and the weighted asset prices, of the nodes
+    # below each node, and of the node and those above it. Each is summed
+    # from its tail, where the terms are smallest.
+    zero = np.zeros(1)
+    below_weight = np.concatenate((zero, np.cumsum(weights)))
+    below_asset = np.concatenate((zero, np.cumsum(weights * asset)))
+    above_weight = np.concatenate((np.cumsum(weights[::-1])[::-1], zero))
+    above_asset = np.concatenate((
+        np.cumsum((weights * asset)[::-1])[::-1], zero
+    ))
+
+    # The first node with an asset price above the strike.
+    A = np.searchsorted(asset, K, side='right')
+
+    return exp(-r * T) * np.where(
+        is_call,
+        above_asset[A] - K * above_weight[A],
+        K * below_weight[A] - below_asset[A]
+    )
@@ -0,0 +1,867 @@
+"""Black-Scholes-Merton options pricing formulae for NumPy arrays.
+
+This is an array based version of
+`jetblack_options.european.generalised_black_scholes`. The arguments may be
+scalars, NumPy arrays or pandas Series, and are broadcast against each other.
+The results are NumPy arrays.
+
+The cost of carry rate (b) is:
+
+* b == r: for non dividend paying stocks
+* b == r - q: For dividend paying stocks where the dividend yield is q
+* b == 0: for futures options
+* b = r - rj: for currency options.
+"""
+
+from typing import Tuple
+
+import numpy as np
+from numpy import exp, log, pi, sqrt
+from numpy.typing import ArrayLike, NDArray
+
+from .distributions import cdf, pdf
+from .implied_volatility import IVolResult, solve_ivol
+
+FloatArray = NDArray[np.float64]
+BoolArray = NDArray[np.bool_]
+
+
+def _as_arrays(*args: ArrayLike) -> Tuple[FloatArray, ...]:
+    return tuple(np.asarray(arg, dtype=np.float64) for arg in args)
+
+
+def _d1(
+        S: FloatArray,
+        K: FloatArray,
+        T: FloatArray,
+        b: FloatArray,
+        v: FloatArray
+) -> FloatArray:
+    return (log(S / K) + T * (b + v ** 2 / 2)) / (v * sqrt(T))
+
+
+def price(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The fair value of European options, using Black-Scholes-Merton.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+
+    Returns:
+        FloatArray: The prices of the options.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+
+    return np.where(
+        is_call,
+        S * exp((b - r) * T) * cdf(d1) - K * exp(-r * T) * cdf(d2),
+        K * exp(-r * T) * cdf(-d2) - S * exp((b - r) * T) * cdf(-d1)
+    )
+
+
+def ivol(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        p: ArrayLike,
+        *,
+        max_iterations: int = 20,
+        epsilon=1e-8
+) -> IVolResult:
+    """Calculate the volatilities of options that are implied by the prices.
+
+    Only the rows that have not converged are re-priced on each iteration.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        p (ArrayLike): The option prices.
+        max_iterations (int, Optional): The maximum number of iterations for
+            any row. Defaults to 20.
+        epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+
+    Returns:
+        IVolResult: The implied volatilities, iteration counts and convergence
+            flags, in the broadcast shape of the arguments.
+    """
+    is_call, S, K, T, r, b, p = np.broadcast_arrays(
+        np.asarray(is_call, dtype=np.bool_),
+        *_as_arrays(S, K, T, r, b, p)
+    )
+    shape = p.shape
+    is_call, S, K, T, r, b, p = (
+        x.ravel() for x in (is_call, S, K, T, r, b, p)
+    )
+
+    result = solve_ivol(
+        p,
+        lambda v, i: price(is_call[i], S[i], K[i], T[i], r[i], b[i], v),
+        max_iterations=max_iterations,
+        epsilon=epsilon
+    )
+
+    return IVolResult(
+        result.vol.reshape(shape),
+        result.iterations.reshape(shape),
+        result.converged.reshape(shape)
+    )
+
+
+def delta(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The sensitivity of the options to a change in the asset price.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+
+    Returns:
+        FloatArray: The deltas.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+
+    return np.where(
+        is_call,
+        exp((b - r) * T) * cdf(d1),
+        -exp((b - r) * T) * cdf(-d1)
+    )
+
+
+def gamma(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The second derivative to the change in the asset price.
+
+    Args:
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+
+    Returns:
+        FloatArray: The gammas.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+
+    return exp((b - r) * T) * pdf(d1) / (S * v * sqrt(T))
+
+
+def theta(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The theta or time decay of the value of the options.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The thetas.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+
+    p1 = -S * exp((b - r) * T) * pdf(d1) * v / (2 * sqrt(T))
+    return np.where(
+        is_call,
+        p1
+        - (b - r) * S * exp((b - r) * T) * cdf(d1)
+        - r * K * exp(-r * T) * cdf(d2),
+        p1
+        + (b - r) * S * exp((b - r) * T) * cdf(-d1)
+        + r * K * exp(-r * T) * cdf(-d2)
+    )
+
+
+def vega(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The sensitivity of the options price or a change in the asset volatility.
+
+    Args:
+        S (ArrayLike): The current asset price.
+        K (ArrayLike): The option strike price
+        T (ArrayLike): The time to expiry of the option in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry of the asset.
+        v (ArrayLike): The volatility of the asset.
+
+    Returns:
+        FloatArray: The vegas.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+
+    return S * exp((b - r) * T) * pdf(d1) * sqrt(T)
+
+
+def rho(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The sensitivity of the option prices to the risk free rate.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The rhos.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d2 = _d1(S, K, T, b, v) - v * sqrt(T)
+
+    return np.where(
+        is_call,
+        T * K * exp(-r * T) * cdf(d2),
+        -T * K * exp(-r * T) * cdf(-d2)
+    )
+
+
+def carry(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """Sensitivity to the cost of carry.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The carries.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+
+    return np.where(
+        is_call,
+        T * S * exp((b - r) * T) * cdf(d1),
+        -T * S * exp((b - r) * T) * cdf(-d1)
+    )
+
+
+def elasticity(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The percentage change in the option prices for a percentage change in
+    the asset price.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The elasticities.
+    """
+    return (
+        delta(is_call, S, K, T, r, b, v) * np.asarray(S, dtype=np.float64)
+        / price(is_call, S, K, T, r, b, v)
+    )
+
+
+def gammap(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    return gamma(S, K, T, r, b, v) * np.asarray(S, dtype=np.float64) / 100
+
+
+def vegap(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    return vega(S, K, T, r, b, v) * np.asarray(v, dtype=np.float64) * 10
+
+
+def forward_delta(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+
+    return np.where(
+        is_call,
+        exp(-r * T) * cdf(d1),
+        exp(-r * T) * (cdf(d1) - 1)
+    )
+
+
+def vanna(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """The second order derivative of the option prices to a change in the
+    asset price and a change in the volatility.
+
+    Also known as DdeltaDvol.
+
+    Args:
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The vannas.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+
+    return -exp((b - r) * T) * d2 / v * pdf(d1)
+
+
+def ddelta_dvol_dvol(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as DVannaDvol
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return vanna(S, K, T, r, b, v) / v * (d1 * d2 - d1 / d2 - 1)
+
+
+def charm(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    """Measures the instantaneous rate of change of delta over the passage of
+    time.
+
+    Also known as DdeltaDtime.
+
+    Args:
+        is_call (ArrayLike): True for a call, false for a put.
+        S (ArrayLike): The asset price.
+        K (ArrayLike): The strike price.
+        T (ArrayLike): The time to expiry in years.
+        r (ArrayLike): The risk free rate.
+        b (ArrayLike): The cost of carry.
+        v (ArrayLike): The asset volatility.
+
+    Returns:
+        FloatArray: The charms.
+    """
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+
+    p1 = pdf(d1) * (b / (v * sqrt(T)) - d2 / (2 * T))
+    return np.where(
+        is_call,
+        -exp((b - r) * T) * (p1 + (b - r) * cdf(d1)),
+        -exp((b - r) * T) * (p1 - (b - r) * cdf(-d1))
+    )
+
+
+def saddle_gamma(
+        K: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    K, r, b, v = _as_arrays(K, r, b, v)
+    return sqrt(exp(1) / pi) * sqrt((2 * b - r) / v ** 2 + 1) / K
+
+
+def dgamma_dspot(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as Speed
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    return -gamma(S, K, T, r, b, v) * (1 + d1 / (v * sqrt(T))) / S
+
+
+def dgamma_dvol(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as zomma.
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return gamma(S, K, T, r, b, v) * ((d1 * d2 - 1) / v)
+
+
+def dgamma_dtime(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return gamma(S, K, T, r, b, v) * (
+        r - b + b * d1 / (v * sqrt(T)) +
+        (1 - d1 * d2) / (2 * T)
+    )
+
+
+def dgammap_dspot(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as SpeedP.
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    return -gamma(S, K, T, r, b, v) * (d1) / (100 * v * sqrt(T))
+
+
+def dgammap_dvol(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return S / 100 * gamma(S, K, T, r, b, v) * ((d1 * d2 - 1) / v)
+
+
+def dgammap_dtime(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return (
+        gammap(S, K, T, r, b, v) *
+        (r - b + b * d1 / (v * sqrt(T)) + (1 - d1 * d2) / (2 * T))
+    )
+
+
+def dvega_dtime(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return (
+        vega(S, K, T, r, b, v) *
+        (r - b + b * d1 / (v * sqrt(T)) - (1 + d1 * d2) / (2 * T))
+    )
+
+
+def vomma(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as DvegaDvol
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return vega(S, K, T, r, b, v) * d1 * d2 / v
+
+
+def dvomma_dvol(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return (
+        vomma(S, K, T, r, b, v) *
+        1 / v * (d1 * d2 - d1 / d2 - d2 / d1 - 1)
+    )
+
+
+def dvegap_dvol(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as VommaP.
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return vegap(S, K, T, r, b, v) * d1 * d2 / v
+
+
+def vega_leverage(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    return (
+        vega(S, K, T, r, b, v) * np.asarray(v, dtype=np.float64) /
+        price(is_call, S, K, T, r, b, v)
+    )
+
+
+def variance_vega(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    return S * exp((b - r) * T) * pdf(d1) * sqrt(T) / (2 * v)
+
+
+def variance_delta(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return S * exp((b - r) * T) * pdf(d1) * (-d2) / (2 * v ** 2)
+
+
+def variance_vomma(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return (
+        S * exp((b - r) * T) * sqrt(T) /
+        (4 * v ** 3) * pdf(d1) * (d1 * d2 - 1)
+    )
+
+
+def variance_ultima(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return (
+        S * exp((b - r) * T) * sqrt(T) /
+        (8 * v ** 5) * pdf(d1) *
+        ((d1 * d2 - 1) *
+         (d1 * d2 - 3) -
+         (d1 ** 2 + d2 ** 2))
+    )
+
+
+def theta_driftless(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    return -S * exp((b - r) * T) * pdf(d1) * v / (2 * sqrt(T))
+
+
+def futures_rho(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    return (
+        -np.asarray(T, dtype=np.float64) *
+        price(is_call, S, K, T, r, 0.0, v)
+    )
+
+
+def phi(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Also known as rho2.
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d1 = _d1(S, K, T, b, v)
+    return np.where(
+        is_call,
+        -T * S * exp((b - r) * T) * cdf(d1),
+        T * S * exp((b - r) * T) * cdf(-d1)
+    )
+
+
+def dzeta_dvol(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, b, v = _as_arrays(S, K, T, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return np.where(
+        is_call,
+        -pdf(d2) * d1 / v,
+        pdf(d2) * d1 / v
+    )
+
+
+def dzeta_dtime(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, b, v = _as_arrays(S, K, T, b, v)
+    d1 = _d1(S, K, T, b, v)
+    d2 = d1 - v * sqrt(T)
+    return np.where(
+        is_call,
+        pdf(d2) * (b / (v * sqrt(T)) - d1 / (2 * T)),
+        -pdf(d2) * (b / (v * sqrt(T)) - d1 / (2 * T))
+    )
+
+
+def break_even_probability(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    # Risk neutral break even probability.
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    is_call = np.asarray(is_call, dtype=np.bool_)
+    K = np.where(
+        is_call,
+        K + price(True, S, K, T, r, b, v) * exp(r * T),
+        K - price(False, S, K, T, r, b, v) * exp(r * T)
+    )
+    d2 = (log(S / K) + (b - v ** 2 / 2) * T) / (v * sqrt(T))
+    return np.where(is_call, cdf(d2), cdf(-d2))
+
+
+def strike_delta(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d2 = (log(S / K) + (b - v ** 2 / 2) * T) / (v * sqrt(T))
+    return np.where(
+        is_call,
+        -exp(-r * T) * cdf(d2),
+        exp(-r * T) * cdf(-d2)
+    )
+
+
+def risk_neutral_density(
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        r: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, r, b, v = _as_arrays(S, K, T, r, b, v)
+    d2 = (log(S / K) + (b - v ** 2 / 2) * T) / (v * sqrt(T))
+    return exp(-r * T) * pdf(d2) / (K * v * sqrt(T))
+
+
+def in_the_money_probability(
+        is_call: ArrayLike,
+        S: ArrayLike,
+        K: ArrayLike,
+        T: ArrayLike,
+        b: ArrayLike,
+        v: ArrayLike
+) -> FloatArray:
+    S, K, T, b, v = _as_arrays(S, K, T, b, v)
+    d2 = (log(S / K) + (b - v ** 2 / 2) * T) / (v * sqrt(T))
+    return np.where(is_call, cdf(d2), cdf(-d2))
@@ -0,0 +1,98 @@
+"""Implied volatility for NumPy arrays"""
+
+from typing import Callable, NamedTuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+BatchPrice = Callable[
+    [
+        NDArray[np.float64],  # The volatilities of the rows to price.
+        NDArray[np.intp]  # The indices of the rows to price.
+    ],
+    NDArray[np.float64]  # The option prices of the rows.
+]
+
+
+class IVolResult(NamedTuple):
+    """The result of a batched implied volatility solve."""
+
+    vol: NDArray[np.float64]
+    """The implied volatility of each row."""
+    iterations: NDArray[np.int64]
+    """The number of iterations performed for each row."""
+    converged: NDArray[np.bool_]
+    """True if the row converged within the tolerance."""
+
+
+def solve_ivol(
+        p: ArrayLike,
+        price: BatchPrice,
+        *,
+        max_iterations: int = 20,
+        epsilon=1e-8
+) -> IVolResult:
+    """Solve for the implied volatility of a batch of options.
+
+    This uses the same bracketed regula falsi as
+    `jetblack_options.implied_volatility.solve_ivol`, but only the rows that
+    have not yet converged are re-priced on each iteration.
+
+    The price function is called with the volatilities and the indices of the
+    rows being priced, and must return the prices of those rows. The prices may
+    have any shape, including a scalar; the rows are their positions in the
+    flattened prices, and the results have the shape of the prices.
+
+    Args:
+        p (ArrayLike): The option prices.
+        price (BatchPrice): The batch pricing function.
+        max_iterations (int, Optional): The maximum number of iterations for
+            any row. Defaults to 20.
+        epsilon (float, Optional): The largest acceptable error. Defaults to 1e-8.
+
+    Returns:
+        IVolResult: The volatilities, iteration counts and convergence flags.
+    """
+    p = np.asarray(p, dtype=np.float64)
+    shape = p.shape
+    p = p.ravel()
+    rows = np.arange(p.size)
+
+    v_lo = np.full(p.size, 0.005)
+    v_hi = np.full(p.size, 4.0)
+    p_lo = price(v_lo, rows)
+    p_hi = price(v_hi, rows)
+
+    v = v_lo + (p - p_lo) * (v_hi - v_lo) / (p_hi - p_lo)
+    p1 = price(v, rows)
+
+    iterations = np.zeros(p.size, dtype=np.int64)
+    converged = np.abs(p - p1) <= epsilon
+    active = rows[~converged]
+
+    n = 0
+    while len(active) > 0 and n < max_iterations:
+        n += 1
+
+        # The bracket end points are updated from the last evaluated price, so
+        # they do not need to be re-priced.
+        is_low = p1[active] < p[active]
+        v_lo[active] = np.where(is_low, v[active], v_lo[active])
+        p_lo[active] = np.where(is_low, p1[active], p_lo[active])
+        v_hi[active] = np.where(is_low, v_hi[active], v[active])
+        p_hi[active] = np.where(is_low, p_hi[active], p1[active])
+
+        v[active] = v_lo[active] + (p[active] - p_lo[active]) * (
+            v_hi[active] - v_lo[active]
+        ) / (p_hi[active] - p_lo[active])
+        p1[active] = price(v[active], active)
+        iterations[active] = n
+
+        converged[active] = np.abs(p[active] - p1[active]) <= epsilon
+        active = active[~converged[active]]
+
+    return IVolResult(
+        v.reshape(shape),
+        iterations.reshape(shape),
+        converged.reshape(shape)
+    )
@@ -0,0 +1,337 @@
+"""Numeric greeks for NumPy arrays, evaluating every bump in one call.
+
+`jetblack_options.numeric_greeks.with_carry.NumericGreeks` prices the option
+two to six times for each greek. Here the finite difference stencils of all
+the requested greeks are combined, the bumps they have in common (such as
+the unbumped price) are priced once, and the bumped arguments are stacked
+on a new leading axis so the pricer is called a single time. Very large
+books are split into a few calls, as the pricers are slower per option when
+their arrays no longer fit in the processor caches.
+
+The formulae are the central differences of `NumericGreeks`, where the rho
+bumps both the risk free rate and the cost of carry.
+
+```python
+from jetblack_options.vectorized.bjerksund_stensland_2002 import (
+    make_numeric_greeks
+)
+from jetblack_options.vectorized.numeric_greeks import StencilGreeks
+
+sg = StencilGreeks(make_numeric_greeks(is_call).price)
+greeks = sg.all_greeks(S, K, T, r, b, v)
+```
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
+
+FloatArray = NDArray[np.float64]
+
+ArrayOptionValue = Callable[
+    [
+        FloatArray,  # Asset price.
+        FloatArray,  # Strike.
+        FloatArray,  # Time to expiry in years.
+        FloatArray,  # Risk free rate.
+        FloatArray,  # Cost of carry.
+        FloatArray  # Asset volatility
+    ],
+    FloatArray  # The option prices
+]
+
+# The multiples of dS, dT, dr, db and dv of a bump.
+Offset = Tuple[int, int, int, int, int]
+
+
+class Bumps(NamedTuple):
+    """The sizes of the bumps."""
+
+    dS: float
+    """The change in the asset price."""
+    dT: float
+    """The change in the time to expiry."""
+    dr: float
+    """The change in the risk free rate."""
+    db: float
+    """The change in the cost of carry."""
+    dv: float
+    """The change in the volatility."""
+
+
+class ArrayGreeks(NamedTuple):
+    """The price and first and second order greeks of arrays of options, with
+    the fields of `jetblack_options.greeks.Greeks`."""
+
+    price: FloatArray
+    """The option prices."""
+    delta: FloatArray
+    """The sensitivities to the asset price."""
+    gamma: FloatArray
+    """The second order sensitivities to the asset price."""
+    theta: FloatArray
+    """The sensitivities to the passage of time."""
+    vega: FloatArray
+    """The sensitivities to the volatility."""
+    rho: FloatArray
+    """The sensitivities to the risk free rate."""
+    vanna: FloatArray
+    """The sensitivities of the deltas to the volatility."""
+    charm: FloatArray
+    """The sensitivities of the deltas to the passage of time."""
+    vomma: FloatArray
+    """The second order sensitivities to the volatility."""
+
+
+class _Stencil(NamedTuple):
+    terms: Tuple[Tuple[float, Offset], ...]
+    scale: Callable[[Bumps], float]
+
+
+BASE: Offset = (0, 0, 0, 0, 0)
+
+
+def _offset(S: int = 0, T: int = 0, r: int = 0, b: int = 0, v: int = 0) -> Offset:
+    return (S, T, r, b, v)
+
+
+STENCILS: Dict[str, _Stencil] = {
+    'price': _Stencil(
+        ((1, BASE),),
+        lambda d: 1.0
+    ),
+    'delta': _Stencil(
+        ((1, _offset(S=1)), (-1, _offset(S=-1))),
+        lambda d: 2 * d.dS
+    ),
+    'gamma': _Stencil(
+        ((1, _offset(S=1)), (-2, BASE), (1, _offset(S=-1))),
+        lambda d: d.dS ** 2
+    ),
+    'speed': _Stencil(
+        (
+            (1, _offset(S=2)),
+            (-3, _offset(S=1)),
+            (3, BASE),
+            (-1, _offset(S=-1)),
+        ),
+        lambda d: d.dS ** 3
+    ),
+    'theta': _Stencil(
+        ((1, _offset(T=-1)), (-1, _offset(T=1))),
+        lambda d: 2 * d.dT
+    ),
+    'time_gamma': _Stencil(
+        ((1, _offset(T=1)), (-2, BASE), (1, _offset(T=-1))),
+        lambda d: d.dT ** 2
+    ),
+    'vega': _Stencil(
+        ((1, _offset(v=1)), (-1, _offset(v=-1))),
+        lambda d: 2 * d.dv
+    ),
+    'vomma': _Stencil(
+        ((1, _offset(v=1)), (-2, BASE), (1, _offset(v=-1))),
+        lambda d: d.dv ** 2
+    ),
+    'rho': _Stencil(
+        ((1, _offset(r=1, b=1)), (-1, _offset(r=-1, b=-1))),
+        lambda d: 2 * d.dr
+    ),
+    'carry': _Stencil(
+        ((1, _offset(b=1)), (-1, _offset(b=-1))),
+        lambda d: 2 * d.db
+    ),
+    'vanna': _Stencil(
+        (
+            (1, _offset(S=1, v=1)),
+            (-1, _offset(S=1, v=-1)),
+            (-1, _offset(S=-1, v=1)),
+            (1, _offset(S=-1, v=-1)),
+        ),
+        lambda d: 4 * d.dS * d.dv
+    ),
+    'charm': _Stencil(
+        (
+            (1, _offset(S=1, T=1)),
+            (-1, _offset(S=1, T=-1)),
+            (-1, _offset(S=-1, T=1)),
+            (1, _offset(S=-1, T=-1)),
+        ),
+        lambda d: -4 * d.dS * d.dT
+    ),
+    'dgamma_dvol': _Stencil(
+        (
+            (1, _offset(S=1, v=1)),
+            (-2, _offset(v=1)),
+            (1, _offset(S=-1, v=1)),
+            (-1, _offset(S=1, v=-1)),
+            (2, _offset(v=-1)),
+            (-1, _offset(S=-1, v=-1)),
+        ),
+        lambda d: 2 * d.dv * d.dS ** 2
+    ),
+}
+"""The central difference stencils of the supported greeks."""
+
+
+def stencil_offsets(names: Sequence[str]) -> List[Offset]:
+    """The distinct bumps needed to calculate the greeks.
+
+    Args:
+        names (Sequence[str]): The names of the greeks.
+
+    Raises:
+        ValueError: If a greek is not supported.
+
+    Returns:
+        List[Offset]: The bumps, as multiples of (dS, dT, dr, db, dv), in the
+            order they are first used.
+    """
+    offsets: Dict[Offset, None] = {}
+    for name in names:
+        if name not in STENCILS:
+            raise ValueError(f"Unsupported greek '{name}'")
+        for _, offset in STENCILS[name].terms:
+            offsets[offset] = None
+    return list(offsets)
+
+
+class StencilGreeks:
+    """Calculate numeric greeks with a single call to an array pricer."""
+
+    def __init__(
+            self,
+            price: ArrayOptionValue,
+            *,
+            batch_size: int = 16384
+    ) -> None:
+        """Initialise the greeks.
+
+        Args:
+            price (ArrayOptionValue): The array pricer, taking the asset
+                price, strike, time to expiry, risk free rate, cost of carry
+                and volatility. It must broadcast its arguments.
+            batch_size (int, optional): The number of options above which the
+                bumps are split over several calls to the pricer, as very
+                large arrays are slower per option. Defaults to 16384.
+        """
+        self.price = price
+        self.batch_size = batch_size
+
+    def greeks(
+            self,
+            names: Sequence[str],
+            S: ArrayLike,
+            K: ArrayLike,
+            T: ArrayLike,
+            r: ArrayLike,
+            b: ArrayLike,
+            v: ArrayLike,
+            *,
+            dS: float = 0.01,
+            dT: float = 1 / 365,
+            dr: float = 0.001,
+            db: float = 0.001,
+            dv: float = 0.001
+    ) -> Dict[str, FloatArray]:
+        """Calculate the requested greeks.
+
+        The supported names are the keys of `STENCILS`.
+
+        Args:
+            names (Sequence[str]): The names of the greeks.
+            S (ArrayLike): The asset price.
+            K (ArrayLike): The strike.
+            T (ArrayLike): Time to expiry in years.
+            r (ArrayLike): The risk free rate.
+            b (ArrayLike): The cost of carry.
+            v (ArrayLike): The volatility.
+            dS (float, optional): The change in the asset price. Defaults to 0.01.
+            dT (float, optional): The change in time. Defaults to 1/365.
+            dr (float, optional): The change in the rate. Defaults to 0.001.
+            db (float, optional): The change in the carry. Defaults to 0.001.
+            dv (float, optional): The change in the volatility. Defaults to 0.001.
+
+        Raises:
+            ValueError: If a greek is not supported.
+
+        Returns:
+            Dict[str, FloatArray]: The greeks keyed by name, in the broadcast
+                shape of the arguments.
+        """
+        offsets = stencil_offsets(names)
+        bumps = Bumps(dS, dT, dr, db, dv)
+
+        S, K, T, r, b, v = np.broadcast_arrays(
+            *(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, b, v))
+        )
+
+        # Stack the bumped arguments on a new leading axis, in batches of as
+        # many bumps as fit in the batch size.
+        multiples = np.array(offsets, dtype=np.float64).T.reshape(
+            (5, len(offsets)) + (1,) * S.ndim
+        )
+        step = max(1, self.batch_size // max(1, S.size))
+        prices: Dict[Offset, FloatArray] = {}
+        for start in range(0, len(offsets), step):
+            batch = multiples[:, start:start + step]
+            values = self.price(
+                S + batch[0] * dS,
+                K,
+                T + batch[1] * dT,
+                r + batch[2] * dr,
+                b + batch[3] * db,
+                v + batch[4] * dv
+            )
+            prices.update(zip(offsets[start:start + step], values))
+
+        return {
+            name: sum(
+                (
+                    weight * prices[offset]
+                    for weight, offset in STENCILS[name].terms
+                ),
+                np.zeros(S.shape)
+            ) / STENCILS[name].scale(bumps)
+            for name in names
+        }
+
+    def all_greeks(
+            self,
+            S: ArrayLike,
+            K: ArrayLike,
+            T: ArrayLike,
+            r: ArrayLike,
+            b: ArrayLike,
+            v: ArrayLike,
+            *,
+            dS: float = 0.01,
+            dT: float = 1 / 365,
+            dr: float = 0.001,
+            dv: float = 0.001
+    ) -> ArrayGreeks:
+        """Calculate the price and the first and second order greeks.
+
+        Args:
+            S (ArrayLike): The asset price.
+            K (ArrayLike): The strike.
+            T (ArrayLike): Time to expiry in years.
+            r (ArrayLike): The risk free rate.
+            b (ArrayLike): The cost of carry.
+            v (ArrayLike): The volatility.
+            dS (float, optional): The change in the asset price. Defaults to 0.01.
+            dT (float, optional): The change in time. Defaults to 1/365.
+            dr (float, optional): The change in the rate. Defaults to 0.001.
+            dv (float, optional): The change in the volatility. Defaults to 0.001.
+
+        Returns:
+            ArrayGreeks: The price and greeks, as arrays in the broadcast shape
+                of the arguments.
+        """
+        greeks = self.greeks(
+            ArrayGreeks._fields,
+            S, K, T, r, b, v,
+            dS=dS, dT=dT, dr=dr, dv=dv
+        )
+        return ArrayGreeks(**greeks)
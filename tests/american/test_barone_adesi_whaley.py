@@ -1,9 +1,17 @@
 """Tests for Barone-Adesi-Whaley"""
 
+from math import isinf
+
 from jetblack_options.american.barone_adesi_whaley import (
+    _kc,
+    _kp,
+    clear_critical_price_cache,
+    critical_price,
+    critical_price_cache_info,
     price,
     make_numeric_greeks
 )
+from jetblack_options.distributions import FLOAT_MATH
 
 from ..utils import is_close_to
 
@@ -96,3 +104,41 @@ def test_rho():
         b = r - q
         numeric = ng[is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_critical_price():
+    assert is_close_to(
+        critical_price(True, 100, 0.5, 0.1, 0.02, 0.125),
+        _kc(FLOAT_MATH, 100, 0.5, 0.1, 0.02, 0.125),
+        1e-12
+    )
+    assert is_close_to(
+        critical_price(False, 100, 0.5, 0.1, 0.02, 0.125),
+        _kp(FLOAT_MATH, 100, 0.5, 0.1, 0.02, 0.125),
+        1e-12
+    )
+    # A call is never exercised early when the cost of carry is at least the
+    # risk free rate.
+    assert isinf(critical_price(True, 100, 0.5, 0.05, 0.05, 0.125))
+
+
+def test_critical_price_cache():
+    clear_critical_price_cache()
+
+    # The critical price is solved once for a ladder of asset prices.
+    for S in (90, 95, 100, 105, 110):
+        price(False, S, 100, 0.5, 0.1, 0.02, 0.125)
+    info = critical_price_cache_info()
+    assert info.misses == 1
+    assert info.hits == 4
+    assert info.currsize == 1
+
+    # Bumping the asset price for delta re-uses the critical price.
+    ng[False].delta(100, 100, 0.5, 0.1, 0.02, 0.125)
+    info = critical_price_cache_info()
+    assert info.misses == 1
+    assert info.hits > 4
+
+    clear_critical_price_cache()
+    info = critical_price_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
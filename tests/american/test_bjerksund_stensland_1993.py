@@ -96,3 +96,20 @@ def test_rho():
         b = r - q
         numeric = ng[is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_complex_step():
+
+    # Include calls which are never exercised early, and a put which is
+    # exercised immediately.
+    for is_call, S, K, T, r, b, v in [
+        (True, 100, 95, 0.5, 0.08, 0.03, 0.3),
+        (True, 100, 95, 0.5, 0.08, 0.1, 0.3),
+        (False, 100, 95, 0.5, 0.08, 0.03, 0.3),
+        (False, 110, 100, 0.5, 0.1, 0.02, 0.125),
+        (False, 50, 100, 0.5, 0.1, 0.02, 0.125),
+    ]:
+        for name in ('delta', 'theta', 'vega', 'rho', 'carry'):
+            greek = getattr(ng[is_call], name)
+            actual = greek(S, K, T, r, b, v, method='complex')
+            assert is_close_to(actual, greek(S, K, T, r, b, v), 1e-3)
@@ -2,6 +2,7 @@
 
 from jetblack_options.american.bjerksund_stensland_2002 import (
     price,
+    price_gradient,
     make_numeric_greeks
 )
 
@@ -96,3 +97,29 @@ def test_rho():
         b = r - q
         numeric = ng[is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_price_gradient():
+
+    for is_call in (True, False):
+        for S, K, T, r, b, v in [
+            (110, 100, 0.5, 0.1, 0.02, 0.125),
+            (100, 100, 1, 0.05, -0.02, 0.3),
+            (90, 100, 2, 0.08, 0.02, 0.25),
+            (100, 90, 0.5, 0.05, 0.08, 0.2),
+            (200, 100, 0.5, 0.1, -0.1, 0.2),
+        ]:
+            actual = price_gradient(is_call, S, K, T, r, b, v)
+            assert actual.price == price(is_call, S, K, T, r, b, v)
+
+            # Compare with central differences in each argument.
+            args = [S, K, T, r, b, v]
+            for i, derivative in enumerate(actual[1:]):
+                h = 1e-5 * max(1, args[i])
+                up, down = list(args), list(args)
+                up[i] += h
+                down[i] -= h
+                expected = (
+                    price(is_call, *up) - price(is_call, *down)
+                ) / (2 * h)
+                assert is_close_to(derivative, expected, 1e-5)
@@ -0,0 +1,122 @@
+"""Tests for dual and hyper-dual numbers"""
+
+import math
+
+import pytest
+
+from jetblack_options.autodiff import functions
+from jetblack_options.autodiff.dual import Dual
+from jetblack_options.autodiff.hyper_dual import HyperDual
+from jetblack_options.distributions import FLOAT_MATH, cdf, pdf
+
+from ..utils import is_close_to
+
+
+def test_arithmetic():
+    x, y = Dual.variables(3.0, 2.0)
+
+    z = x * y + x / y - y ** 2 + 2 ** x - 1 / x + x ** y
+    assert is_close_to(z.value, 6 + 1.5 - 4 + 8 - 1 / 3 + 9, 1e-12)
+    # dz/dx = y + 1/y + 2^x log(2) + 1/x^2 + y x^(y-1)
+    assert is_close_to(
+        z.gradient[0],
+        2 + 0.5 + 8 * math.log(2) + 1 / 9 + 2 * 3,
+        1e-12
+    )
+    # dz/dy = x - x/y^2 - 2y + x^y log(x)
+    assert is_close_to(
+        z.gradient[1],
+        3 - 3 / 4 - 4 + 9 * math.log(3),
+        1e-12
+    )
+
+    z = -(x - 5)
+    assert z.value == 2 and z.gradient == (-1.0, 0.0)
+    assert abs(x - 5).gradient == (-1.0, -0.0)
+
+
+def test_comparisons():
+    x, y = Dual.variables(3.0, 2.0)
+    assert x > y and y < x and x >= 3 and x <= 3 and x == 3.0 and x != y
+    assert max(x, y) is x
+    assert math.floor(Dual(2.5, (1.0,))) == 2
+    assert math.ceil(Dual(2.5, (1.0,))) == 3
+    with pytest.raises(TypeError):
+        math.exp(x)  # type: ignore
+
+
+def test_functions():
+    for name, f, df, d2f in [
+        ('exp', math.exp, math.exp, math.exp),
+        ('log', math.log, lambda a: 1 / a, lambda a: -1 / a ** 2),
+        (
+            'sqrt',
+            math.sqrt,
+            lambda a: 0.5 / math.sqrt(a),
+            lambda a: -0.25 / a ** 1.5
+        ),
+        ('sin', math.sin, math.cos, lambda a: -math.sin(a)),
+        (
+            'asin',
+            math.asin,
+            lambda a: 1 / math.sqrt(1 - a * a),
+            lambda a: a / (1 - a * a) ** 1.5
+        ),
+        ('cdf', cdf, pdf, lambda a: -a * pdf(a)),
+        ('pdf', pdf, lambda a: -a * pdf(a), lambda a: (a * a - 1) * pdf(a)),
+    ]:
+        function = getattr(functions, name)
+        for a in (0.1, 0.5, 0.9):
+            assert function(a) == f(a)
+
+            x = function(Dual(a, (1.0,)))
+            assert is_close_to(x.value, f(a), 1e-15)
+            assert is_close_to(x.gradient[0], df(a), 1e-12)
+
+            x = function(HyperDual(a, 1.0, 1.0))
+            assert is_close_to(x.value, f(a), 1e-15)
+            assert is_close_to(x.e1, df(a), 1e-12)
+            assert is_close_to(x.e2, df(a), 1e-12)
+            assert is_close_to(x.e12, d2f(a), 1e-12)
+
+        # The float namespace holds the functions the dual functions call.
+        assert getattr(FLOAT_MATH, name) is f
+        assert getattr(functions.DUAL_MATH, name) is function
+
+
+def test_real():
+    # The branches of the kernels compare the values.
+    assert functions.real(Dual(2.0, (1.0,))) == 2.0
+    assert functions.real(HyperDual(2.0, 1.0, 1.0)) == 2.0
+    assert functions.real(2.0) == 2.0
+    assert FLOAT_MATH.real is float
+    assert functions.DUAL_MATH.real is functions.real
+
+
+def test_hyper_dual():
+    # f(x, y) = x^2 y / (1 + x) + y^x
+    def f(x, y):
+        return x ** 2 * y / (1 + x) + y ** x
+
+    a, b = 2.0, 3.0
+    for e1, e2, expected in [
+        # d2f/dx2 = 2y / (1 + x)^3 + y^x log(y)^2
+        ((1.0, 0.0), (1.0, 0.0), 2 * b / (1 + a) ** 3 + b ** a * math.log(b) ** 2),
+        # d2f/dxdy = (x^2 + 2x) / (1 + x)^2 + y^(x-1) (1 + x log(y))
+        (
+            (1.0, 0.0),
+            (0.0, 1.0),
+            (a * a + 2 * a) / (1 + a) ** 2 + b ** (a - 1) * (1 + a * math.log(b))
+        ),
+        # d2f/dy2 = x (x - 1) y^(x-2)
+        ((0.0, 1.0), (0.0, 1.0), a * (a - 1) * b ** (a - 2)),
+    ]:
+        x = HyperDual(a, e1[0], e2[0])
+        y = HyperDual(b, e1[1], e2[1])
+        z = f(x, y)
+        assert is_close_to(z.value, f(a, b), 1e-12)
+        assert is_close_to(z.e12, expected, 1e-12)
+
+    z = 1 / (HyperDual(2.0, 1.0, 1.0) - 0.5) ** 3
+    assert is_close_to(z.e1, -3 / 1.5 ** 4, 1e-12)
+    assert is_close_to(z.e12, 12 / 1.5 ** 5, 1e-12)
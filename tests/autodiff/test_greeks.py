@@ -0,0 +1,144 @@
+"""Tests for greeks by automatic differentiation"""
+
+import pytest
+
+from jetblack_options.american import (
+    barone_adesi_whaley,
+    bjerksund_stensland_1993,
+    bjerksund_stensland_2002,
+)
+from jetblack_options.autodiff.dual import Dual
+from jetblack_options.autodiff.functions import DUAL_MATH
+from jetblack_options.autodiff.greeks import AutodiffGreeks
+from jetblack_options.autodiff.kernels import KERNELS, TreeKernel
+from jetblack_options.distributions import FLOAT_MATH
+from jetblack_options.european import generalised_black_scholes
+from jetblack_options.greeks import Greeks
+from jetblack_options.numeric_greeks.with_carry import NumericGreeks
+from jetblack_options.pricers import Pricer
+from jetblack_options.trees import (
+    cox_ross_rubinstein,
+    jarrow_rudd,
+    leisen_reimer,
+)
+from jetblack_options.trees.lattice import backward_induction
+
+from ..utils import is_close_to
+
+ARGS = [
+    (100, 100, 1, 0.05, 0.02, 0.3),
+    (90, 100, 0.5, 0.08, 0.02, 0.25),
+    (110, 100, 2, 0.05, -0.02, 0.2),
+]
+
+
+def test_kernels():
+    # With the float functions the kernels give the prices of the models.
+    for price, kernel in KERNELS.items():
+        for is_call in (True, False):
+            for args in ARGS + [(100, 100, 1, 0.1, -0.1, 0.3)]:
+                if isinstance(kernel, TreeKernel):
+                    for is_european in (True, False):
+                        assert kernel(
+                            FLOAT_MATH, is_european, is_call, *args, 50
+                        ) == price(is_european, is_call, *args, 50)
+                    continue
+                assert is_close_to(
+                    kernel(FLOAT_MATH, is_call, *args),
+                    price(is_call, *args),
+                    1e-12
+                )
+
+
+def test_generalised_black_scholes():
+    for is_call in (True, False):
+        ag = AutodiffGreeks(generalised_black_scholes.price, is_call)
+        for S, K, T, r, b, v in ARGS:
+            actual = ag.all(S, K, T, r, b, v)
+            assert isinstance(actual, Greeks)
+            expected = generalised_black_scholes.all_greeks(
+                is_call, S, K, T, r, b, v
+            )
+            for name in Greeks._fields:
+                assert is_close_to(
+                    getattr(actual, name), getattr(expected, name), 1e-10
+                )
+            assert ag.first_order(S, K, T, r, b, v) == (
+                actual.price, actual.delta, actual.theta, actual.vega, actual.rho
+            )
+
+
+def test_american():
+    for module in (
+            barone_adesi_whaley,
+            bjerksund_stensland_1993,
+            bjerksund_stensland_2002
+    ):
+        for is_call in (True, False):
+            price = Pricer(module.price, is_call)
+            ag = AutodiffGreeks(module.price, is_call)
+            ng = NumericGreeks(price)
+            for S, K, T, r, b, v in ARGS:
+                actual = ag.all(S, K, T, r, b, v)
+                expected = ng.all(
+                    S, K, T, r, b, v, dS=1e-3, dT=1e-4, dv=1e-4, dr=1e-4
+                )
+                assert is_close_to(
+                    actual.price, price(S, K, T, r, b, v), 1e-12
+                )
+                for name in Greeks._fields:
+                    # The Barone-Adesi and Whaley critical price is only
+                    # solved to a tolerance, which the bumps see.
+                    e = getattr(expected, name)
+                    assert is_close_to(
+                        getattr(actual, name), e, 1e-3 * max(1, abs(e))
+                    )
+
+
+def test_trees():
+    n = 50
+    for module in (cox_ross_rubinstein, jarrow_rudd):
+        for is_european in (True, False):
+            for is_call in (True, False):
+                ag = AutodiffGreeks(module.price, is_european, is_call, n=n)
+                ng = module.make_numeric_greeks(is_european, is_call, n)
+                for S, K, T, r, b, v in ARGS:
+                    actual = ag.first_order(S, K, T, r, b, v)
+                    assert actual[0] == module.price(
+                        is_european, is_call, S, K, T, r, b, v, n
+                    )
+
+                    # The lattice carries the derivatives of dual numbers
+                    # through the tree.
+                    S_, T_, v_, r_ = Dual.variables(S, T, v, r)
+                    _, u, d, p, df = module.tree_parameters(
+                        DUAL_MATH, T_, r_, Dual(b, r_.gradient), v_, n
+                    )
+                    expected, *_ = backward_induction(
+                        is_european, is_call, S_, K, u, d, p, df, n
+                    )
+                    delta, dT, vega, rho = expected.gradient
+                    for a, e in zip(actual[1:], (delta, -dT, vega, rho)):
+                        assert is_close_to(a, e, 1e-10)
+
+                    # Small bumps stay between the kinks of the price.
+                    assert is_close_to(
+                        actual[3], ng.vega(S, K, T, r, b, v, dv=1e-6), 1e-4
+                    )
+                    assert is_close_to(
+                        actual[4], ng.rho(S, K, T, r, b, v, dr=1e-6), 1e-4
+                    )
+
+                with pytest.raises(TypeError):
+                    ag.all(100, 100, 1, 0.05, 0.02, 0.3)
+
+
+def test_unsupported():
+    # The greeks of these trees are taken from the lattice.
+    with pytest.raises(TypeError):
+        AutodiffGreeks(leisen_reimer.price, False, True, n=51)
+    with pytest.raises(TypeError):
+        AutodiffGreeks(
+            lambda *args: generalised_black_scholes.price(True, *args),
+            True
+        )
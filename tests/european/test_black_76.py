@@ -1,6 +1,7 @@
 """Tests for Black-Scholes European analytic options"""
 
 from jetblack_options.european.black_76 import (
+    all_greeks,
     price,
     make_numeric_greeks,
     ivol,
@@ -12,6 +13,7 @@ from jetblack_options.european.black_76 import (
     vanna,
     vomma,
 )
+from jetblack_options.european import generalised_black_scholes as gbs
 from jetblack_options.numeric_greeks.without_carry import NumericGreeks
 
 from ..utils import is_close_to
@@ -50,6 +52,35 @@ def test_ivol():
         assert is_close_to(actual, expected, 1e-9)
 
 
+def test_ivol_newton():
+
+    for is_call, F, K, r, T, p, expected in [
+        (True, 110, 100, 0.1, 6/12, 10.143390791460092, 0.125),
+        (False, 110, 100, 0.1, 6/12, 0.6310965464529535, 0.125),
+        (True, 100, 100, 0.1, 6/12, 3.3531192847248605, 0.125),
+        (False, 100, 100, 0.1, 6/12, 3.3531192847248534, 0.125),
+        (True, 100, 110, 0.1, 6/12, 0.6310965464529654, 0.125),
+        (False, 100, 110, 0.1, 6/12, 10.143390791460092, 0.125),
+    ]:
+        for method in ('newton', 'halley'):
+            actual = ivol(is_call, F, K, T, r, p, method=method)
+            assert is_close_to(actual, expected, 1e-9)
+
+
+def test_ivol_rational():
+
+    for is_call, F, K, r, T, p, expected in [
+        (True, 110, 100, 0.1, 6/12, 10.143390791460092, 0.125),
+        (False, 110, 100, 0.1, 6/12, 0.6310965464529535, 0.125),
+        (True, 100, 100, 0.1, 6/12, 3.3531192847248605, 0.125),
+        (False, 100, 100, 0.1, 6/12, 3.3531192847248534, 0.125),
+        (True, 100, 110, 0.1, 6/12, 0.6310965464529654, 0.125),
+        (False, 100, 110, 0.1, 6/12, 10.143390791460092, 0.125),
+    ]:
+        actual = ivol(is_call, F, K, T, r, p, method='rational')
+        assert is_close_to(actual, expected, 1e-12)
+
+
 def test_delta():
 
     for is_call, F, K, r, T, v, expected in [
@@ -167,3 +198,23 @@ def test_vomma():
 
         numeric = ng[is_call].vomma(S, K, T, r, v)
         assert is_close_to(numeric, analytic, 1e-2)
+
+
+def test_all_greeks():
+
+    for is_call, F, K, r, T, v in [
+        (True, 110, 100, 0.1, 6/12, 0.125),
+        (False, 110, 100, 0.1, 6/12, 0.125),
+        (True, 100, 110, 0.05, 2.0, 0.4),
+        (False, 100, 110, 0.05, 2.0, 0.4),
+    ]:
+        actual = all_greeks(is_call, F, K, T, r, v)
+        assert is_close_to(actual.price, price(is_call, F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.delta, delta(is_call, F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.gamma, gamma(F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.theta, theta(is_call, F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.vega, vega(F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.rho, rho(is_call, F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.vanna, vanna(F, K, T, r, v), 1e-12)
+        assert is_close_to(actual.charm, gbs.charm(is_call, F, K, T, r, 0, v), 1e-12)
+        assert is_close_to(actual.vomma, vomma(F, K, T, r, v), 1e-12)
@@ -1,6 +1,7 @@
 """Tests for Black-Scholes European analytic options"""
 
 from jetblack_options.european.black_scholes_73 import (
+    all_greeks,
     price,
     make_numeric_greeks,
     ivol,
@@ -185,3 +186,23 @@ def test_vomma():
 
         numeric = ng[is_call].vomma(S, K, T, r, v)
         assert is_close_to(numeric, analytic, 1e-2)
+
+
+def test_all_greeks():
+
+    for is_call, S, K, r, T, v in [
+        (True, 110, 100, 0.1, 6/12, 0.125),
+        (False, 110, 100, 0.1, 6/12, 0.125),
+        (True, 100, 110, 0.05, 2.0, 0.4),
+        (False, 100, 110, 0.05, 2.0, 0.4),
+    ]:
+        actual = all_greeks(is_call, S, K, T, r, v)
+        assert is_close_to(actual.price, price(is_call, S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.delta, delta(is_call, S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.gamma, gamma(S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.theta, theta(is_call, S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.vega, vega(S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.rho, rho(is_call, S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.vanna, vanna(S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.charm, charm(is_call, S, K, T, r, v), 1e-12)
+        assert is_close_to(actual.vomma, vomma(S, K, T, r, v), 1e-12)
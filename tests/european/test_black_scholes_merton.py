@@ -1,6 +1,7 @@
 """Tests for Black-Scholes-Merton European options"""
 
 from jetblack_options.european.black_scholes_merton import (
+    all_greeks,
     price,
     ivol,
     make_numeric_greeks,
@@ -54,6 +55,35 @@ def test_ivol():
         assert is_close_to(actual, expected, 1e-9)
 
 
+def test_ivol_newton():
+
+    for is_call, S, K, r, q, T, p, expected in [
+        (True, 110, 100, 0.1, 0.08, 6/12, 11.069546131685598, 0.125),
+        (False, 110, 100, 0.1, 0.08, 6/12, 0.505650275001452, 0.125),
+        (True, 100, 100, 0.1, 0.08, 6/12, 3.8695002999527546, 0.125),
+        (False, 100, 100, 0.1, 0.08, 6/12, 2.913498834791845, 0.125),
+        (True, 100, 110, 0.1, 0.08, 6/12, 0.7881685580252977, 0.125),
+        (False, 100, 110, 0.1, 0.08, 6/12, 9.344461337871536, 0.125),
+    ]:
+        for method in ('newton', 'halley'):
+            actual = ivol(is_call, S, K, T, r, q, p, method=method)
+            assert is_close_to(actual, expected, 1e-9)
+
+
+def test_ivol_rational():
+
+    for is_call, S, K, r, q, T, p, expected in [
+        (True, 110, 100, 0.1, 0.08, 6/12, 11.069546131685598, 0.125),
+        (False, 110, 100, 0.1, 0.08, 6/12, 0.505650275001452, 0.125),
+        (True, 100, 100, 0.1, 0.08, 6/12, 3.8695002999527546, 0.125),
+        (False, 100, 100, 0.1, 0.08, 6/12, 2.913498834791845, 0.125),
+        (True, 100, 110, 0.1, 0.08, 6/12, 0.7881685580252977, 0.125),
+        (False, 100, 110, 0.1, 0.08, 6/12, 9.344461337871536, 0.125),
+    ]:
+        actual = ivol(is_call, S, K, T, r, q, p, method='rational')
+        assert is_close_to(actual, expected, 1e-12)
+
+
 def test_delta():
 
     for is_call, S, K, r, q, T, v, expected in [
@@ -256,3 +286,23 @@ def test_vomma():
 
         numeric = ng[is_call].vomma(S, K, T, r, q, v)
         assert is_close_to(numeric, analytic, 1e-2)
+
+
+def test_all_greeks():
+
+    for is_call, S, K, r, T, q, v in [
+        (True, 110, 100, 0.1, 6/12, 0.08, 0.125),
+        (False, 110, 100, 0.1, 6/12, 0.08, 0.125),
+        (True, 100, 110, 0.05, 2.0, 0.02, 0.4),
+        (False, 100, 110, 0.05, 2.0, 0.02, 0.4),
+    ]:
+        actual = all_greeks(is_call, S, K, T, r, q, v)
+        assert is_close_to(actual.price, price(is_call, S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.delta, delta(is_call, S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.gamma, gamma(S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.theta, theta(is_call, S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.vega, vega(S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.rho, rho(is_call, S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.vanna, vanna(S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.charm, charm(is_call, S, K, T, r, q, v), 1e-12)
+        assert is_close_to(actual.vomma, vomma(S, K, T, r, q, v), 1e-12)
@@ -0,0 +1,81 @@
+"""Tests for Garman-Kohlhagen European currency options"""
+
+import pytest
+
+from jetblack_options.european import generalised_black_scholes as gbs
+from jetblack_options.european.garman_kohlhagen import (
+    all_greeks,
+    price,
+    ivol,
+    vega,
+    vomma,
+)
+
+from ..utils import is_close_to
+
+CONTRACTS = [
+    (True, 1.60, 1.60, 0.06, 0.08, 0.5, 0.12),
+    (False, 1.60, 1.60, 0.06, 0.08, 0.5, 0.12),
+    (True, 1.50, 1.60, 0.06, 0.08, 0.5, 0.12),
+    (False, 1.50, 1.60, 0.06, 0.08, 0.5, 0.12),
+    (True, 1.70, 1.60, 0.02, 0.01, 1.0, 0.25),
+    (False, 1.70, 1.60, 0.02, 0.01, 1.0, 0.25),
+]
+
+
+def test_price():
+
+    for is_call, S, K, r, rf, T, v in CONTRACTS:
+        actual = price(is_call, S, K, T, r, rf, v)
+        expected = gbs.price(is_call, S, K, T, r, r - rf, v)
+        assert is_close_to(actual, expected, 1e-12)
+
+
+def test_vega():
+
+    for _, S, K, r, rf, T, v in CONTRACTS:
+        actual = vega(S, K, T, r, rf, v)
+        expected = gbs.vega(S, K, T, r, r - rf, v)
+        assert is_close_to(actual, expected, 1e-12)
+
+
+def test_vomma():
+
+    for _, S, K, r, rf, T, v in CONTRACTS:
+        actual = vomma(S, K, T, r, rf, v)
+        expected = gbs.vomma(S, K, T, r, r - rf, v)
+        assert is_close_to(actual, expected, 1e-12)
+
+
+def test_ivol():
+
+    for is_call, S, K, r, rf, T, v in CONTRACTS:
+        p = price(is_call, S, K, T, r, rf, v)
+        for method in ('regula_falsi', 'newton', 'halley', 'rational'):
+            actual = ivol(is_call, S, K, T, r, rf, p, method=method)
+            assert is_close_to(actual, v, 1e-7)
+
+
+def test_ivol_invalid_method():
+
+    with pytest.raises(ValueError):
+        ivol(True, 1.6, 1.6, 0.5, 0.06, 0.08, 0.05, method='secant')
+
+
+def test_all_greeks():
+
+    for is_call, S, K, r, rf, T, v in CONTRACTS:
+        actual = all_greeks(is_call, S, K, T, r, rf, v)
+        b = r - rf
+        for name, expected in [
+            ('price', gbs.price(is_call, S, K, T, r, b, v)),
+            ('delta', gbs.delta(is_call, S, K, T, r, b, v)),
+            ('gamma', gbs.gamma(S, K, T, r, b, v)),
+            ('theta', gbs.theta(is_call, S, K, T, r, b, v)),
+            ('vega', gbs.vega(S, K, T, r, b, v)),
+            ('rho', gbs.rho(is_call, S, K, T, r, b, v)),
+            ('vanna', gbs.vanna(S, K, T, r, b, v)),
+            ('charm', gbs.charm(is_call, S, K, T, r, b, v)),
+            ('vomma', gbs.vomma(S, K, T, r, b, v)),
+        ]:
+            assert is_close_to(getattr(actual, name), expected, 1e-12)
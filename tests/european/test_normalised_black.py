@@ -0,0 +1,60 @@
+"""Tests for the normalised Black price inversion"""
+
+from math import exp, log, sqrt
+
+import pytest
+
+from jetblack_options.european.black_76 import price
+from jetblack_options.european.normalised_black import (
+    normalised_price,
+    normalised_vega,
+    normalised_ivol,
+)
+
+from ..utils import is_close_to
+
+
+def test_normalised_price():
+
+    for is_call, F, K, r, T, v in [
+        (True, 110, 100, 0.1, 6/12, 0.125),
+        (False, 110, 100, 0.1, 6/12, 0.125),
+        (True, 100, 110, 0.05, 2.0, 0.4),
+        (False, 100, 110, 0.05, 2.0, 0.4),
+    ]:
+        beta = normalised_price(log(F / K), v * sqrt(T), 1 if is_call else -1)
+        expected = price(is_call, F, K, T, r, v) * exp(r * T) / sqrt(F * K)
+        assert is_close_to(beta, expected, 1e-12)
+
+
+def test_normalised_vega():
+
+    h = 1e-5
+    for x in (-1.0, -0.1, 0.0, 0.3):
+        for s in (0.05, 0.5, 2.0):
+            expected = (
+                normalised_price(x, s + h, 1) - normalised_price(x, s - h, 1)
+            ) / (2 * h)
+            assert is_close_to(normalised_vega(x, s), expected, 1e-8)
+
+
+def test_normalised_ivol():
+
+    for x in (-5.0, -1.0, -0.3, -0.01, 0.0, 0.01, 0.3, 1.0, 5.0):
+        for s in (0.01, 0.1, 0.5, 1.0, 2.0, 5.0):
+            for theta in (1, -1):
+                beta = normalised_price(x, s, theta)
+                intrinsic = max(theta * (exp(x / 2) - exp(-x / 2)), 0.0)
+                if beta - intrinsic <= 1e-6 * beta:
+                    # The time value is lost in the intrinsic value.
+                    continue
+                actual = normalised_ivol(beta, x, theta)
+                assert is_close_to(actual, s, 1e-9 * s)
+
+
+def test_normalised_ivol_out_of_range():
+
+    with pytest.raises(ValueError):
+        normalised_ivol(1.5, 0.0, 1)
+    with pytest.raises(ValueError):
+        normalised_ivol(-0.1, 0.0, 1)
@@ -0,0 +1,87 @@
+"""Tests for the numeric greeks"""
+
+import pytest
+
+from jetblack_options.european import (
+    black_76,
+    black_scholes_73,
+    black_scholes_merton,
+    generalised_black_scholes,
+)
+from jetblack_options.greeks import Greeks
+from jetblack_options.numeric_greeks import (
+    with_carry,
+    with_dividend_yield,
+    without_carry,
+)
+
+from ..utils import is_close_to
+from .utils import CountingPrice
+
+# The numeric greeks, a price and its model, the arguments after the option
+# type, and the first order greeks supporting the complex step.
+CASES = [
+    pytest.param(
+        with_carry.NumericGreeks,
+        generalised_black_scholes.price,
+        generalised_black_scholes,
+        (100, 95, 0.5, 0.08, 0.03, 0.3),
+        ('delta', 'theta', 'vega', 'rho', 'carry'),
+        id='with_carry'
+    ),
+    pytest.param(
+        with_dividend_yield.NumericGreeks,
+        black_scholes_merton.price,
+        black_scholes_merton,
+        (100, 95, 0.5, 0.08, 0.05, 0.3),
+        ('delta', 'theta', 'vega', 'rho', 'carry'),
+        id='with_dividend_yield'
+    ),
+    pytest.param(
+        without_carry.NumericGreeks,
+        black_scholes_73.price,
+        black_76,
+        (100, 95, 0.5, 0.08, 0.3),
+        ('delta', 'theta', 'vega', 'rho'),
+        id='without_carry'
+    ),
+]
+
+
+@pytest.mark.parametrize('NumericGreeks,price,model,args,names', CASES)
+def test_all(NumericGreeks, price, model, args, names):
+    for is_call in (True, False):
+        ng = NumericGreeks(CountingPrice(price, is_call))
+
+        actual = ng.all(*args)
+        assert isinstance(actual, Greeks)
+        # Each distinct bump is priced once.
+        assert ng.price.calls == 17
+
+        # The greeks are the same as those of the separate methods.
+        assert actual.price == ng.price(*args)
+        for name in Greeks._fields[1:]:
+            assert getattr(actual, name) == getattr(ng, name)(*args)
+
+
+@pytest.mark.parametrize('NumericGreeks,price,model,args,names', CASES)
+def test_complex_step(NumericGreeks, price, model, args, names):
+    for is_call in (True, False):
+        ng = model.make_numeric_greeks(is_call)
+
+        # The complex step gives the analytic delta and vega to machine
+        # precision.
+        expected = model.all_greeks(is_call, *args)
+        for name in ('delta', 'vega'):
+            actual = getattr(ng, name)(*args, method='complex')
+            assert is_close_to(actual, getattr(expected, name), 1e-12)
+
+        for name in names:
+            actual = getattr(ng, name)(*args, method='complex')
+            assert is_close_to(actual, getattr(ng, name)(*args), 1e-4)
+
+    # A price without a complex version does not support the method.
+    with pytest.raises(ValueError):
+        NumericGreeks(CountingPrice(price, True)).delta(
+            *args, method='complex'
+        )
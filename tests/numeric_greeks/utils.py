@@ -0,0 +1,16 @@
+"""Utilities for the numeric greeks tests"""
+
+from typing import Callable
+
+
+class CountingPrice:
+    """A price of fixed option type which counts the times it is called."""
+
+    def __init__(self, price: Callable[..., float], is_call: bool) -> None:
+        self.price = price
+        self.is_call = is_call
+        self.calls = 0
+
+    def __call__(self, *args: float) -> float:
+        self.calls += 1
+        return self.price(self.is_call, *args)
@@ -0,0 +1,90 @@
+"""Tests for batch pricing"""
+
+from jetblack_options.american import bjerksund_stensland_2002
+from jetblack_options.batch import (
+    APPROXIMATION_COST,
+    BatchEngine,
+    balanced_chunks,
+    task_cost,
+    task_steps,
+)
+from jetblack_options.pricers import Pricer
+from jetblack_options.trees import cox_ross_rubinstein, leisen_reimer
+
+
+def test_task_cost():
+    args = (100, 100, 1, 0.05, 0.02, 0.3)
+    tree = Pricer(cox_ross_rubinstein.price, False, True, n=200)
+    assert task_cost((tree, args)) == 40000
+    approximation = Pricer(bjerksund_stensland_2002.price, True)
+    assert task_cost((approximation, args)) == APPROXIMATION_COST
+    assert task_cost(
+        (bjerksund_stensland_2002.price, (True, *args))
+    ) == APPROXIMATION_COST
+
+
+def test_task_steps():
+    args = (100, 100, 1, 0.05, 0.02, 0.3)
+    # The steps of a raw tree function are found among its arguments.
+    tree = cox_ross_rubinstein.price
+    assert task_steps((tree, (False, True, *args, 200))) == 200
+    assert task_cost((tree, (False, True, *args, 200))) == 40000
+    assert task_steps((Pricer(tree, False), (True, *args, 50))) == 50
+    assert task_steps((Pricer(tree, False, True, n=50), args)) == 50
+    # Arguments which do not match the signature give no steps.
+    assert task_steps((tree, (False, True, *args))) is None
+    assert task_cost((tree, (False, True, *args))) == APPROXIMATION_COST
+
+
+def test_balanced_chunks():
+    costs = [400 ** 2] * 2 + [100 ** 2] * 20 + [50 ** 2] * 40 + [1000.0] * 30
+    chunks = balanced_chunks(costs, 8)
+    assert len(chunks) == 8
+    indices = sorted(i for chunk in chunks for i in chunk)
+    assert indices == list(range(len(costs)))
+
+    loads = [sum(costs[i] for i in chunk) for chunk in chunks]
+    # No chunk costs more than the mean plus the largest task.
+    assert max(loads) <= sum(costs) / len(chunks) + max(costs)
+    # Splitting by count would put both large trees in the first chunk.
+    assert max(loads) < sum(costs[:12])
+
+    assert balanced_chunks([1.0, 2.0], 4) == [[1], [0]]
+    assert balanced_chunks([], 4) == []
+
+
+def test_engine():
+    tasks = [
+        (
+            Pricer(cox_ross_rubinstein.price, False, is_call, n=n),
+            (100, K, 1, 0.05, 0.02, 0.3)
+        )
+        for n in (20, 80)
+        for is_call in (True, False)
+        for K in (90, 100, 110)
+    ] + [
+        (
+            Pricer(leisen_reimer.price, False, True, n=51),
+            (100, K, 1, 0.05, 0.02, 0.3)
+        )
+        for K in (90, 110)
+    ] + [
+        (bjerksund_stensland_2002.price, (True, 100, K, 1, 0.05, 0.02, 0.3))
+        for K in (90, 110)
+    ] + [
+        (
+            cox_ross_rubinstein.price,
+            (True, True, 100, K, 1, 0.05, 0.02, 0.3, 60)
+        )
+        for K in (90, 110)
+    ]
+    expected = [func(*args) for func, args in tasks]
+
+    with BatchEngine(2, chunks_per_worker=2) as engine:
+        assert engine.evaluate(tasks) == expected
+        executor = engine._executor  # pylint: disable=protected-access
+        # The workers are kept for the next book.
+        assert engine.evaluate(reversed(tasks)) == expected[::-1]
+        assert engine._executor is executor  # pylint: disable=protected-access
+        assert engine.evaluate([]) == []
+    assert engine._executor is None  # pylint: disable=protected-access
@@ -0,0 +1,21 @@
+"""Tests for complex step differentiation"""
+
+from jetblack_options.complex_step import COMPLEX_MATH, STEP
+from jetblack_options.distributions import cdf, pdf
+
+from .utils import is_close_to
+
+
+def test_distributions():
+    for x in (-2.0, -0.5, 0.0, 0.7, 3.0):
+        z = complex(x, STEP)
+
+        value = COMPLEX_MATH.cdf(z)
+        assert value.real == cdf(x)
+        assert is_close_to(value.imag / STEP, pdf(x), 1e-15)
+
+        value = COMPLEX_MATH.pdf(z)
+        assert value.real == pdf(x)
+        assert is_close_to(value.imag / STEP, -x * pdf(x), 1e-15)
+
+        assert COMPLEX_MATH.real(z) == x
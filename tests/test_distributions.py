@@ -2,7 +2,15 @@
 
 from statistics import NormalDist
 
-from jetblack_options.distributions import CHIINV, CND, ND, CNDEV, CBND
+from jetblack_options.distributions import (
+    CHIINV,
+    CND,
+    ND,
+    CNDEV,
+    CBND,
+    cdf,
+    pdf
+)
 
 from .utils import is_close_to
 
@@ -18,6 +26,12 @@ def test_cnd():
     assert is_close_to(actual, expected, 1e-6)
 
 
+def test_cnd_tails():
+    # Beyond 37 standard deviations the tail probability is taken as zero.
+    assert CND(40) == 1.0
+    assert CND(-40) == 0.0
+
+
 def test_nd():
     actual = ND(1.23564285010596)
     expected = 0.1859374114061063
@@ -51,6 +65,14 @@ def test_inv_cdf():
     assert is_close_to(actual, expected, 1e-6)
 
 
+def test_normal_dist():
+    nd = NormalDist()
+    for i in range(-400, 401):
+        x = i / 20
+        assert is_close_to(cdf(x), nd.cdf(x), 1e-15)
+        assert is_close_to(pdf(x), nd.pdf(x), 1e-15)
+
+
 def test_chi_inv():
     actual = CHIINV(0.1, 5)
     expected = 9.184520236568392
@@ -0,0 +1,71 @@
+"""Tests for the picklable pricing functions"""
+
+import pickle
+
+from jetblack_options.american import (
+    barone_adesi_whaley,
+    bjerksund_stensland_1993,
+    bjerksund_stensland_2002,
+)
+from jetblack_options.european import (
+    black_76,
+    black_scholes_73,
+    black_scholes_merton,
+    garman_kohlhagen,
+    generalised_black_scholes,
+)
+from jetblack_options.pricers import Pricer
+from jetblack_options.trees import (
+    cox_ross_rubinstein,
+    european_binomial,
+    jarrow_rudd,
+    leisen_reimer,
+    trinomial,
+)
+
+
+def test_pricer():
+    pricer = Pricer(cox_ross_rubinstein.price, False, True, n=50)
+    assert pricer.model is cox_ross_rubinstein.price
+    assert pricer.args == (False, True)
+    assert pricer.n == 50
+    assert pricer(100, 100, 1, 0.05, 0.02, 0.3) == cox_ross_rubinstein.price(
+        False, True, 100, 100, 1, 0.05, 0.02, 0.3, 50
+    )
+    assert Pricer(generalised_black_scholes.price, True).n is None
+
+    copy = pickle.loads(pickle.dumps(pricer))
+    assert isinstance(copy, Pricer)
+    assert copy.model is pricer.model
+    assert copy.args == pricer.args and copy.n == pricer.n
+
+
+def test_pickle_numeric_greeks():
+    args = (100, 95, 0.5, 0.08, 0.02, 0.3)
+    for ng in [
+        generalised_black_scholes.make_numeric_greeks(True),
+        black_scholes_merton.make_numeric_greeks(False),
+        garman_kohlhagen.make_numeric_greeks(True),
+        barone_adesi_whaley.make_numeric_greeks(False),
+        bjerksund_stensland_1993.make_numeric_greeks(True),
+        bjerksund_stensland_2002.make_numeric_greeks(False),
+        cox_ross_rubinstein.make_numeric_greeks(False, True, 50),
+        european_binomial.make_numeric_greeks(True, 50),
+        jarrow_rudd.make_numeric_greeks(False, False, 50),
+        leisen_reimer.make_numeric_greeks(False, True, 51),
+        trinomial.make_numeric_greeks(True, False, 50),
+    ]:
+        copy = pickle.loads(pickle.dumps(ng))
+        assert copy.price(*args) == ng.price(*args)
+        assert copy.delta(*args) == ng.delta(*args)
+        if ng.complex_price is not None:
+            assert copy.delta(*args, method='complex') == ng.delta(
+                *args, method='complex'
+            )
+
+    for ng in [
+        black_76.make_numeric_greeks(True),
+        black_scholes_73.make_numeric_greeks(False),
+    ]:
+        copy = pickle.loads(pickle.dumps(ng))
+        assert copy.price(*args[:4], args[5]) == ng.price(*args[:4], args[5])
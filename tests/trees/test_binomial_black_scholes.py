@@ -0,0 +1,64 @@
+"""Tests for the Binomial Black-Scholes method"""
+
+import pytest
+
+from jetblack_options.european.generalised_black_scholes import (
+    price as bs_price
+)
+from jetblack_options.trees.binomial_black_scholes import (
+    price,
+    extrapolated_price,
+    greeks
+)
+from jetblack_options.trees.leisen_reimer import price as lr_price
+
+from ..utils import is_close_to
+
+
+def test_price():
+
+    # A European option converges to the Black-Scholes price.
+    for is_call, S, K, r, b, T, v in [
+        (True, 110, 100, 0.1, 0.02, 6/12, 0.125),
+        (False, 110, 100, 0.1, 0.02, 6/12, 0.125),
+        (True, 100, 100, 0.08, 0.04, 1, 0.3),
+        (False, 90, 100, 0.05, 0.0, 0.5, 0.2),
+    ]:
+        expected = bs_price(is_call, S, K, T, r, b, v)
+        actual = price(True, is_call, S, K, T, r, b, v, 500)
+        assert is_close_to(actual, expected, 1e-2)
+        actual = extrapolated_price(True, is_call, S, K, T, r, b, v, 500)
+        assert is_close_to(actual.price, expected, 1e-4)
+
+
+def test_greeks():
+
+    value, delta, gamma, theta = greeks(
+        False, False, 100, 100, 1, 0.08, 0.04, 0.3, 100
+    )
+    assert value > 0
+    assert -1 < delta < 0
+    assert gamma > 0
+    assert theta < 0
+
+
+def test_extrapolated_price():
+
+    # The extrapolated American price is closer to the price of a large tree
+    # than the unextrapolated price with the same number of steps.
+    for is_call, S, K, r, b, T, v in [
+        (False, 100, 100, 0.08, 0.04, 1, 0.3),
+        (False, 90, 100, 0.05, 0.0, 0.5, 0.2),
+        (False, 100, 90, 0.1, -0.05, 1, 0.25),
+        (True, 100, 100, 0.08, -0.04, 1, 0.3),
+    ]:
+        expected = lr_price(False, is_call, S, K, T, r, b, v, 4001)
+        actual = extrapolated_price(False, is_call, S, K, T, r, b, v, 200)
+        unextrapolated = price(False, is_call, S, K, T, r, b, v, 200)
+        assert abs(actual.price - expected) < abs(unextrapolated - expected)
+
+    # The smaller tree needs at least one step.
+    for n in (0, 1):
+        with pytest.raises(ValueError):
+            extrapolated_price(True, True, 100, 100, 1, 0.05, 0.02, 0.3, n)
+        assert abs(actual.price - expected) < actual.error
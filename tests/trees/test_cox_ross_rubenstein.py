@@ -1,7 +1,13 @@
 """Tests for Cox-Ross-Rubenstein"""
 
+from math import isnan
+
+import pytest
+
 from jetblack_options.trees.cox_ross_rubinstein import (
+    greeks,
     price,
+    exercise_boundary,
     make_numeric_greeks
 )
 
@@ -110,3 +116,46 @@ def test_rho():
         b = r - q
         numeric = ng[is_european][is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_exercise_boundary():
+
+    # An American put is exercised below the strike, and the boundary rises
+    # towards the strike at expiry.
+    boundary = exercise_boundary(False, 100, 100, 1, 0.08, 0.08, 0.3, 100)
+    assert len(boundary) >= 100
+    exercised = [x for x in boundary if not isnan(x)]
+    assert exercised and all(x < 100 for x in exercised)
+    assert boundary[-1] > exercised[0]
+
+    # An American call on an asset with a cost of carry at least the risk
+    # free rate is never exercised early.
+    boundary = exercise_boundary(True, 100, 100, 1, 0.08, 0.08, 0.3, 100)
+    assert all(isnan(x) for x in boundary)
+
+
+def test_pruned_greeks():
+
+    for is_european in (True, False):
+        for is_call in (True, False):
+            for S, K, T, r, b, v in [
+                (100, 100, 1, 0.05, 0.02, 0.3),
+                (60, 100, 1, 0.08, 0.08, 0.2),
+                (150, 100, 2, 0.05, -0.02, 0.25),
+                (100, 100, 1, 0.1, -0.1, 0.3),
+            ]:
+                expected = greeks(is_european, is_call, S, K, T, r, b, v, 200)
+                actual = greeks(
+                    is_european, is_call, S, K, T, r, b, v, 200,
+                    tolerance=1e-8
+                )
+                for value, expected_value in zip(actual, expected):
+                    assert is_close_to(value, expected_value, 1e-8 * K)
+
+
+def test_pruned_invalid_probabilities():
+
+    # With few steps, a high cost of carry and a low volatility the
+    # probabilities leave [0, 1].
+    with pytest.raises(ValueError):
+        price(False, True, 100, 100, 1, 0.05, 0.9, 0.05, 2, tolerance=1e-6)
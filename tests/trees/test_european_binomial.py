@@ -1,6 +1,11 @@
 """Tests for Barone-Adesi-Whaley"""
 
+from math import comb, fsum
+
+import pytest
+
 from jetblack_options.trees.european_binomial import (
+    binomial_weights,
     price,
     make_numeric_greeks
 )
@@ -46,12 +51,12 @@ def test_delta():
 def test_gamma():
 
     for is_call, S, K, r, q, T, v, expected in [
-        (True, 110, 100, 0.1, 0.08, 6/12, 0.125, -5.3290705182007514e-11),
-        (False, 110, 100, 0.1, 0.08, 6/12, 0.125, 1.1102230246251565e-11),
-        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, 7.552788665377008),
-        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, 7.552788665390331),
-        (True, 100, 110, 0.1, 0.08, 6/12, 0.125, 4.440892098500626e-12),
-        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, -1.7763568394002505e-11),
+        (True, 110, 100, 0.1, 0.08, 6/12, 0.125, -1.5987211554602254e-10),
+        (False, 110, 100, 0.1, 0.08, 6/12, 0.125, -8.881784197001252e-12),
+        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, 7.552788665270427),
+        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, 7.552788665368126),
+        (True, 100, 110, 0.1, 0.08, 6/12, 0.125, 5.3290705182007514e-11),
+        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, -8.881784197001252e-11),
     ]:
         b = r - q
         numeric = ng[is_call].gamma(S, K, T, r, b, v)
@@ -60,12 +65,12 @@ def test_gamma():
 
 def test_theta():
     for is_call, S, K, r, q, T, v, expected in [
-        (True, 110, 100, 0.1, 0.08, 6/12, 0.125, -2.4761276405391808),
+        (True, 110, 100, 0.1, 0.08, 6/12, 0.125, -2.4761276405408017),
         (False, 110, 100, 0.1, 0.08, 6/12, 0.125, -1.4187804088877445),
-        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, -4.032411057874453),
-        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, -2.206432268736381),
+        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, -4.032411057875507),
+        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, -2.206432268734436),
         (True, 100, 110, 0.1, 0.08, 6/12, 0.125, -2.431468809334608),
-        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, 0.3457394162046157),
+        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, 0.3457394162110994),
     ]:
         b = r - q
         numeric = ng[is_call].theta(S, K, T, r, b, v)
@@ -77,10 +82,10 @@ def test_vega():
     for is_call, S, K, r, q, T, v, expected in [
         (True, 110, 100, 0.1, 0.08, 6/12, 0.125, 13.58914730397931),
         (False, 110, 100, 0.1, 0.08, 6/12, 0.125, 13.589147303972009),
-        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, 26.703128947537234),
-        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, 26.703128947531905),
-        (True, 100, 110, 0.1, 0.08, 6/12, 0.125, 17.34480813834438),
-        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, 17.34480813833894),
+        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, 26.703128947536126),
+        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, 26.70312894753657),
+        (True, 100, 110, 0.1, 0.08, 6/12, 0.125, 17.344808138346046),
+        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, 17.34480813834871),
     ]:
         b = r - q
         numeric = ng[is_call].vega(S, K, T, r, b, v)
@@ -90,13 +95,38 @@ def test_vega():
 def test_rho():
 
     for is_call, S, K, r, q, T, v, expected in [
-        (True, 110, 100, 0.1, 0.08, 6/12, 0.125, 41.58039938615765),
+        (True, 110, 100, 0.1, 0.08, 6/12, 0.125, 41.58039938615499),
         (False, 110, 100, 0.1, 0.08, 6/12, 0.125, -5.981073820943538),
-        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, 25.084660240114463),
-        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, -22.47681296695525),
+        (True, 100, 100, 0.1, 0.08, 6/12, 0.125, 25.08466024011313),
+        (False, 100, 100, 0.1, 0.08, 6/12, 0.125, -22.47681296695414),
         (True, 100, 110, 0.1, 0.08, 6/12, 0.125, 8.165255681769345),
-        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, -44.15236484597873),
+        (False, 100, 110, 0.1, 0.08, 6/12, 0.125, -44.152364845972514),
     ]:
         b = r - q
         numeric = ng[is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_binomial_weights():
+
+    for n, p in [(1, 0.5), (10, 0.3), (101, 0.52), (200, 0.01)]:
+        weights = binomial_weights(n, p)
+        assert len(weights) == n + 1
+        for j, w in enumerate(weights):
+            expected = comb(n, j) * p ** j * (1 - p) ** (n - j)
+            assert is_close_to(w, expected, 1e-15)
+
+    # Large trees do not overflow, and the tails are zero.
+    weights = binomial_weights(10000, 0.5)
+    assert is_close_to(fsum(weights), 1, 1e-15)
+    assert weights[0] == 0
+
+    with pytest.raises(ValueError):
+        binomial_weights(10, 1.2)
+
+
+def test_large_trees():
+
+    # The prices of large trees approach the Black-Scholes price of 3.8695.
+    value = price(True, 100, 100, 6/12, 0.1, 0.02, 0.125, 10000)
+    assert is_close_to(value, 3.8695, 1e-3)
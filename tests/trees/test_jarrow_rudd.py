@@ -1,7 +1,10 @@
 """Tests for Barone-Adesi-Whaley"""
 
+from math import isnan
+
 from jetblack_options.trees.jarrow_rudd import (
     price,
+    exercise_boundary,
     make_numeric_greeks
 )
 
@@ -106,3 +109,19 @@ def test_rho():
         b = r - q
         numeric = ng[is_european][is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_exercise_boundary():
+
+    # An American put is exercised below the strike, and the boundary rises
+    # towards the strike at expiry.
+    boundary = exercise_boundary(False, 100, 100, 1, 0.08, 0.08, 0.3, 100)
+    assert len(boundary) >= 100
+    exercised = [x for x in boundary if not isnan(x)]
+    assert exercised and all(x < 100 for x in exercised)
+    assert boundary[-1] > exercised[0]
+
+    # An American call on an asset with a cost of carry at least the risk
+    # free rate is never exercised early.
+    boundary = exercise_boundary(True, 100, 100, 1, 0.08, 0.08, 0.3, 100)
+    assert all(isnan(x) for x in boundary)
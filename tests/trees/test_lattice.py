@@ -0,0 +1,125 @@
+"""Tests for the binomial lattice backward induction"""
+
+from math import exp, isnan, nan, sqrt
+
+from jetblack_options.trees.lattice import (
+    backward_induction,
+    backward_induction_derivative
+)
+
+from ..utils import is_close_to
+
+
+def _parameters(T, r, b, v, n):
+    dT = T / n
+    u = exp(v * sqrt(dT))
+    d = 1 / u
+    p = (exp(b * dT) - d) / (u - d)
+    return u, d, p, exp(-r * dT)
+
+
+def test_boundary_does_not_change_value():
+
+    for is_call, S, K, T, r, b, v in [
+        (False, 100, 100, 1, 0.08, 0.08, 0.3),
+        (False, 90, 100, 0.5, 0.05, 0.0, 0.2),
+        (True, 110, 100, 1, 0.02, -0.04, 0.3),
+    ]:
+        n = 50
+        u, d, p, df = _parameters(T, r, b, v, n)
+        expected = backward_induction(False, is_call, S, K, u, d, p, df, n)
+
+        boundary = [nan] * n
+        actual = backward_induction(
+            False, is_call, S, K, u, d, p, df, n, boundary=boundary
+        )
+        assert actual == expected
+        assert any(not isnan(x) for x in boundary)
+
+
+def test_steps():
+
+    u, d, p, df = _parameters(1, 0.05, 0.05, 0.2, 3)
+    value, step_1, step_2 = backward_induction(
+        True, True, 100, 100, u, d, p, df, 3
+    )
+    assert step_2 is not None and len(step_2) == 3
+    assert step_1 is not None and len(step_1) == 2
+    assert is_close_to(value, (p * step_1[1] + (1 - p) * step_1[0]) * df, 1e-12)
+
+    # The second step is only returned when it is not the final step.
+    _, step_1, step_2 = backward_induction(
+        True, True, 100, 100, u, d, p, df, 2
+    )
+    assert step_1 is not None
+    assert step_2 is None
+
+
+def test_derivative():
+
+    h = 1e-6
+    for is_call, S, K, T, r, b, v in [
+        (True, 100, 100, 1, 0.05, 0.05, 0.3),
+        (False, 90, 100, 0.5, 0.05, 0.0, 0.2),
+        (True, 110, 100, 1, 0.02, -0.04, 0.3),
+    ]:
+        n = 50
+        u, d, p, df = _parameters(T, r, b, v, n)
+        du, dd, dp, ddf = (
+            (up - down) / (2 * h)
+            for up, down in zip(
+                _parameters(T, r, b, v + h, n),
+                _parameters(T, r, b, v - h, n)
+            )
+        )
+        for is_european in (True, False):
+            expected = backward_induction(
+                is_european, is_call, S, K, u, d, p, df, n
+            )
+            *actual, derivative = backward_induction_derivative(
+                is_european, is_call, S, K, u, d, p, df, n, du, dd, dp, ddf
+            )
+            assert tuple(actual) == expected
+
+            # The derivative of the tree with respect to the volatility.
+            up = backward_induction(
+                is_european, is_call, S, K, *_parameters(T, r, b, v + h, n), n
+            )
+            down = backward_induction(
+                is_european, is_call, S, K, *_parameters(T, r, b, v - h, n), n
+            )
+            assert is_close_to(derivative, (up[0] - down[0]) / (2 * h), 1e-6)
+
+    # Without early exercise the American derivative, carried through the
+    # tree, matches the European derivative from the final nodes.
+    u, d, p, df = _parameters(1, 0.05, 0.05, 0.3, 50)
+    tangents = (0.01, -0.01, 0.002 + 0.001j, -0.0001j)
+    *_, american = backward_induction_derivative(
+        False, True, 100, 100, u, d, p, df, 50, *tangents
+    )
+    *_, european = backward_induction_derivative(
+        True, True, 100, 100, u, d, p, df, 50, *tangents
+    )
+    assert is_close_to(american.real, european.real, 1e-10)
+    assert is_close_to(american.imag, european.imag, 1e-10)
+
+
+def test_asset_derivative():
+
+    # The asset price is away from the kinks in the price, where a final
+    # node crosses the strike.
+    h = 1e-6
+    u, d, p, df = _parameters(1, 0.05, 0.02, 0.3, 50)
+    for is_european in (True, False):
+        for is_call in (True, False):
+            *_, derivative = backward_induction_derivative(
+                is_european, is_call, 101, 100, u, d, p, df, 50,
+                0.0, 0.0, 0.0, 0.0, dS=1.0
+            )
+            up, *_ = backward_induction(
+                is_european, is_call, 101 + h, 100, u, d, p, df, 50
+            )
+            down, *_ = backward_induction(
+                is_european, is_call, 101 - h, 100, u, d, p, df, 50
+            )
+            assert is_close_to(derivative, (up - down) / (2 * h), 1e-6)
@@ -1,7 +1,15 @@
 """Tests for Barone-Adesi-Whaley"""
 
+from math import isnan
+
+import pytest
+
 from jetblack_options.trees.leisen_reimer import (
+    all_greeks,
+    greeks,
     price,
+    exercise_boundary,
+    extrapolated_price,
     make_numeric_greeks
 )
 
@@ -110,3 +118,67 @@ def test_rho():
         b = r - q
         numeric = ng[is_european][is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_exercise_boundary():
+
+    # An American put is exercised below the strike, and the boundary rises
+    # towards the strike at expiry.
+    boundary = exercise_boundary(False, 100, 100, 1, 0.08, 0.08, 0.3, 100)
+    assert len(boundary) >= 100
+    exercised = [x for x in boundary if not isnan(x)]
+    assert exercised and all(x < 100 for x in exercised)
+    assert boundary[-1] > exercised[0]
+
+    # An American call on an asset with a cost of carry at least the risk
+    # free rate is never exercised early.
+    boundary = exercise_boundary(True, 100, 100, 1, 0.08, 0.08, 0.3, 100)
+    assert all(isnan(x) for x in boundary)
+
+
+def test_extrapolated_price():
+
+    # The extrapolation of small trees is closer to the price of a large tree
+    # than the price of the larger of the small trees.
+    for is_european, is_call, S, K, r, b, T, v in [
+        (True, True, 100, 100, 0.08, 0.04, 1, 0.3),
+        (True, False, 90, 100, 0.05, 0.0, 0.5, 0.2),
+        (False, False, 100, 100, 0.08, 0.04, 1, 0.3),
+        (False, False, 90, 100, 0.05, 0.0, 0.5, 0.2),
+    ]:
+        expected = price(is_european, is_call, S, K, T, r, b, v, 2001)
+        actual = extrapolated_price(is_european, is_call, S, K, T, r, b, v, 201)
+        unextrapolated = price(is_european, is_call, S, K, T, r, b, v, 201)
+        assert abs(actual.price - expected) < abs(unextrapolated - expected)
+        assert actual.error > 0
+
+    # The smaller tree needs at least one step.
+    for n in (0, 1):
+        with pytest.raises(ValueError):
+            extrapolated_price(True, True, 100, 100, 1, 0.05, 0.02, 0.3, n)
+
+
+def test_all_greeks():
+
+    for is_european in (True, False):
+        for is_call in (True, False):
+            for S, K, T, r, b, v in [
+                (100, 100, 1, 0.05, 0.02, 0.3),
+                (60, 100, 1, 0.08, 0.08, 0.2),
+                (150, 100, 2, 0.05, -0.02, 0.25),
+                (100, 100, 1, 0.1, -0.1, 0.3),
+            ]:
+                actual = all_greeks(is_european, is_call, S, K, T, r, b, v, 101)
+                expected = greeks(is_european, is_call, S, K, T, r, b, v, 101)
+                assert actual[:4] == expected
+
+                # The derivatives of the tree are close to the differences
+                # of trees with small bumps, which do not move a node across
+                # the strike.
+                numeric = ng[is_european][is_call]
+                assert is_close_to(
+                    actual.vega, numeric.vega(S, K, T, r, b, v, dv=1e-5), 1e-5
+                )
+                assert is_close_to(
+                    actual.rho, numeric.rho(S, K, T, r, b, v, dr=1e-5), 1e-5
+                )
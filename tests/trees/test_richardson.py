@@ -0,0 +1,17 @@
+"""Tests for Richardson extrapolation"""
+
+from jetblack_options.trees.richardson import extrapolate
+
+from ..utils import is_close_to
+
+
+def test_extrapolate():
+
+    # The leading error term is removed exactly.
+    actual = extrapolate(lambda n: 1 + 2 / n, 50, 100)
+    assert is_close_to(actual.price, 1, 1e-12)
+    assert is_close_to(actual.error, 0.02, 1e-12)
+
+    actual = extrapolate(lambda n: 1 + 2 / n ** 2, 50, 100, order=2)
+    assert is_close_to(actual.price, 1, 1e-12)
+    assert is_close_to(actual.error, 0.0002, 1e-12)
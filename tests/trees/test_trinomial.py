@@ -1,6 +1,10 @@
 """Tests for Barone-Adesi-Whaley"""
 
+import pytest
+
 from jetblack_options.trees.trinomial import (
+    all_greeks,
+    greeks,
     price,
     make_numeric_greeks
 )
@@ -110,3 +114,56 @@ def test_rho():
         b = r - q
         numeric = ng[is_european][is_call].rho(S, K, T, r, b, v)
         assert is_close_to(numeric, expected, 1e-12)
+
+
+def test_pruned_greeks():
+
+    for is_european in (True, False):
+        for is_call in (True, False):
+            for S, K, T, r, b, v in [
+                (100, 100, 1, 0.05, 0.02, 0.3),
+                (60, 100, 1, 0.08, 0.08, 0.2),
+                (150, 100, 2, 0.05, -0.02, 0.25),
+                (100, 100, 1, 0.1, -0.1, 0.3),
+            ]:
+                expected = greeks(is_european, is_call, S, K, T, r, b, v, 200)
+                actual = greeks(
+                    is_european, is_call, S, K, T, r, b, v, 200,
+                    tolerance=1e-8
+                )
+                for value, expected_value in zip(actual, expected):
+                    assert is_close_to(value, expected_value, 1e-8 * K)
+
+
+def test_pruned_invalid_probabilities():
+
+    # With few steps, a high cost of carry and a low volatility the
+    # probabilities leave [0, 1].
+    with pytest.raises(ValueError):
+        price(False, True, 100, 100, 1, 0.05, 0.9, 0.05, 2, tolerance=1e-6)
+
+
+def test_all_greeks():
+
+    for is_european in (True, False):
+        for is_call in (True, False):
+            for S, K, T, r, b, v in [
+                (100, 100, 1, 0.05, 0.02, 0.3),
+                (60, 100, 1, 0.08, 0.08, 0.2),
+                (150, 100, 2, 0.05, -0.02, 0.25),
+                (100, 100, 1, 0.1, -0.1, 0.3),
+            ]:
+                actual = all_greeks(is_european, is_call, S, K, T, r, b, v, 100)
+                expected = greeks(is_european, is_call, S, K, T, r, b, v, 100)
+                assert actual[:4] == expected
+
+                # The derivatives of the tree are close to the differences
+                # of trees with small bumps, which do not move a node across
+                # the strike.
+                numeric = ng[is_european][is_call]
+                assert is_close_to(
+                    actual.vega, numeric.vega(S, K, T, r, b, v, dv=1e-5), 1e-5
+                )
+                assert is_close_to(
+                    actual.rho, numeric.rho(S, K, T, r, b, v, dr=1e-5), 1e-5
+                )
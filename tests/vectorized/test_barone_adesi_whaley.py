@@ -0,0 +1,109 @@
+"""Tests for the vectorized Barone-Adesi and Whaley approximation"""
+
+from math import isinf
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.american import barone_adesi_whaley as scalar
+from jetblack_options.distributions import FLOAT_MATH
+from jetblack_options.vectorized import barone_adesi_whaley as vector
+
+from ..utils import is_close_to
+
+# Include contracts which are exercised immediately, and with a cost of carry
+# above the risk free rate, where calls are never exercised early.
+CONTRACTS = [
+    (is_call, S, K, T, r, q, v)
+    for is_call in (True, False)
+    for S, K in ((110, 100), (100, 100), (100, 110), (60, 100), (150, 100))
+    for T in (0.1, 0.5, 2.0)
+    for r, q in ((0.1, 0.08), (0.05, 0.0), (0.02, 0.06), (0.08, 0.12))
+    for v in (0.15, 0.4)
+]
+
+is_call, S, K, T, r, q, v = (np.array(x) for x in zip(*CONTRACTS))
+b = r - q
+
+
+def test_price():
+    actual = vector.price(is_call, S, K, T, r, b, v)
+    assert actual.shape == (len(CONTRACTS),)
+    for value, (is_call_, S_, K_, T_, r_, q_, v_) in zip(actual, CONTRACTS):
+        expected = scalar.price(is_call_, S_, K_, T_, r_, r_ - q_, v_)
+        assert is_close_to(value, expected, 1e-10 * max(1, expected))
+
+
+def test_price_broadcasts():
+    spots = np.array([[90.0], [100.0], [110.0]])
+    actual = vector.price([True, False], spots, 100, 0.5, 0.1, 0.02, 0.125)
+    assert actual.shape == (3, 2)
+    expected = scalar.price(False, 110.0, 100, 0.5, 0.1, 0.02, 0.125)
+    assert is_close_to(actual[2, 1], expected, 1e-12)
+
+
+def test_critical_price():
+    actual = vector.critical_price(is_call, K, T, r, b, v)
+    _, Sk = vector.price_and_critical_price(is_call, S, K, T, r, b, v)
+    assert np.array_equal(actual, Sk)
+    for value, (is_call_, _, K_, T_, r_, q_, v_) in zip(actual, CONTRACTS):
+        b_ = r_ - q_
+        if not is_call_:
+            expected = scalar._kp(FLOAT_MATH, K_, T_, r_, b_, v_)
+        elif b_ < r_:
+            expected = scalar._kc(FLOAT_MATH, K_, T_, r_, b_, v_)
+        else:
+            # Calls are never exercised early when b >= r.
+            assert isinf(value)
+            continue
+        assert is_close_to(value, expected, 1e-9)
+
+
+def test_critical_price_max_iterations():
+    # The put solve takes a few hundred iterations for this contract, so a
+    # limit leaves it short of the critical price.
+    expected = vector.critical_price(False, 100, 0.5, 0.02, -0.04, 0.4)
+    actual = vector.critical_price(
+        False, 100, 0.5, 0.02, -0.04, 0.4, max_iterations=10
+    )
+    assert np.isfinite(actual)
+    assert actual > expected + 1
+
+
+def test_numeric_greeks():
+    # The scalar put solve is slow, so a sample of the contracts is used.
+    contracts = CONTRACTS[::5]
+    is_call_, S_, K_, T_, r_, q_, v_ = (np.array(x) for x in zip(*contracts))
+    ng = vector.make_numeric_greeks(is_call_)
+    for greek, threshold in (
+        ('delta', 1e-8),
+        ('gamma', 1e-4),
+        ('theta', 1e-8),
+        ('vega', 1e-8),
+        ('rho', 1e-8),
+    ):
+        actual = getattr(ng, greek)(S_, K_, T_, r_, r_ - q_, v_)
+        for value, (c, s, k, t, i, d, w) in zip(actual, contracts):
+            expected = getattr(scalar.make_numeric_greeks(c), greek)(
+                s, k, t, i, i - d, w
+            )
+            assert is_close_to(value, expected, threshold)
+
+
+def test_ivol():
+    contracts = [
+        (True, 110, 100, 0.5, 0.1, 0.02, 0.125),
+        (True, 100, 100, 0.5, 0.1, 0.02, 0.125),
+        (True, 100, 110, 0.5, 0.1, 0.02, 0.125),
+        (False, 100, 100, 0.5, 0.1, 0.02, 0.125),
+        (True, 100, 100, 1.0, 0.02, 0.05, 0.3),
+        (False, 100, 100, 1.0, 0.05, 0.03, 0.3),
+    ]
+    is_call_, S_, K_, T_, r_, b_, v_ = (np.array(x) for x in zip(*contracts))
+    p = vector.price(is_call_, S_, K_, T_, r_, b_, v_)
+    actual = vector.ivol(is_call_, S_, K_, T_, r_, b_, p)
+    assert actual.converged.all()
+    for value, expected in zip(actual.vol, v_):
+        assert is_close_to(value, expected, 1e-6)
@@ -0,0 +1,104 @@
+"""Tests for the vectorized Bjerksund-Stensland 1993 approximation"""
+
+from math import isnan
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.american import bjerksund_stensland_1993 as scalar
+from jetblack_options.vectorized import bjerksund_stensland_1993 as vector
+
+from ..utils import is_close_to
+
+# Include contracts which are exercised immediately, and with a cost of carry
+# above the risk free rate, which are never exercised early.
+CONTRACTS = [
+    (is_call, S, K, T, r, q, v)
+    for is_call in (True, False)
+    for S, K in ((110, 100), (100, 100), (100, 110), (60, 100), (150, 100))
+    for T in (0.1, 0.5, 2.0)
+    for r, q in ((0.1, 0.08), (0.05, 0.0), (0.02, 0.06), (0.08, 0.12))
+    for v in (0.15, 0.4)
+]
+
+is_call, S, K, T, r, q, v = (np.array(x) for x in zip(*CONTRACTS))
+b = r - q
+
+
+def test_price():
+    actual = vector.price(is_call, S, K, T, r, b, v)
+    assert actual.shape == (len(CONTRACTS),)
+    for value, (is_call_, S_, K_, T_, r_, q_, v_) in zip(actual, CONTRACTS):
+        expected = scalar.price(is_call_, S_, K_, T_, r_, r_ - q_, v_)
+        assert is_close_to(value, expected, 1e-10 * max(1, expected))
+
+
+def test_price_broadcasts():
+    spots = np.array([[90.0], [100.0], [110.0]])
+    actual = vector.price([True, False], spots, 100, 0.5, 0.1, 0.02, 0.125)
+    assert actual.shape == (3, 2)
+    expected = scalar.price(False, 110.0, 100, 0.5, 0.1, 0.02, 0.125)
+    assert is_close_to(actual[2, 1], expected, 1e-12)
+
+
+def test_price_ladder():
+    # A ladder of asset prices against a ladder of strikes.
+    spots = np.array([[90.0], [100.0], [110.0], [120.0]])
+    strikes = np.array([95.0, 100.0, 105.0])
+    for is_call_ in (True, False):
+        actual = vector.price(is_call_, spots, strikes, 0.5, 0.1, 0.02, 0.2)
+        assert actual.shape == (4, 3)
+        for (row, col), value in np.ndenumerate(actual):
+            expected = scalar.price(
+                is_call_, spots[row, 0], strikes[col], 0.5, 0.1, 0.02, 0.2
+            )
+            assert is_close_to(value, expected, 1e-12)
+
+
+def test_spot_greeks():
+    value, delta, gamma = vector.spot_greeks(is_call, S, K, T, r, b, v)
+    assert np.array_equal(value, vector.price(is_call, S, K, T, r, b, v))
+    for actual_delta, actual_gamma, (is_call_, S_, K_, T_, r_, q_, v_) in zip(
+            delta, gamma, CONTRACTS
+    ):
+        ng = scalar.make_numeric_greeks(is_call_)
+        expected = ng.delta(S_, K_, T_, r_, r_ - q_, v_)
+        assert is_close_to(actual_delta, expected, 1e-9)
+        expected = ng.gamma(S_, K_, T_, r_, r_ - q_, v_)
+        assert is_close_to(actual_gamma, expected, 1e-6)
+
+
+def test_numeric_greeks():
+    ng = vector.make_numeric_greeks(is_call)
+    for greek, threshold in (
+        ('delta', 1e-9),
+        ('gamma', 1e-6),
+        ('theta', 1e-9),
+        ('vega', 1e-9),
+        ('rho', 1e-9),
+    ):
+        actual = getattr(ng, greek)(S, K, T, r, b, v)
+        for value, (is_call_, S_, K_, T_, r_, q_, v_) in zip(actual, CONTRACTS):
+            expected = getattr(scalar.make_numeric_greeks(is_call_), greek)(
+                S_, K_, T_, r_, r_ - q_, v_
+            )
+            assert is_close_to(value, expected, threshold)
+
+
+def test_ivol():
+    contracts = [
+        (True, 110, 100, 0.5, 0.1, 0.02, 0.125),
+        (True, 100, 100, 0.5, 0.1, 0.02, 0.125),
+        (True, 100, 110, 0.5, 0.1, 0.02, 0.125),
+        (False, 100, 100, 0.5, 0.1, 0.02, 0.125),
+        (True, 100, 100, 1.0, 0.02, 0.05, 0.3),
+        (False, 100, 100, 1.0, 0.05, 0.03, 0.3),
+    ]
+    is_call_, S_, K_, T_, r_, b_, v_ = (np.array(x) for x in zip(*contracts))
+    p = vector.price(is_call_, S_, K_, T_, r_, b_, v_)
+    actual = vector.ivol(is_call_, S_, K_, T_, r_, b_, p)
+    assert actual.converged.all()
+    for value, expected in zip(actual.vol, v_):
+        assert is_close_to(value, expected, 1e-6)
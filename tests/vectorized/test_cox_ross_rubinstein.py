@@ -0,0 +1,45 @@
+"""Tests for the vectorized Cox-Ross-Rubinstein binomial tree"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.trees import cox_ross_rubinstein as scalar
+from jetblack_options.vectorized import cox_ross_rubinstein as vector
+
+from ..utils import is_close_to
+
+CONTRACTS = [
+    (is_european, is_call, S, K, T, r, b, v)
+    for is_european in (True, False)
+    for is_call in (True, False)
+    for S, K in ((110, 100), (100, 100), (90, 100))
+    for T in (1 / 12, 0.5, 2.0)
+    for r, b in ((0.1, 0.02), (0.05, 0.08))
+    for v in (0.125, 0.4)
+]
+
+
+def test_greeks():
+    n = 50
+    args = (np.array(x) for x in zip(*CONTRACTS))
+    actual = vector.greeks(*args, n)
+
+    for i, contract in enumerate(CONTRACTS):
+        expected = scalar.greeks(*contract, n)
+        for value, expected_value in zip(actual, expected):
+            assert is_close_to(
+                value[i],
+                expected_value,
+                1e-10 * max(1, abs(expected_value))
+            )
+
+
+def test_price_broadcasts():
+    strikes = np.array([[90.0, 100.0], [110.0, 120.0]])
+    actual = vector.price(False, False, 100.0, strikes, 0.5, 0.1, 0.1, 0.25, 100)
+    assert actual.shape == strikes.shape
+    for value, strike in zip(actual.ravel(), strikes.ravel()):
+        expected = scalar.price(False, False, 100.0, strike, 0.5, 0.1, 0.1, 0.25, 100)
+        assert is_close_to(value, expected, 1e-10)
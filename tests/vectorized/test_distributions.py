@@ -0,0 +1,45 @@
+"""Tests for the vectorized distributions"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.distributions import CBND, CND, ND
+from jetblack_options.vectorized.distributions import cbnd, cdf, pdf
+
+from ..utils import is_close_to
+
+
+def test_cdf_pdf():
+    x = np.linspace(-10, 10, 201)
+    for actual_cdf, actual_pdf, value in zip(cdf(x), pdf(x), x):
+        assert is_close_to(actual_cdf, CND(value), 1e-15)
+        assert is_close_to(actual_pdf, ND(value), 1e-15)
+
+
+def test_cbnd():
+    # Cover every correlation regime, including the boundaries between them
+    # and perfect correlation.
+    values = [-3.0, -1.0, -0.2, 0.0, 0.5, 2.0]
+    correlations = [
+        -1.0, -0.95, -0.925, -0.8, -0.75, -0.5, -0.3, -0.1, 0.0,
+        0.1, 0.3, 0.5, 0.75, 0.8, 0.925, 0.95, 1.0
+    ]
+    grid = [
+        (x, y, rho)
+        for x in values
+        for y in values
+        for rho in correlations
+    ]
+    x, y, rho = (np.array(column) for column in zip(*grid))
+
+    actual = cbnd(x, y, rho)
+    for value, (x_, y_, rho_) in zip(actual, grid):
+        assert is_close_to(value, CBND(x_, y_, rho_), 1e-14)
+
+
+def test_cbnd_broadcast():
+    actual = cbnd(np.array([[-1.0], [0.0], [1.0]]), 0.5, [0.2, 0.6, 0.9, 0.99])
+    assert actual.shape == (3, 4)
+    assert is_close_to(actual[1, 2], CBND(0.0, 0.5, 0.9), 1e-14)
@@ -0,0 +1,44 @@
+"""Tests for the vectorized European binomial trees"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.trees import european_binomial as scalar
+from jetblack_options.vectorized import european_binomial as vector
+
+from ..utils import is_close_to
+
+
+def test_binomial_weights():
+    for n, p in [(1, 0.5), (10, 0.3), (101, 0.52), (2000, 0.49)]:
+        actual = vector.binomial_weights(n, p)
+        expected = scalar.binomial_weights(n, p)
+        assert actual.shape == (n + 1,)
+        for a, e in zip(actual, expected):
+            assert is_close_to(a, e, 1e-15)
+
+    with pytest.raises(ValueError):
+        vector.binomial_weights(10, 0.0)
+
+
+def test_strike_ladder():
+    strikes = np.linspace(50, 150, 21)
+    for n in (200, 1001):
+        actual = vector.strike_ladder(
+            [[True], [False]], 100, strikes, 0.5, 0.1, 0.02, 0.2, n
+        )
+        assert actual.shape == (2, len(strikes))
+        for i, is_call in enumerate((True, False)):
+            for value, K in zip(actual[i], strikes):
+                expected = scalar.price(is_call, 100, K, 0.5, 0.1, 0.02, 0.2, n)
+                assert is_close_to(value, expected, 1e-12)
+
+
+def test_large_trees():
+    actual = vector.strike_ladder(
+        True, 100, [100, 110], 0.5, 0.1, 0.02, 0.125, 10000
+    )
+    expected = scalar.price(True, 100, 110, 0.5, 0.1, 0.02, 0.125, 10000)
+    assert is_close_to(actual[1], expected, 1e-12)
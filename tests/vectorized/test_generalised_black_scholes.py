@@ -0,0 +1,128 @@
+"""Tests for the vectorized generalised Black-Scholes"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.european import generalised_black_scholes as scalar
+from jetblack_options.vectorized import generalised_black_scholes as vector
+
+from ..utils import is_close_to
+
+CONTRACTS = [
+    (is_call, S, K, T, r, q, v)
+    for is_call in (True, False)
+    for S, K in ((110, 100), (100, 100), (100, 110), (90, 100), (115, 100))
+    for T in (1 / 12, 6 / 12, 2.0)
+    for r, q in ((0.1, 0.08), (0.05, 0.0), (0.02, 0.06))
+    for v in (0.125, 0.4)
+]
+
+is_call, S, K, T, r, q, v = (np.array(x) for x in zip(*CONTRACTS))
+b = r - q
+
+
+def _assert_matches(actual, scalar_fn, *arg_names):
+    args = {
+        'is_call': is_call, 'S': S, 'K': K, 'T': T, 'r': r, 'b': b, 'v': v
+    }
+    assert len(actual) == len(CONTRACTS)
+    for i, value in enumerate(actual):
+        expected = scalar_fn(*(args[name][i].item() for name in arg_names))
+        assert is_close_to(value, expected, 1e-10 * max(1, abs(expected)))
+
+
+def test_price():
+    _assert_matches(
+        vector.price(is_call, S, K, T, r, b, v),
+        scalar.price,
+        'is_call', 'S', 'K', 'T', 'r', 'b', 'v'
+    )
+
+
+def test_price_broadcasts():
+    strikes = np.array([90.0, 100.0, 110.0])
+    actual = vector.price(True, 100.0, strikes, 0.5, 0.1, 0.02, 0.125)
+    assert actual.shape == strikes.shape
+    for value, strike in zip(actual, strikes):
+        expected = scalar.price(True, 100.0, strike, 0.5, 0.1, 0.02, 0.125)
+        assert is_close_to(value, expected, 1e-12)
+
+
+def test_greeks_with_is_call():
+    for vector_fn, scalar_fn in [
+        (vector.delta, scalar.delta),
+        (vector.theta, scalar.theta),
+        (vector.rho, scalar.rho),
+        (vector.carry, scalar.carry),
+        (vector.elasticity, scalar.elasticity),
+        (vector.forward_delta, scalar.forward_delta),
+        (vector.charm, scalar.charm),
+        (vector.vega_leverage, scalar.vega_leverage),
+        (vector.phi, scalar.phi),
+        (vector.break_even_probability, scalar.break_even_probability),
+        (vector.strike_delta, scalar.strike_delta),
+    ]:
+        _assert_matches(
+            vector_fn(is_call, S, K, T, r, b, v),
+            scalar_fn,
+            'is_call', 'S', 'K', 'T', 'r', 'b', 'v'
+        )
+
+
+def test_greeks_without_is_call():
+    for vector_fn, scalar_fn in [
+        (vector.gamma, scalar.gamma),
+        (vector.vega, scalar.vega),
+        (vector.gammap, scalar.gammap),
+        (vector.vegap, scalar.vegap),
+        (vector.vanna, scalar.vanna),
+        (vector.ddelta_dvol_dvol, scalar.ddelta_dvol_dvol),
+        (vector.dgamma_dspot, scalar.dgamma_dspot),
+        (vector.dgamma_dvol, scalar.dgamma_dvol),
+        (vector.dgamma_dtime, scalar.dgamma_dtime),
+        (vector.dgammap_dspot, scalar.dgammap_dspot),
+        (vector.dgammap_dvol, scalar.dgammap_dvol),
+        (vector.dgammap_dtime, scalar.dgammap_dtime),
+        (vector.dvega_dtime, scalar.dvega_dtime),
+        (vector.vomma, scalar.vomma),
+        (vector.dvomma_dvol, scalar.dvomma_dvol),
+        (vector.dvegap_dvol, scalar.dvegap_dvol),
+        (vector.variance_vega, scalar.variance_vega),
+        (vector.variance_delta, scalar.variance_delta),
+        (vector.variance_vomma, scalar.variance_vomma),
+        (vector.variance_ultima, scalar.variance_ultima),
+        (vector.theta_driftless, scalar.theta_driftless),
+        (vector.risk_neutral_density, scalar.risk_neutral_density),
+    ]:
+        _assert_matches(
+            vector_fn(S, K, T, r, b, v),
+            scalar_fn,
+            'S', 'K', 'T', 'r', 'b', 'v'
+        )
+
+
+def test_saddle_gamma():
+    for K_, r_, b_, v_ in [(100, 0.1, 0.08, 0.125), (110, 0.05, 0.05, 0.4)]:
+        actual = vector.saddle_gamma(K_, r_, b_, v_)
+        expected = scalar.saddle_gamma(K_, r_, b_, v_)
+        assert is_close_to(actual, expected, 1e-12)
+
+
+def test_other_signatures():
+    _assert_matches(
+        vector.futures_rho(is_call, S, K, T, r, v),
+        scalar.futures_rho,
+        'is_call', 'S', 'K', 'T', 'r', 'v'
+    )
+    for vector_fn, scalar_fn in [
+        (vector.dzeta_dvol, scalar.dzeta_dvol),
+        (vector.dzeta_dtime, scalar.dzeta_dtime),
+        (vector.in_the_money_probability, scalar.in_the_money_probability),
+    ]:
+        _assert_matches(
+            vector_fn(is_call, S, K, T, b, v),
+            scalar_fn,
+            'is_call', 'S', 'K', 'T', 'b', 'v'
+        )
@@ -0,0 +1,88 @@
+"""Tests for the batched implied volatility solver"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.european import generalised_black_scholes as scalar
+from jetblack_options.vectorized import generalised_black_scholes as vector
+from jetblack_options.vectorized.implied_volatility import solve_ivol
+
+from ..utils import is_close_to
+
+CONTRACTS = [
+    (True, 110, 100, 0.1, 0.08, 6/12, 0.125),
+    (False, 110, 100, 0.1, 0.08, 6/12, 0.125),
+    (True, 100, 100, 0.1, 0.08, 6/12, 0.125),
+    (False, 100, 100, 0.1, 0.08, 6/12, 0.125),
+    (True, 100, 110, 0.1, 0.08, 6/12, 0.125),
+    (False, 100, 110, 0.1, 0.08, 6/12, 0.125),
+    (True, 100, 90, 0.05, 0.0, 1.0, 0.35),
+    (False, 100, 120, 0.05, 0.0, 2.0, 0.6),
+]
+
+
+def test_ivol():
+    is_call, S, K, r, q, T, v = (np.array(x) for x in zip(*CONTRACTS))
+    b = r - q
+    p = vector.price(is_call, S, K, T, r, b, v)
+
+    result = vector.ivol(is_call, S, K, T, r, b, p)
+
+    assert result.vol.shape == p.shape
+    for i, contract in enumerate(CONTRACTS):
+        is_call_, S_, K_, r_, q_, T_, _v = contract
+        expected = scalar.ivol(is_call_, S_, K_, T_, r_, r_ - q_, p[i])
+        assert is_close_to(result.vol[i], expected, 1e-9)
+        if result.converged[i]:
+            assert is_close_to(
+                vector.price(is_call_, S_, K_, T_, r_, r_ - q_, result.vol[i]),
+                p[i],
+                1e-8
+            )
+
+
+def test_only_active_rows_are_priced():
+    is_call, S, K, r, q, T, v = (np.array(x) for x in zip(*CONTRACTS))
+    b = r - q
+    p = vector.price(is_call, S, K, T, r, b, v)
+
+    def price(v, i):
+        priced.append(i.copy())
+        return vector.price(is_call[i], S[i], K[i], T[i], r[i], b[i], v)
+
+    priced = []
+    result = solve_ivol(p, price)
+
+    # Each row is priced once for each end point, once for the initial guess,
+    # and once for each iteration it takes part in.
+    counts = np.bincount(np.concatenate(priced), minlength=len(p))
+    assert np.array_equal(counts, result.iterations + 3)
+    assert len(set(result.iterations)) > 1
+
+
+def test_not_converged():
+    is_call, S, K, r, q, T, v = (np.array(x) for x in zip(*CONTRACTS))
+    b = r - q
+    p = vector.price(is_call, S, K, T, r, b, v)
+
+    result = vector.ivol(is_call, S, K, T, r, b, p, max_iterations=0)
+
+    assert np.all(result.iterations == 0)
+    assert not np.all(result.converged)
+
+
+def test_scalar():
+    is_call, S, K, r, q, T, v = CONTRACTS[0]
+    p = scalar.price(is_call, S, K, T, r, r - q, v)
+
+    def price(v, i):
+        return vector.price(is_call, S, K, T, r, r - q, v)
+
+    result = solve_ivol(p, price)
+
+    assert result.vol.shape == ()
+    assert result.converged
+    expected = scalar.ivol(is_call, S, K, T, r, r - q, p)
+    assert is_close_to(result.vol, expected, 1e-9)
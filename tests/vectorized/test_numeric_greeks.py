@@ -0,0 +1,92 @@
+"""Tests for the vectorized numeric greeks"""
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+# pylint: disable=wrong-import-position
+from jetblack_options.european.generalised_black_scholes import all_greeks
+from jetblack_options.greeks import Greeks
+from jetblack_options.numeric_greeks.with_carry import NumericGreeks
+from jetblack_options.vectorized import generalised_black_scholes as gbs
+from jetblack_options.vectorized.numeric_greeks import (
+    STENCILS,
+    ArrayGreeks,
+    StencilGreeks,
+    stencil_offsets,
+)
+
+from ..utils import is_close_to
+
+is_call = np.array([True, False, True, False])
+S = np.array([90.0, 100.0, 110.0, 120.0])
+K, T, r, b, v = 100.0, 0.5, 0.08, 0.02, 0.3
+
+
+class CountingArrayPrice:
+    """An array price of fixed option types which counts the calls, and the
+    options priced."""
+
+    def __init__(self, price, is_call) -> None:
+        self.price = price
+        self.is_call = is_call
+        self.calls = 0
+        self.options = 0
+
+    def __call__(self, S, K, T, r, b, v):
+        self.calls += 1
+        value = self.price(self.is_call, S, K, T, r, b, v)
+        self.options += value.size
+        return value
+
+
+def test_greeks():
+    ng = NumericGreeks(lambda *args: gbs.price(is_call, *args))
+    sg = StencilGreeks(ng.price)
+    actual = sg.greeks(list(STENCILS), S, K, T, r, b, v)
+    for name, value in actual.items():
+        if name == 'price':
+            expected = ng.price(S, K, T, r, b, v)
+        else:
+            expected = getattr(ng, name)(S, K, T, r, b, v)
+        assert value.shape == S.shape
+        for a, e in zip(value, expected):
+            assert is_close_to(a, e, 1e-9)
+
+
+def test_all_greeks():
+    price = CountingArrayPrice(gbs.price, is_call)
+    actual = StencilGreeks(price).all_greeks(S, K, T, r, b, v)
+    assert isinstance(actual, ArrayGreeks)
+    assert ArrayGreeks._fields == Greeks._fields
+    # Every bump is priced in one call, and shared bumps are priced once.
+    assert price.calls == 1
+    assert price.options == len(stencil_offsets(ArrayGreeks._fields)) * len(S)
+    assert len(stencil_offsets(ArrayGreeks._fields)) == 17
+
+    for i, (is_call_, S_) in enumerate(zip(is_call, S)):
+        expected = all_greeks(is_call_, S_, K, T, r, b, v)
+        for name in ArrayGreeks._fields:
+            e = getattr(expected, name)
+            assert is_close_to(getattr(actual, name)[i], e, 1e-3 * max(1, abs(e)))
+
+
+def test_batch_size():
+    price = CountingArrayPrice(gbs.price, is_call)
+    sg = StencilGreeks(price, batch_size=3 * len(S))
+    actual = sg.greeks(['delta', 'gamma'], S, K, T, r, b, v)
+    # The three distinct bumps fit in one batch.
+    assert price.calls == 1
+
+    sg = StencilGreeks(price, batch_size=len(S))
+    expected = sg.greeks(['delta', 'gamma'], S, K, T, r, b, v)
+    assert price.calls == 4
+    for name in ('delta', 'gamma'):
+        assert np.array_equal(actual[name], expected[name])
+
+
+def test_unsupported():
+    with pytest.raises(ValueError):
+        StencilGreeks(CountingArrayPrice(gbs.price, is_call)).greeks(
+            ['zeta'], S, K, T, r, b, v
+        )